@@ -1,9 +1,14 @@
+import itertools
+import time
+import tracemalloc
+
 # -------------------------
 # CLASES DE LA LISTA DOBLE
 # -------------------------
 
 class Nodo:
     """Representa un nodo en la lista doblemente ligada."""
+    __slots__ = ("dato", "prev", "next")  # Sin __dict__ por nodo: menos memoria en listas grandes
     def __init__(self, dato):
         self.dato = dato
         self.prev = None  # Puntero al nodo anterior
@@ -14,6 +19,7 @@ class ListaDoble:
     def __init__(self):
         self.head = None  # Puntero a la cabeza (inicio de la lista)
         self.tail = None  # Puntero a la cola (final de la lista)
+        self.version = 0  # Cambia con cada inserción; los iteradores la vigilan
 
     # Inserción al inicio (push_front)
     # Complejidad: O(1)
@@ -28,6 +34,7 @@ class ListaDoble:
             self.tail = n
             
         self.head = n 
+        self.version += 1
 
     # Inserción al final (push_back)
     # Complejidad: O(1)
@@ -42,24 +49,102 @@ class ListaDoble:
             self.head = n
             
         self.tail = n 
+        self.version += 1
+
+    # Construcción en lote (from_iterable, extend, extendleft)
+    # Complejidad: O(k) para armar la cadena y O(1) para pegarla
+    @classmethod
+    def from_iterable(cls, iterable):
+        ld = cls()
+        ld.extend(iterable)
+        return ld
+
+    @staticmethod
+    def _cadena(iterable, reverso=False):
+        """
+        Arma aparte una cadena de nodos en un ciclo local, sin pasar por
+        push_back. Con reverso=True cada dato queda antes del anterior.
+        Retorna (primero, ultimo).
+        """
+        primero = ultimo = None
+        for x in iterable:
+            n = Nodo(x)
+            if primero is None:
+                primero = ultimo = n
+            elif reverso:
+                n.next = primero
+                primero.prev = n
+                primero = n
+            else:
+                ultimo.next = n
+                n.prev = ultimo
+                ultimo = n
+        return primero, ultimo
+
+    def extend(self, iterable):
+        """Agrega los datos al final con un solo empalme."""
+        primero, ultimo = self._cadena(iterable)
+        if primero is None:
+            return
+        if self.tail:
+            self.tail.next = primero
+            primero.prev = self.tail
+        else:
+            self.head = primero
+        self.tail = ultimo
+        self.version += 1
+
+    def extendleft(self, iterable):
+        """Agrega los datos al inicio con un solo empalme (como deque.extendleft, en orden invertido)."""
+        primero, ultimo = self._cadena(iterable, reverso=True)
+        if primero is None:
+            return
+        if self.head:
+            self.head.prev = ultimo
+            ultimo.next = self.head
+        else:
+            self.tail = ultimo
+        self.head = primero
+        self.version += 1
+
+    # Recorrido perezoso desde un nodo (generador)
+    # Complejidad: O(1) por elemento y O(1) de memoria extra
+    def iter_desde(self, nodo, reverso=False, hasta=None):
+        """
+        Genera los datos desde 'nodo' hacia el final (o hacia el inicio con
+        reverso=True), deteniéndose después del nodo 'hasta' si se da.
+        Si la lista cambia mientras se recorre, lanza RuntimeError en lugar
+        de seguir punteros que ya no son válidos.
+        """
+        # La versión se toma al crear el iterador, no en el primer next()
+        return self._recorrer(nodo, reverso, hasta, self.version)
+
+    def _recorrer(self, nodo, reverso, hasta, version):
+        if self.version != version:
+            raise RuntimeError("La lista cambió durante el recorrido.")
+        while nodo:
+            yield nodo.dato
+            if self.version != version:
+                raise RuntimeError("La lista cambió durante el recorrido.")
+            if nodo is hasta:
+                return
+            nodo = nodo.prev if reverso else nodo.next
+
+    def __iter__(self):
+        return self.iter_desde(self.head)
+
+    def __reversed__(self):
+        return self.iter_desde(self.tail, reverso=True)
 
     # Recorrido hacia adelante (forward)
     # Complejidad: O(n)
     def forward(self):
-        cur, out = self.head, []
-        while cur: 
-            out.append(cur.dato)
-            cur = cur.next
-        return out
+        return list(self)
 
     # Recorrido hacia atrás (backward)
     # Complejidad: O(n)
     def backward(self):
-        cur, out = self.tail, []
-        while cur: 
-            out.append(cur.dato)
-            cur = cur.prev
-        return out
+        return list(reversed(self))
 
 # -------------------------
 # EJECUCIÓN DEL EJERCICIO 1
@@ -87,4 +172,63 @@ print("\n--- Resultados de Recorrido ---")
 print(f"Recorrido hacia adelante (forward): {ld.forward()}")
 
 # Recorrido hacia atrás (desde la cola)
-print(f"Recorrido hacia atrás (backward): {ld.backward()}")
\ No newline at end of file
+print(f"Recorrido hacia atrás (backward): {ld.backward()}")
+
+# -------------------------
+# RECORRIDOS PEREZOSOS
+# -------------------------
+
+print("\n--- Iteradores ---")
+print(f"Primeros 2 (islice): {list(itertools.islice(ld, 2))}")             # [5, 10]
+print(f"Desde el segundo nodo: {list(ld.iter_desde(ld.head.next))}")       # [10, 20, 30]
+print(f"Del tail al segundo: {list(ld.iter_desde(ld.tail, reverso=True, hasta=ld.head.next))}") # [30, 20, 10]
+
+# Modificar la lista mientras se recorre falla de inmediato (antes habría
+# seguido para siempre, porque cada push_back agrega un nodo más adelante)
+try:
+    for dato in ld:
+        ld.push_back(dato)
+except RuntimeError as e:
+    print(f"Modificación durante el recorrido: {e}")
+
+# La versión se toma al crear el iterador: cambiar la lista antes del primer
+# next() también se detecta
+it = iter(ld)
+ld.push_front(0)
+try:
+    next(it)
+except RuntimeError as e:
+    print(f"Modificación antes del primer next(): {e}")
+
+# Memoria para ver solo los primeros 3 datos de una lista de 100,000 nodos
+grande = ListaDoble()
+for i in range(100_000):
+    grande.push_back(i)
+for nombre, primeros in (("forward()[:3]", lambda: grande.forward()[:3]),
+                         ("islice(ld, 3)", lambda: list(itertools.islice(grande, 3)))):
+    tracemalloc.start()
+    primeros()
+    pico = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"Pico de memoria con {nombre}: {pico:>9,} bytes")
+
+# -------------------------
+# CONSTRUCCIÓN EN LOTE
+# -------------------------
+
+print("\n--- Construcción en lote ---")
+lote = ListaDoble.from_iterable([10, 20])
+lote.extend([30, 40])
+lote.extendleft([5, 1])
+print(f"from_iterable + extend + extendleft: {lote.forward()}")  # [1, 5, 10, 20, 30, 40]
+
+for n in (100_000, 1_000_000):
+    inicio = time.perf_counter()
+    uno_a_uno = ListaDoble()
+    for i in range(n):
+        uno_a_uno.push_back(i)
+    t_push = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    en_lote = ListaDoble.from_iterable(range(n))
+    t_lote = time.perf_counter() - inicio
+    print(f"n={n:>9,}: push_back {t_push * 1000:7.1f} ms | from_iterable {t_lote * 1000:7.1f} ms")
\ No newline at end of file
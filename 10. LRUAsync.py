@@ -0,0 +1,160 @@
+import asyncio
+
+# Reutilizamos las clases NodoKV y LRU del Ejercicio 6 (sin los print del
+# camino caliente). AsyncLRU se construye encima de LRU sin modificarla.
+
+# -------------------------
+# CLASE DE NODO (Key-Value)
+# -------------------------
+
+class NodoKV:
+    """Nodo especializado para la LRU, guarda llave (k) y valor (v)."""
+    __slots__ = ("k", "v", "prev", "next")
+    def __init__(self, k, v):
+        self.k, self.v = k, v
+        self.prev = None
+        self.next = None
+
+# -------------------------
+# CLASE LRU CACHE (asumida del Ejercicio 6)
+# -------------------------
+
+class LRU:
+    """Implementación de LRU Cache usando un diccionario y una lista doble."""
+    def __init__(self, cap: int):
+        self.cap = cap
+        self.map = {}
+        self.head = NodoKV(0, 0)
+        self.tail = NodoKV(0, 0)
+        self.head.next = self.tail
+        self.tail.prev = self.head
+
+    def _add_front(self, n: NodoKV):
+        n.prev = self.head
+        n.next = self.head.next
+        self.head.next.prev = n
+        self.head.next = n
+
+    def _remove(self, n: NodoKV):
+        n.prev.next = n.next
+        n.next.prev = n.prev
+        n.prev = n.next = None
+
+    def _move_to_front(self, n: NodoKV):
+        self._remove(n)
+        self._add_front(n)
+
+    def _evict_lru(self):
+        lru_node = self.tail.prev
+        if lru_node is self.head: return
+        self._remove(lru_node)
+        del self.map[lru_node.k]
+
+    def get(self, k, default=-1):
+        """Obtiene el valor de la clave; 'default' permite distinguir un fallo de un valor -1."""
+        n = self.map.get(k)
+        if n is None: return default
+        self._move_to_front(n)
+        return n.v
+
+    def put(self, k, v):
+        if k in self.map:
+            n = self.map[k]
+            n.v = v
+            self._move_to_front(n)
+        else:
+            n = NodoKV(k, v)
+            self.map[k] = n
+            self._add_front(n)
+            if len(self.map) > self.cap:
+                self._evict_lru()
+
+# -------------------------
+# CLASE ASYNC LRU (single-flight)
+# -------------------------
+
+_FALLO = object()  # Centinela: distingue "no está en cache" de cualquier valor
+
+class AsyncLRU:
+    """
+    LRU para asyncio con carga "single-flight": si varias corrutinas fallan
+    en la misma llave al mismo tiempo, solo una ejecuta el loader y las demás
+    esperan ese mismo resultado en vuelo.
+    """
+    def __init__(self, cap: int):
+        self.lru = LRU(cap)
+        self._en_vuelo = {}  # Diccionario: key -> Task de la carga en curso
+
+    async def _cargar(self, k, loader):
+        """Ejecuta el loader y guarda el resultado por el camino normal de put."""
+        try:
+            v = await loader(k)
+            self.lru.put(k, v)
+            return v
+        finally:
+            # Si el loader falla no se guarda nada y la siguiente llamada reintenta
+            del self._en_vuelo[k]
+
+    async def get_or_load(self, k, loader):
+        """
+        Devuelve el valor de k. En un fallo, 'loader(k)' (corrutina) se ejecuta
+        una sola vez por llave aunque haya muchas corrutinas esperando.
+        """
+        v = self.lru.get(k, _FALLO)
+        if v is not _FALLO:
+            return v
+
+        tarea = self._en_vuelo.get(k)
+        if tarea is None:
+            tarea = asyncio.ensure_future(self._cargar(k, loader))
+            self._en_vuelo[k] = tarea
+        # shield: cancelar a un solo llamador no cancela la carga compartida
+        return await asyncio.shield(tarea)
+
+    def get(self, k):
+        return self.lru.get(k)
+
+    def put(self, k, v):
+        self.lru.put(k, v)
+
+# -------------------------
+# DEMOSTRACIÓN Y PRUEBA
+# -------------------------
+
+async def main():
+    cache = AsyncLRU(2)
+    llamadas = {"n": 0}
+
+    async def loader(k):
+        llamadas["n"] += 1
+        await asyncio.sleep(0.05)  # Simula una consulta lenta al backend
+        return k * 10
+
+    # --------------------------------------------------
+    # PRUEBA 1: 1000 fallos concurrentes en la misma llave
+    # Esperado: el loader se ejecuta exactamente una vez
+    # --------------------------------------------------
+    resultados = await asyncio.gather(*(cache.get_or_load(7, loader) for _ in range(1000)))
+    assert llamadas["n"] == 1, llamadas["n"]
+    assert all(r == 70 for r in resultados)
+    print(f"PRUEBA 1: 1000 fallos concurrentes -> loader ejecutado {llamadas['n']} vez.")
+
+    # --------------------------------------------------
+    # PRUEBA 2: el valor quedó en la LRU, un hit no llama al loader
+    # --------------------------------------------------
+    print(f"PRUEBA 2: get(7) = {cache.get(7)} | llamadas al loader: {llamadas['n']}")
+
+    # --------------------------------------------------
+    # PRUEBA 3: si el loader falla, todos reciben el error y no se guarda nada
+    # --------------------------------------------------
+    async def loader_roto(k):
+        await asyncio.sleep(0.01)
+        raise RuntimeError("backend caído")
+
+    errores = await asyncio.gather(*(cache.get_or_load(9, loader_roto) for _ in range(10)),
+                                   return_exceptions=True)
+    print(f"PRUEBA 3: errores recibidos: {sum(isinstance(e, RuntimeError) for e in errores)} "
+          f"| get(9) = {cache.get(9)}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,242 @@
+import random
+import tracemalloc
+from array import array
+
+# Motor alternativo de LRU sin objetos NodoKV: llaves y valores viven en
+# arreglos preasignados (slots) y los enlaces prev/next son índices enteros
+# en buffers array('i'). Los slots liberados se reutilizan con una free list.
+
+# -------------------------
+# CLASES DEL EJERCICIO 6 (para comparar)
+# -------------------------
+
+class NodoKV:
+    """Nodo especializado para la LRU, guarda llave (k) y valor (v)."""
+    __slots__ = ("k", "v", "prev", "next")
+    def __init__(self, k, v):
+        self.k, self.v = k, v
+        self.prev = None
+        self.next = None
+
+class NodoKVDict:
+    """NodoKV como era antes de __slots__: cada instancia arrastra su propio __dict__."""
+    def __init__(self, k, v):
+        self.k, self.v = k, v
+        self.prev = None
+        self.next = None
+
+class LRU:
+    """Implementación de LRU Cache usando un diccionario y una lista doble (asumida del Ejercicio 6)."""
+    Nodo = NodoKV  # Clase de nodo; el reporte de memoria la cambia para medir ambas líneas base
+
+    def __init__(self, cap: int):
+        self.cap = cap
+        self.map = {}
+        self.head = self.Nodo(0, 0)
+        self.tail = self.Nodo(0, 0)
+        self.head.next = self.tail
+        self.tail.prev = self.head
+
+    def _add_front(self, n: NodoKV):
+        n.prev = self.head
+        n.next = self.head.next
+        self.head.next.prev = n
+        self.head.next = n
+
+    def _remove(self, n: NodoKV):
+        n.prev.next = n.next
+        n.next.prev = n.prev
+        n.prev = n.next = None
+
+    def _move_to_front(self, n: NodoKV):
+        self._remove(n)
+        self._add_front(n)
+
+    def _evict_lru(self):
+        lru_node = self.tail.prev
+        if lru_node is self.head: return
+        self._remove(lru_node)
+        del self.map[lru_node.k]
+
+    def get(self, k: int) -> int:
+        if k not in self.map: return -1
+        n = self.map[k]
+        self._move_to_front(n)
+        return n.v
+
+    def put(self, k: int, v: int):
+        if k in self.map:
+            n = self.map[k]
+            n.v = v
+            self._move_to_front(n)
+        else:
+            n = self.Nodo(k, v)
+            self.map[k] = n
+            self._add_front(n)
+            if len(self.map) > self.cap:
+                self._evict_lru()
+
+# -------------------------
+# CLASE LRU CON ARREGLOS
+# -------------------------
+
+CENTINELA = 0  # El slot 0 hace de head y tail a la vez (lista circular)
+SIN_SLOT = -1  # Fin de la free list
+
+class LRUArreglos:
+    """
+    LRU Cache con slots en arreglos en lugar de nodos.
+
+    - keys / vals: listas preasignadas de tamaño cap + 1.
+    - prev / next: índices de slot en array('i') (4 bytes por enlace).
+    - map: key -> índice de slot.
+    next[CENTINELA] es el MRU y prev[CENTINELA] el LRU.
+    """
+    def __init__(self, cap: int):
+        self.cap = cap
+        self.map = {}
+        n = cap + 1
+        self.keys = [None] * n
+        self.vals = [None] * n
+        self.prev = array('i', [CENTINELA]) * n
+        # Al inicio todos los slots están libres, encadenados por next: 1 -> 2 -> ... -> cap
+        self.next = array('i', range(1, n + 1))
+        self.next[cap] = SIN_SLOT
+        self.next[CENTINELA] = CENTINELA
+        self.libre = 1 if cap > 0 else SIN_SLOT
+
+    # --- HELPERS (Operaciones con índices en O(1)) ---
+
+    def _add_front(self, i: int):
+        """Enlaza el slot i justo después del centinela (MRU)."""
+        nxt = self.next
+        primero = nxt[CENTINELA]
+        self.prev[i] = CENTINELA
+        nxt[i] = primero
+        self.prev[primero] = i
+        nxt[CENTINELA] = i
+
+    def _remove(self, i: int):
+        """Desenlaza el slot i de la lista."""
+        p, s = self.prev[i], self.next[i]
+        self.next[p] = s
+        self.prev[s] = p
+
+    def _move_to_front(self, i: int):
+        if self.next[CENTINELA] == i: return  # Ya es el MRU
+        self._remove(i)
+        self._add_front(i)
+
+    def _evict_lru(self):
+        """Expulsa el slot LRU y lo devuelve a la free list."""
+        i = self.prev[CENTINELA]
+        if i == CENTINELA: return
+        self._remove(i)
+        del self.map[self.keys[i]]
+        self.keys[i] = self.vals[i] = None
+        self.next[i] = self.libre
+        self.libre = i
+
+    # --- API (misma semántica que LRU) ---
+
+    def get(self, k: int) -> int:
+        i = self.map.get(k)
+        if i is None: return -1
+        self._move_to_front(i)
+        return self.vals[i]
+
+    def put(self, k: int, v: int):
+        i = self.map.get(k)
+        if i is not None:
+            self.vals[i] = v
+            self._move_to_front(i)
+            return
+        if self.cap <= 0: return
+        # LRU inserta y luego expulsa; aquí se expulsa primero para no
+        # necesitar un slot extra. El resultado observable es el mismo.
+        if len(self.map) >= self.cap:
+            self._evict_lru()
+        i = self.libre
+        self.libre = self.next[i]
+        self.keys[i] = k
+        self.vals[i] = v
+        self.map[k] = i
+        self._add_front(i)
+
+    def orden(self):
+        """Llaves en orden MRU -> LRU."""
+        out, i = [], self.next[CENTINELA]
+        while i != CENTINELA:
+            out.append(self.keys[i])
+            i = self.next[i]
+        return out
+
+# -------------------------
+# DEMOSTRACIÓN Y REPORTE
+# -------------------------
+
+def orden_lru(cache):
+    out, cur = [], cache.head.next
+    while cur is not cache.tail:
+        out.append(cur.k)
+        cur = cur.next
+    return out
+
+def bytes_por_entrada(clase, n):
+    """Memoria de la estructura por entrada (llaves/valores se crean antes de medir)."""
+    llaves = list(range(10**6, 10**6 + n))
+    tracemalloc.start()
+    cache = clase(n)
+    for k in llaves:
+        cache.put(k, k)
+    usados, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return usados / n
+
+if __name__ == "__main__":
+    # --------------------------------------------------
+    # PRUEBA 1: mismo comportamiento que el Ejercicio 6
+    # --------------------------------------------------
+    cache = LRUArreglos(2)
+    cache.put(1, 10); cache.put(2, 20)
+    print(f"Resultado get(1): {cache.get(1)}")  # 10
+    cache.put(3, 30)                            # Expulsa 2
+    print(f"Resultado get(2): {cache.get(2)}")  # -1
+    cache.put(4, 40)                            # Expulsa 1
+    print(f"Resultado get(1): {cache.get(1)} | get(3): {cache.get(3)} | get(4): {cache.get(4)}")
+
+    # --------------------------------------------------
+    # PRUEBA 2: operaciones aleatorias contra LRU con NodoKV
+    # Esperado: mismos resultados y mismo orden MRU -> LRU
+    # --------------------------------------------------
+    rnd = random.Random(42)
+    for cap in (0, 1, 3, 17):
+        a, b = LRU(cap), LRUArreglos(cap)
+        for _ in range(20_000):
+            k = rnd.randrange(40)
+            if rnd.random() < 0.5:
+                assert a.get(k) == b.get(k)
+            else:
+                v = rnd.randrange(1000)
+                a.put(k, v); b.put(k, v)
+        assert orden_lru(a) == b.orden()
+    print("PRUEBA 2: 80,000 operaciones aleatorias idénticas a la LRU con NodoKV.")
+
+    # --------------------------------------------------
+    # REPORTE: bytes por entrada (solo la estructura)
+    # --------------------------------------------------
+    N = 200_000
+    print(f"\n--- Memoria por entrada con {N:,} entradas ---")
+    # Dos líneas base: el nodo original con __dict__ (contra el que se planteó
+    # este motor) y el NodoKV con __slots__ que usan ahora las LRU del repo.
+    class LRUNodoDict(LRU):
+        Nodo = NodoKVDict
+
+    con_dict = bytes_por_entrada(LRUNodoDict, N)
+    con_slots = bytes_por_entrada(LRU, N)
+    con_arreglos = bytes_por_entrada(LRUArreglos, N)
+    print(f"  LRU (NodoKV __dict__):  {con_dict:6.1f} bytes/entrada")
+    print(f"  LRU (NodoKV __slots__): {con_slots:6.1f} bytes/entrada")
+    print(f"  LRUArreglos:            {con_arreglos:6.1f} bytes/entrada")
+    print(f"  Ahorro vs __dict__:     {100 * (1 - con_arreglos / con_dict):5.1f} %")
+    print(f"  Ahorro vs __slots__:    {100 * (1 - con_arreglos / con_slots):5.1f} %")
@@ -0,0 +1,373 @@
+import itertools
+import random
+
+# Motor de cache con política de expulsión intercambiable.
+# Todas las políticas conservan el núcleo del Ejercicio 6 (diccionario +
+# lista doble con centinelas), tienen get/put en O(1) y comparten la misma
+# API y las mismas estadísticas. Cambia solo cómo se reparten los nodos
+# entre listas y a quién se expulsa.
+
+# -------------------------
+# NODO Y LISTA DOBLE CON CENTINELAS
+# -------------------------
+
+class NodoKV:
+    """Nodo especializado para la cache, guarda llave (k), valor (v) y la lista donde vive."""
+    __slots__ = ("k", "v", "prev", "next", "lista")
+    def __init__(self, k, v):
+        self.k, self.v = k, v
+        self.prev = None
+        self.next = None
+        self.lista = None
+
+class ListaKV:
+    """Lista doble con centinelas head (MRU) y tail (LRU), con su tamaño en O(1)."""
+    def __init__(self):
+        self.head = NodoKV(0, 0)
+        self.tail = NodoKV(0, 0)
+        self.head.next = self.tail
+        self.tail.prev = self.head
+        self.n = 0
+
+    def __len__(self):
+        return self.n
+
+    def add_front(self, nodo: NodoKV):
+        """Añade un nodo inmediatamente después del head (MRU)."""
+        nodo.prev = self.head
+        nodo.next = self.head.next
+        self.head.next.prev = nodo
+        self.head.next = nodo
+        nodo.lista = self
+        self.n += 1
+
+    def remove(self, nodo: NodoKV):
+        """Desenlaza un nodo de la lista."""
+        nodo.prev.next = nodo.next
+        nodo.next.prev = nodo.prev
+        nodo.prev = nodo.next = nodo.lista = None
+        self.n -= 1
+
+    def move_to_front(self, nodo: NodoKV):
+        self.remove(nodo)
+        self.add_front(nodo)
+
+    def pop_lru(self) -> NodoKV:
+        """Quita y devuelve el nodo LRU (None si la lista está vacía)."""
+        nodo = self.tail.prev
+        if nodo is self.head: return None
+        self.remove(nodo)
+        return nodo
+
+# -------------------------
+# CLASE BASE: API Y ESTADÍSTICAS COMUNES
+# -------------------------
+
+class CacheBase:
+    """
+    API común (get/put/stats). Las subclases definen:
+      _acceso(n)        -> qué hacer en un hit
+      _insertar(k, v)   -> dónde colocar una llave nueva y a quién expulsar
+    """
+    nombre = "base"
+
+    def __init__(self, cap: int):
+        if cap <= 0:
+            raise ValueError("La capacidad debe ser un número positivo.")
+        self.cap = cap
+        self.map = {}  # Diccionario: key -> NodoKV residente
+        self.hits = self.misses = 0
+        self.inserciones = self.actualizaciones = 0
+        self.expulsados = 0
+
+    def _expulsar(self, nodo: NodoKV):
+        """Saca del mapa un nodo que ya fue desenlazado de su lista."""
+        del self.map[nodo.k]
+        self.expulsados += 1
+
+    def get(self, k: int) -> int:
+        n = self.map.get(k)
+        if n is None:
+            self.misses += 1
+            return -1
+        self.hits += 1
+        self._acceso(n)
+        return n.v
+
+    def put(self, k: int, v: int):
+        n = self.map.get(k)
+        if n is not None:
+            n.v = v
+            self.actualizaciones += 1
+            self._acceso(n)
+        else:
+            self.inserciones += 1
+            self._insertar(k, v)
+
+    def stats(self) -> dict:
+        consultas = self.hits + self.misses
+        return {
+            "policy": self.nombre,
+            "hits": self.hits,
+            "misses": self.misses,
+            "inserts": self.inserciones,
+            "updates": self.actualizaciones,
+            "evictions": self.expulsados,
+            "hit_ratio": self.hits / consultas if consultas else 0.0,
+        }
+
+# -------------------------
+# POLÍTICA LRU
+# -------------------------
+
+class CacheLRU(CacheBase):
+    """LRU clásica del Ejercicio 6: una sola lista."""
+    nombre = "LRU"
+
+    def __init__(self, cap: int):
+        super().__init__(cap)
+        self.lista = ListaKV()
+
+    def _acceso(self, n):
+        self.lista.move_to_front(n)
+
+    def _insertar(self, k, v):
+        n = NodoKV(k, v)
+        self.map[k] = n
+        self.lista.add_front(n)
+        if len(self.map) > self.cap:
+            self._expulsar(self.lista.pop_lru())
+
+# -------------------------
+# POLÍTICA SLRU (LRU segmentada)
+# -------------------------
+
+class CacheSLRU(CacheBase):
+    """
+    Dos segmentos: 'prueba' recibe las llaves nuevas y 'protegido' las que
+    tuvieron al menos un segundo acceso. Un escaneo solo ensucia 'prueba'.
+    """
+    nombre = "SLRU"
+
+    def __init__(self, cap: int, fraccion_protegida: float = 0.8):
+        super().__init__(cap)
+        self.prueba = ListaKV()
+        self.protegido = ListaKV()
+        self.cap_protegido = max(1, int(cap * fraccion_protegida))
+
+    def _acceso(self, n):
+        if n.lista is self.protegido:
+            self.protegido.move_to_front(n)
+            return
+        # Promover de 'prueba' a 'protegido'; si se llena, degradar su LRU
+        self.prueba.remove(n)
+        self.protegido.add_front(n)
+        if len(self.protegido) > self.cap_protegido:
+            self.prueba.add_front(self.protegido.pop_lru())
+
+    def _insertar(self, k, v):
+        n = NodoKV(k, v)
+        self.map[k] = n
+        self.prueba.add_front(n)
+        if len(self.map) > self.cap:
+            victima = self.prueba.pop_lru() or self.protegido.pop_lru()
+            self._expulsar(victima)
+
+# -------------------------
+# POLÍTICA 2Q
+# -------------------------
+
+class Cache2Q(CacheBase):
+    """
+    2Q completa: A1in (FIFO de llaves nuevas), A1out (fantasmas: solo llaves
+    expulsadas de A1in) y Am (LRU de llaves vistas más de una vez).
+    """
+    nombre = "2Q"
+
+    def __init__(self, cap: int, fraccion_in: float = 0.25, fraccion_out: float = 0.5):
+        super().__init__(cap)
+        self.a1in = ListaKV()
+        self.a1out = ListaKV()
+        self.am = ListaKV()
+        self.fantasmas = {}  # Diccionario: key -> NodoKV fantasma en A1out
+        self.k_in = max(1, int(cap * fraccion_in))
+        self.k_out = max(1, int(cap * fraccion_out))
+
+    def _acceso(self, n):
+        # En A1in no se reordena (es FIFO); en Am sí
+        if n.lista is self.am:
+            self.am.move_to_front(n)
+
+    def _liberar(self):
+        if len(self.a1in) > self.k_in or len(self.am) == 0:
+            victima = self.a1in.pop_lru()
+            self._expulsar(victima)
+            # Recordar solo la llave en A1out
+            fantasma = NodoKV(victima.k, None)
+            self.fantasmas[victima.k] = fantasma
+            self.a1out.add_front(fantasma)
+            if len(self.a1out) > self.k_out:
+                del self.fantasmas[self.a1out.pop_lru().k]
+        else:
+            self._expulsar(self.am.pop_lru())
+
+    def _insertar(self, k, v):
+        n = NodoKV(k, v)
+        self.map[k] = n
+        fantasma = self.fantasmas.pop(k, None)
+        if fantasma is not None:
+            # Se volvió a pedir poco después de salir: va directo a Am
+            self.a1out.remove(fantasma)
+            self.am.add_front(n)
+        else:
+            self.a1in.add_front(n)
+        if len(self.map) > self.cap:
+            self._liberar()
+
+# -------------------------
+# POLÍTICA ARC
+# -------------------------
+
+class CacheARC(CacheBase):
+    """
+    ARC (Adaptive Replacement Cache): T1 (vistas una vez), T2 (vistas 2+ veces)
+    y sus fantasmas B1 y B2. El objetivo 'p' para el tamaño de T1 se ajusta
+    solo según en qué lista fantasma ocurren los aciertos.
+    """
+    nombre = "ARC"
+
+    def __init__(self, cap: int):
+        super().__init__(cap)
+        self.t1, self.t2 = ListaKV(), ListaKV()
+        self.b1, self.b2 = ListaKV(), ListaKV()
+        self.fantasmas = {}  # Diccionario: key -> NodoKV fantasma en B1 o B2
+        self.p = 0
+
+    def _acceso(self, n):
+        n.lista.remove(n)
+        self.t2.add_front(n)
+
+    def _fantasma(self, victima, lista):
+        fantasma = NodoKV(victima.k, None)
+        self.fantasmas[victima.k] = fantasma
+        lista.add_front(fantasma)
+
+    def _olvidar(self, lista):
+        del self.fantasmas[lista.pop_lru().k]
+
+    def _reemplazar(self, en_b2: bool):
+        """REPLACE de ARC: expulsa de T1 o de T2 según 'p' y deja el fantasma."""
+        t1 = len(self.t1)
+        if t1 and (t1 > self.p or (en_b2 and t1 == self.p)):
+            victima = self.t1.pop_lru()
+            self._fantasma(victima, self.b1)
+        else:
+            victima = self.t2.pop_lru()
+            self._fantasma(victima, self.b2)
+        self._expulsar(victima)
+
+    def _insertar(self, k, v):
+        c = self.cap
+        n = NodoKV(k, v)
+        fantasma = self.fantasmas.pop(k, None)
+
+        if fantasma is not None and fantasma.lista is self.b1:
+            # Acierto en B1: T1 debió ser más grande
+            self.p = min(c, self.p + max(len(self.b2) // len(self.b1), 1))
+            self.b1.remove(fantasma)
+            if len(self.map) >= c: self._reemplazar(False)
+            self.map[k] = n
+            self.t2.add_front(n)
+            return
+
+        if fantasma is not None:
+            # Acierto en B2: T2 debió ser más grande
+            self.p = max(0, self.p - max(len(self.b1) // len(self.b2), 1))
+            self.b2.remove(fantasma)
+            if len(self.map) >= c: self._reemplazar(True)
+            self.map[k] = n
+            self.t2.add_front(n)
+            return
+
+        # Fallo total
+        l1 = len(self.t1) + len(self.b1)
+        total = l1 + len(self.t2) + len(self.b2)
+        if l1 == c:
+            if len(self.t1) < c:
+                self._olvidar(self.b1)
+                self._reemplazar(False)
+            else:
+                self._expulsar(self.t1.pop_lru())
+        elif total >= c:
+            if total == 2 * c:
+                self._olvidar(self.b2)
+            if len(self.map) >= c:
+                self._reemplazar(False)
+        self.map[k] = n
+        self.t1.add_front(n)
+
+# -------------------------
+# SELECCIÓN DE POLÍTICA
+# -------------------------
+
+POLITICAS = {
+    "lru": CacheLRU,
+    "slru": CacheSLRU,
+    "2q": Cache2Q,
+    "arc": CacheARC,
+}
+
+def crear_cache(cap: int, politica: str = "lru", **opciones):
+    """Crea una cache con la política indicada ('lru', 'slru', '2q' o 'arc')."""
+    try:
+        clase = POLITICAS[politica.lower()]
+    except KeyError:
+        raise ValueError(f"Política desconocida: {politica}. Opciones: {', '.join(POLITICAS)}")
+    return clase(cap, **opciones)
+
+# -------------------------
+# BENCHMARK CON ESCANEOS
+# -------------------------
+
+def traza_con_escaneos(n_accesos, n_calientes, largo_escaneo, prob_escaneo, semilla=7):
+    """
+    Accesos con sesgo Zipf sobre un conjunto de llaves calientes, interrumpidos
+    por escaneos secuenciales de llaves que nunca se repiten.
+    """
+    rnd = random.Random(semilla)
+    pesos = list(itertools.accumulate(1 / (i + 1) for i in range(n_calientes)))
+    calientes = range(n_calientes)
+    siguiente_fria = 10**9
+    traza = []
+    while len(traza) < n_accesos:
+        if rnd.random() < prob_escaneo:
+            traza.extend(range(siguiente_fria, siguiente_fria + largo_escaneo))
+            siguiente_fria += largo_escaneo
+        else:
+            traza.append(rnd.choices(calientes, cum_weights=pesos)[0])
+    return traza[:n_accesos]
+
+def tasa_de_aciertos(cache, traza):
+    for k in traza:
+        if cache.get(k) == -1:
+            cache.put(k, k)
+    return cache.stats()["hit_ratio"]
+
+if __name__ == "__main__":
+    # --------------------------------------------------
+    # PRUEBA 1: misma API para todas las políticas
+    # --------------------------------------------------
+    for nombre in POLITICAS:
+        c = crear_cache(2, nombre)
+        c.put(1, 10); c.put(2, 20); c.get(1); c.put(3, 30)
+        assert len(c.map) <= 2
+        print(f"{c.nombre:>4}: get(1)={c.get(1)} get(2)={c.get(2)} get(3)={c.get(3)} -> {c.stats()}")
+
+    # --------------------------------------------------
+    # BENCHMARK: tasa de aciertos con escaneos
+    # --------------------------------------------------
+    cap = 1_000
+    traza = traza_con_escaneos(300_000, n_calientes=5_000, largo_escaneo=2_000, prob_escaneo=0.0005)
+    print(f"\n--- Tasa de aciertos (cap={cap}, {len(traza):,} accesos, escaneos de 2000 llaves) ---")
+    for nombre in POLITICAS:
+        print(f"  {nombre.upper():>4}: {tasa_de_aciertos(crear_cache(cap, nombre), traza):6.2%}")
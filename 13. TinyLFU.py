@@ -0,0 +1,248 @@
+import itertools
+import random
+
+# W-TinyLFU: filtro de admisión por frecuencia delante de la LRU.
+# Las llaves nuevas entran a una ventana LRU pequeña; cuando salen de ahí,
+# solo pasan a la LRU principal si su frecuencia estimada supera a la de la
+# víctima que desplazarían. Así las llaves de un solo uso no sacan a las
+# frecuentes. La frecuencia se estima con un count-min sketch de 4 bits.
+
+# -------------------------
+# NODO Y LISTA DOBLE CON CENTINELAS (asumidos del Ejercicio 6)
+# -------------------------
+
+class NodoKV:
+    """Nodo especializado para la cache, guarda llave (k), valor (v) y la lista donde vive."""
+    __slots__ = ("k", "v", "prev", "next", "lista")
+    def __init__(self, k, v):
+        self.k, self.v = k, v
+        self.prev = None
+        self.next = None
+        self.lista = None
+
+class ListaKV:
+    """Lista doble con centinelas head (MRU) y tail (LRU), con su tamaño en O(1)."""
+    def __init__(self):
+        self.head = NodoKV(0, 0)
+        self.tail = NodoKV(0, 0)
+        self.head.next = self.tail
+        self.tail.prev = self.head
+        self.n = 0
+
+    def __len__(self):
+        return self.n
+
+    def add_front(self, nodo: NodoKV):
+        nodo.prev = self.head
+        nodo.next = self.head.next
+        self.head.next.prev = nodo
+        self.head.next = nodo
+        nodo.lista = self
+        self.n += 1
+
+    def remove(self, nodo: NodoKV):
+        nodo.prev.next = nodo.next
+        nodo.next.prev = nodo.prev
+        nodo.prev = nodo.next = nodo.lista = None
+        self.n -= 1
+
+    def move_to_front(self, nodo: NodoKV):
+        self.remove(nodo)
+        self.add_front(nodo)
+
+    def lru(self) -> NodoKV:
+        """Devuelve (sin quitar) el nodo LRU, o None si la lista está vacía."""
+        nodo = self.tail.prev
+        return None if nodo is self.head else nodo
+
+# -------------------------
+# COUNT-MIN SKETCH DE 4 BITS
+# -------------------------
+
+_MASK64 = (1 << 64) - 1
+_SEMILLAS = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0xD6E8FEB86659FD93)
+# Tabla para envejecer: divide entre 2 los dos contadores de 4 bits de cada byte
+_MITAD = bytes((b >> 1) & 0x77 for b in range(256))
+
+class SketchCM:
+    """
+    Count-min sketch con 4 filas y contadores de 4 bits (dos por byte).
+    Cada 'muestra' incrementos todos los contadores se dividen entre 2
+    (envejecimiento), para que la frecuencia refleje el pasado reciente.
+    """
+    def __init__(self, cap: int):
+        ancho = 1
+        while ancho < max(cap, 16):
+            ancho <<= 1
+        self.ancho = ancho
+        self.bits = ancho.bit_length() - 1
+        self.datos = bytearray(len(_SEMILLAS) * ancho // 2)
+        self.muestra = 10 * cap
+        self.incrementos = 0
+
+    def _posiciones(self, k):
+        h = hash(k) & _MASK64
+        for fila, semilla in enumerate(_SEMILLAS):
+            idx = (((h ^ semilla) * 0x9E3779B97F4A7C15) & _MASK64) >> (64 - self.bits)
+            yield fila * self.ancho + idx
+
+    def estimar(self, k) -> int:
+        datos = self.datos
+        return min((datos[p >> 1] >> ((p & 1) << 2)) & 0xF for p in self._posiciones(k))
+
+    def incrementar(self, k):
+        datos = self.datos
+        for p in self._posiciones(k):
+            i, corrimiento = p >> 1, (p & 1) << 2
+            if (datos[i] >> corrimiento) & 0xF < 15:
+                datos[i] += 1 << corrimiento
+        self.incrementos += 1
+        if self.incrementos >= self.muestra:
+            self.envejecer()
+
+    def envejecer(self):
+        """Divide todos los contadores entre 2 en una sola pasada."""
+        self.datos = bytearray(self.datos.translate(_MITAD))
+        self.incrementos //= 2
+
+# -------------------------
+# CLASE LRU (referencia, Ejercicio 6)
+# -------------------------
+
+class LRU:
+    """LRU Cache de un solo segmento, para comparar."""
+    def __init__(self, cap: int):
+        self.cap = cap
+        self.map = {}
+        self.lista = ListaKV()
+        self.hits = self.misses = 0
+
+    def get(self, k: int) -> int:
+        n = self.map.get(k)
+        if n is None:
+            self.misses += 1
+            return -1
+        self.hits += 1
+        self.lista.move_to_front(n)
+        return n.v
+
+    def put(self, k: int, v: int):
+        n = self.map.get(k)
+        if n is not None:
+            n.v = v
+            self.lista.move_to_front(n)
+            return
+        n = NodoKV(k, v)
+        self.map[k] = n
+        self.lista.add_front(n)
+        if len(self.map) > self.cap:
+            victima = self.lista.lru()
+            self.lista.remove(victima)
+            del self.map[victima.k]
+
+# -------------------------
+# CLASE LRU CON ADMISIÓN W-TINYLFU
+# -------------------------
+
+class LRUTinyLFU:
+    """
+    Ventana LRU (por defecto 1% de cap) + LRU principal, con admisión por
+    frecuencia al pasar de la ventana a la principal. Misma API que LRU.
+    """
+    def __init__(self, cap: int, fraccion_ventana: float = 0.01):
+        if cap <= 1:
+            raise ValueError("W-TinyLFU necesita una capacidad de al menos 2.")
+        self.cap = cap
+        self.map = {}
+        self.cap_ventana = max(1, int(cap * fraccion_ventana))
+        self.cap_principal = cap - self.cap_ventana
+        self.ventana = ListaKV()
+        self.principal = ListaKV()
+        self.sketch = SketchCM(cap)
+        self.hits = self.misses = 0
+        self.admitidos = self.rechazados = 0
+
+    def get(self, k: int) -> int:
+        self.sketch.incrementar(k)
+        n = self.map.get(k)
+        if n is None:
+            self.misses += 1
+            return -1
+        self.hits += 1
+        n.lista.move_to_front(n)
+        return n.v
+
+    def put(self, k: int, v: int):
+        n = self.map.get(k)
+        if n is not None:
+            n.v = v
+            n.lista.move_to_front(n)
+            return
+        n = NodoKV(k, v)
+        self.map[k] = n
+        self.ventana.add_front(n)
+        if len(self.ventana) > self.cap_ventana:
+            self._admitir(self.ventana.lru())
+
+    def _admitir(self, candidato: NodoKV):
+        """Decide si el candidato que sale de la ventana entra a la LRU principal."""
+        self.ventana.remove(candidato)
+        if len(self.principal) < self.cap_principal:
+            self.principal.add_front(candidato)
+            return
+        victima = self.principal.lru()
+        if self.sketch.estimar(candidato.k) > self.sketch.estimar(victima.k):
+            self.principal.remove(victima)
+            del self.map[victima.k]
+            self.principal.add_front(candidato)
+            self.admitidos += 1
+        else:
+            del self.map[candidato.k]
+            self.rechazados += 1
+
+# -------------------------
+# BENCHMARK CON TRAZAS ZIPF
+# -------------------------
+
+def traza_zipf(n_accesos, n_llaves, s, semilla=11):
+    """Accesos con distribución Zipf(s) sobre n_llaves llaves."""
+    rnd = random.Random(semilla)
+    pesos = list(itertools.accumulate(1 / (i + 1) ** s for i in range(n_llaves)))
+    llaves = list(range(n_llaves))
+    rnd.shuffle(llaves)  # Que la popularidad no dependa del valor de la llave
+    return rnd.choices(llaves, cum_weights=pesos, k=n_accesos)
+
+def tasa_de_aciertos(cache, traza):
+    for k in traza:
+        if cache.get(k) == -1:
+            cache.put(k, k)
+    return cache.hits / (cache.hits + cache.misses)
+
+if __name__ == "__main__":
+    # --------------------------------------------------
+    # PRUEBA 1: una llave frecuente no es desplazada por llaves de un solo uso
+    # --------------------------------------------------
+    cache = LRUTinyLFU(10)
+    for _ in range(5):
+        if cache.get(1) == -1: cache.put(1, 10)
+    for k in range(100, 200):
+        if cache.get(k) == -1: cache.put(k, k)
+    print(f"PRUEBA 1: get(1) después de 100 llaves de un solo uso: {cache.get(1)}")  # 10
+
+    # --------------------------------------------------
+    # REPORTE: tamaño del sketch
+    # --------------------------------------------------
+    sk = SketchCM(10_000)
+    print(f"Sketch para cap=10,000: {len(sk.datos):,} bytes, "
+          f"{len(_SEMILLAS)} filas x {sk.ancho:,} contadores de 4 bits")
+
+    # --------------------------------------------------
+    # BENCHMARK: LRU contra W-TinyLFU
+    # --------------------------------------------------
+    cap, n_llaves, n_accesos = 1_000, 100_000, 300_000
+    print(f"\n--- Tasa de aciertos (cap={cap}, {n_llaves:,} llaves, {n_accesos:,} accesos) ---")
+    for s in (0.7, 0.9, 1.1):
+        traza = traza_zipf(n_accesos, n_llaves, s)
+        lru = tasa_de_aciertos(LRU(cap), traza)
+        tiny = tasa_de_aciertos(LRUTinyLFU(cap), traza)
+        print(f"  Zipf s={s}: LRU {lru:6.2%} | W-TinyLFU {tiny:6.2%}")
@@ -0,0 +1,338 @@
+import multiprocessing as mp
+import pickle
+import random
+import struct
+import sys
+import time
+import zlib
+from multiprocessing import resource_tracker, shared_memory
+
+# LRU compartida entre procesos del mismo equipo. La tabla de slots, los
+# enlaces prev/next (como índices, igual que en el Ejercicio 11) y las
+# cubetas del hash viven en un segmento de multiprocessing.shared_memory,
+# protegido por un candado. Así todos los procesos ven una sola cache.
+
+# -------------------------
+# DISTRIBUCIÓN DEL SEGMENTO
+# -------------------------
+#
+#   encabezado  int32[2]        libre (inicio de la free list), n (entradas)
+#   prev        int32[cap + 1]  enlace al slot anterior (slot 0 = centinela)
+#   next        int32[cap + 1]  enlace al siguiente / siguiente slot libre
+#   cadena      int32[cap + 1]  siguiente slot en la misma cubeta del hash
+#   hashes      uint32[cap + 1] hash de la llave guardada en el slot
+#   largo_k     int32[cap + 1]  bytes usados de la llave
+#   largo_v     int32[cap + 1]  bytes usados del valor
+#   cubetas     int32[n_cub]    primer slot de cada cubeta (-1 = vacía)
+#   llaves      bytes[(cap + 1) * tam_llave]
+#   valores     bytes[(cap + 1) * tam_valor]
+
+CENTINELA = 0
+NADA = -1
+PROTOCOLO = 4  # Fijo para que todos los procesos lean los valores igual
+
+def _llave_bytes(k) -> bytes:
+    """
+    Forma canónica de la llave: llaves iguales con == dan los mismos bytes,
+    como en un dict (1, 1.0 y True son la misma llave; "1" es otra). Solo se
+    aceptan int, float, bool, str y bytes.
+    """
+    if isinstance(k, float) and k.is_integer():
+        k = int(k)
+    if isinstance(k, int):          # Incluye bool
+        return b"i" + str(int(k)).encode()
+    if isinstance(k, float):
+        return b"f" + struct.pack("<d", k)
+    if isinstance(k, str):
+        return b"s" + k.encode("utf-8", "surrogatepass")
+    if isinstance(k, bytes):
+        return b"b" + k
+    raise TypeError(f"Tipo de llave no soportado en la cache compartida: {type(k).__name__}")
+
+def _tamanos(cap, n_cub, tam_llave, tam_valor):
+    s = cap + 1
+    return [("encabezado", "i", 2), ("prev", "i", s), ("next", "i", s), ("cadena", "i", s),
+            ("hashes", "I", s), ("largo_k", "i", s), ("largo_v", "i", s),
+            ("cubetas", "i", n_cub), ("llaves", "B", s * tam_llave), ("valores", "B", s * tam_valor)]
+
+def _adjuntar(nombre):
+    """
+    Se adjunta a un segmento existente sin registrarlo en el resource tracker:
+    solo el proceso creador debe liberarlo. Antes de 3.13 no existe track=False,
+    así que se omite el registro durante la llamada.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=nombre, track=False)
+    registrar = resource_tracker.register
+    resource_tracker.register = lambda *args: None
+    try:
+        return shared_memory.SharedMemory(name=nombre)
+    finally:
+        resource_tracker.register = registrar
+
+# -------------------------
+# CLASE LRU COMPARTIDA
+# -------------------------
+
+class LRUCompartida:
+    """
+    LRU Cache en memoria compartida con la semántica de get/put del Ejercicio 6
+    (get devuelve -1 si no existe). Las llaves deben ser int, float, bool, str
+    o bytes: se guardan en forma canónica (ver _llave_bytes), así que se
+    comparan con == igual que en el dict del Ejercicio 6; otro tipo lanza
+    TypeError. Los valores se serializan con pickle. Llave y valor deben caber
+    en tam_llave / tam_valor bytes.
+
+    El proceso que la crea debe llamar destruir() al final. Los demás procesos
+    la reciben como argumento de Process (o con conectar) y llaman cerrar().
+    """
+    def __init__(self, cap: int, tam_llave: int = 64, tam_valor: int = 256, nombre=None, lock=None,
+                 _crear=True):
+        if cap <= 0:
+            raise ValueError("La capacidad debe ser un número positivo.")
+        self.cap = cap
+        self.tam_llave = tam_llave
+        self.tam_valor = tam_valor
+        self.n_cub = 1
+        while self.n_cub < cap:
+            self.n_cub <<= 1
+        self.lock = lock if lock is not None else mp.Lock()
+        self._creador = _crear
+
+        tamanos = _tamanos(cap, self.n_cub, tam_llave, tam_valor)
+        total = sum(struct.calcsize(t) * n for _, t, n in tamanos)
+        if _crear:
+            self.shm = shared_memory.SharedMemory(name=nombre, create=True, size=total)
+        else:
+            self.shm = _adjuntar(nombre)
+        self.nombre = self.shm.name
+        self._mapear(tamanos)
+        if _crear:
+            self._inicializar()
+
+    def _mapear(self, tamanos):
+        """Crea vistas tipadas (memoryview.cast) sobre cada región del segmento."""
+        self._vistas = []
+        inicio = 0
+        for campo, tipo, n in tamanos:
+            fin = inicio + struct.calcsize(tipo) * n
+            vista = self.shm.buf[inicio:fin].cast(tipo)
+            self._vistas.append(vista)
+            setattr(self, campo, vista)
+            inicio = fin
+
+    def _inicializar(self):
+        cap = self.cap
+        for i in range(1, cap + 1):
+            self.next[i] = i + 1
+        self.next[cap] = NADA
+        self.next[CENTINELA] = self.prev[CENTINELA] = CENTINELA
+        for b in range(self.n_cub):
+            self.cubetas[b] = NADA
+        self.encabezado[0] = 1   # libre
+        self.encabezado[1] = 0   # n
+
+    # --- Compartir entre procesos ---
+
+    def __getstate__(self):
+        return (self.cap, self.tam_llave, self.tam_valor, self.nombre, self.lock)
+
+    def __setstate__(self, estado):
+        cap, tam_llave, tam_valor, nombre, lock = estado
+        self.__init__(cap, tam_llave, tam_valor, nombre=nombre, lock=lock, _crear=False)
+
+    @classmethod
+    def conectar(cls, nombre, cap, lock, tam_llave=64, tam_valor=256):
+        """Se adjunta a un segmento ya creado por otro proceso."""
+        return cls(cap, tam_llave, tam_valor, nombre=nombre, lock=lock, _crear=False)
+
+    def cerrar(self):
+        for vista in self._vistas:
+            vista.release()
+        self._vistas = []
+        self.shm.close()
+
+    def destruir(self):
+        """Cierra y libera el segmento (solo el proceso creador)."""
+        self.cerrar()
+        if self._creador:
+            self.shm.unlink()
+
+    # --- HELPERS (índices y cubetas, siempre con el candado tomado) ---
+
+    def _buscar(self, kb: bytes, h: int) -> int:
+        i = self.cubetas[h & (self.n_cub - 1)]
+        tam = self.tam_llave
+        while i != NADA:
+            if self.hashes[i] == h and self.largo_k[i] == len(kb) and \
+                    self.llaves[i * tam:i * tam + len(kb)] == kb:
+                return i
+            i = self.cadena[i]
+        return NADA
+
+    def _desencadenar(self, i: int):
+        """Quita el slot i de la cadena de su cubeta."""
+        b = self.hashes[i] & (self.n_cub - 1)
+        j = self.cubetas[b]
+        if j == i:
+            self.cubetas[b] = self.cadena[i]
+            return
+        while self.cadena[j] != i:
+            j = self.cadena[j]
+        self.cadena[j] = self.cadena[i]
+
+    def _add_front(self, i: int):
+        primero = self.next[CENTINELA]
+        self.prev[i] = CENTINELA
+        self.next[i] = primero
+        self.prev[primero] = i
+        self.next[CENTINELA] = i
+
+    def _remove(self, i: int):
+        p, s = self.prev[i], self.next[i]
+        self.next[p] = s
+        self.prev[s] = p
+
+    def _move_to_front(self, i: int):
+        if self.next[CENTINELA] == i: return
+        self._remove(i)
+        self._add_front(i)
+
+    def _evict_lru(self):
+        i = self.prev[CENTINELA]
+        if i == CENTINELA: return
+        self._remove(i)
+        self._desencadenar(i)
+        self.next[i] = self.encabezado[0]
+        self.encabezado[0] = i
+        self.encabezado[1] -= 1
+
+    def _escribir_valor(self, i: int, vb: bytes):
+        inicio = i * self.tam_valor
+        self.valores[inicio:inicio + len(vb)] = vb
+        self.largo_v[i] = len(vb)
+
+    # --- API (misma semántica que LRU) ---
+
+    def get(self, k) -> int:
+        kb = _llave_bytes(k)
+        h = zlib.crc32(kb)
+        with self.lock:
+            i = self._buscar(kb, h)
+            if i == NADA:
+                return -1
+            self._move_to_front(i)
+            inicio = i * self.tam_valor
+            vb = bytes(self.valores[inicio:inicio + self.largo_v[i]])
+        # Deserializar fuera del candado
+        return pickle.loads(vb)
+
+    def put(self, k, v):
+        kb = _llave_bytes(k)
+        vb = pickle.dumps(v, PROTOCOLO)
+        if len(kb) > self.tam_llave or len(vb) > self.tam_valor:
+            raise ValueError("La llave o el valor no caben en el slot compartido.")
+        h = zlib.crc32(kb)
+        with self.lock:
+            i = self._buscar(kb, h)
+            if i != NADA:
+                self._escribir_valor(i, vb)
+                self._move_to_front(i)
+                return
+            # Se expulsa antes de insertar para no necesitar un slot extra;
+            # el resultado es el mismo que insertar y luego expulsar.
+            if self.encabezado[1] >= self.cap:
+                self._evict_lru()
+            i = self.encabezado[0]
+            self.encabezado[0] = self.next[i]
+            inicio = i * self.tam_llave
+            self.llaves[inicio:inicio + len(kb)] = kb
+            self.largo_k[i] = len(kb)
+            self.hashes[i] = h
+            self._escribir_valor(i, vb)
+            b = h & (self.n_cub - 1)
+            self.cadena[i] = self.cubetas[b]
+            self.cubetas[b] = i
+            self._add_front(i)
+            self.encabezado[1] += 1
+
+    def __len__(self):
+        return self.encabezado[1]
+
+# -------------------------
+# BENCHMARK MULTI-PROCESO
+# -------------------------
+
+def _trabajador(cache, ops, n_llaves, barrera, resultados):
+    """90% lecturas / 10% escrituras; en un fallo se carga el valor."""
+    rnd = random.Random()
+    barrera.wait()
+    hits = 0
+    for _ in range(ops):
+        k = rnd.randrange(n_llaves)
+        if rnd.random() < 0.9:
+            if cache.get(k) == -1:
+                cache.put(k, k)
+            else:
+                hits += 1
+        else:
+            cache.put(k, k)
+    resultados.put(hits)
+    cache.cerrar()
+
+def benchmark(n_procesos, ops_por_proceso=20_000, cap=1_000, n_llaves=2_000):
+    """Devuelve (ops/seg totales, tasa de aciertos) con n_procesos compartiendo la cache."""
+    cache = LRUCompartida(cap)
+    barrera = mp.Barrier(n_procesos + 1)
+    resultados = mp.Queue()
+    procesos = [mp.Process(target=_trabajador,
+                           args=(cache, ops_por_proceso, n_llaves, barrera, resultados))
+                for _ in range(n_procesos)]
+    for p in procesos: p.start()
+    barrera.wait()
+    inicio = time.perf_counter()
+    hits = sum(resultados.get() for _ in procesos)
+    for p in procesos: p.join()
+    transcurrido = time.perf_counter() - inicio
+    assert len(cache) <= cap
+    cache.destruir()
+    lecturas = 0.9 * n_procesos * ops_por_proceso
+    return n_procesos * ops_por_proceso / transcurrido, hits / lecturas
+
+def _escritor(cache):
+    cache.put("saludo", "hola desde otro proceso")
+    cache.cerrar()
+
+if __name__ == "__main__":
+    # --------------------------------------------------
+    # PRUEBA 1: mismo comportamiento que el Ejercicio 6
+    # --------------------------------------------------
+    cache = LRUCompartida(2)
+    cache.put(1, 10); cache.put(2, 20)
+    print(f"Resultado get(1): {cache.get(1)}")  # 10
+    cache.put(3, 30)                            # Expulsa 2
+    print(f"Resultado get(2): {cache.get(2)}")  # -1
+    cache.put(4, 40)                            # Expulsa 1
+    print(f"Resultado get(1): {cache.get(1)} | get(3): {cache.get(3)} | get(4): {cache.get(4)}")
+
+    # Llaves iguales con == son la misma entrada, como en un dict
+    cache.put(3, 33)
+    print(f"Resultado get(3.0): {cache.get(3.0)} | get('3'): {cache.get('3')} | Entradas: {len(cache)}")  # 33 | -1 | 2
+    cache.put(True, 11)
+    print(f"Resultado get(1): {cache.get(1)} | get(1.0): {cache.get(1.0)}")  # 11 | 11
+
+    # --------------------------------------------------
+    # PRUEBA 2: un proceso escribe y el proceso principal lee
+    # --------------------------------------------------
+    p = mp.Process(target=_escritor, args=(cache,))
+    p.start(); p.join()
+    print(f"Resultado get('saludo'): {cache.get('saludo')}")
+    cache.destruir()
+
+    # --------------------------------------------------
+    # BENCHMARK
+    # --------------------------------------------------
+    print("\n--- Benchmark multi-proceso (cap=1000, 2000 llaves, 90% lecturas) ---")
+    for n in (1, 2, 4):
+        ops, tasa = benchmark(n)
+        print(f"  procesos={n}: {ops:>10,.0f} ops/seg | tasa de aciertos compartida {tasa:6.2%}")
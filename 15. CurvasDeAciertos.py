@@ -0,0 +1,264 @@
+"""
+Curvas de tasa de aciertos de una LRU para elegir su capacidad.
+
+Lee una traza de accesos (texto: una llave por línea; binario: llaves uint64
+little-endian) y en una sola pasada calcula la tasa de aciertos de LRU para
+todas las capacidades a la vez, usando distancias de pila (algoritmo de
+Mattson) con un árbol de Fenwick. Opcionalmente reproduce la traza sobre la
+clase LRU real de 6. LRUCache.py para comparar los números.
+
+Uso:
+    python "15. CurvasDeAciertos.py" traza.txt [--binario] [--max-cap N]
+                                     [--capacidades 100,1000] [--verificar]
+Sin argumentos genera una traza de ejemplo.
+"""
+
+import argparse
+import os
+import random
+import runpy
+import struct
+import tempfile
+from array import array
+
+# -------------------------
+# LECTURA DE TRAZAS (en flujo, sin cargar el archivo completo)
+# -------------------------
+
+def leer_texto(path):
+    """Una llave por línea; las líneas vacías se ignoran."""
+    with open(path, "r", encoding="utf-8") as f:
+        for linea in f:
+            llave = linea.strip()
+            if llave:
+                yield llave
+
+def leer_binario(path, bloque=1 << 16):
+    """Llaves uint64 little-endian, leídas en bloques de 'bloque' llaves."""
+    with open(path, "rb") as f:
+        while True:
+            datos = f.read(8 * bloque)
+            if not datos:
+                break
+            for (llave,) in struct.iter_unpack("<Q", datos[:len(datos) - len(datos) % 8]):
+                yield llave
+
+def escribir_binario(path, llaves):
+    with open(path, "wb") as f:
+        for llave in llaves:
+            f.write(struct.pack("<Q", llave))
+
+# -------------------------
+# ÁRBOL DE FENWICK
+# -------------------------
+
+class Fenwick:
+    """Árbol de Fenwick (BIT) sobre posiciones 0..n-1 con sumas de prefijo en O(log n)."""
+    def __init__(self, n: int):
+        self.n = n
+        self.arbol = array('i', [0]) * (n + 1)
+
+    def sumar(self, i: int, delta: int):
+        arbol, n = self.arbol, self.n
+        i += 1
+        while i <= n:
+            arbol[i] += delta
+            i += i & -i
+
+    def prefijo(self, i: int) -> int:
+        """Suma de las posiciones [0, i)."""
+        arbol, s = self.arbol, 0
+        while i > 0:
+            s += arbol[i]
+            i -= i & -i
+        return s
+
+    @classmethod
+    def de_unos(cls, n: int, unos: int):
+        """Construye en O(n) un árbol con 1 en las posiciones [0, unos)."""
+        f = cls(n)
+        arbol = f.arbol
+        for i in range(1, unos + 1):
+            arbol[i] += 1
+            j = i + (i & -i)
+            if j <= n:
+                arbol[j] += arbol[i]
+        for i in range(unos + 1, n + 1):
+            j = i + (i & -i)
+            if j <= n:
+                arbol[j] += arbol[i]
+        return f
+
+# -------------------------
+# DISTANCIAS DE PILA (MATTSON)
+# -------------------------
+
+class CurvaLRU:
+    """
+    Acumula el histograma de distancias de pila de una traza.
+
+    Cada llave deja una marca en el instante de su último acceso. La distancia
+    de un acceso es 1 + el número de marcas posteriores al acceso anterior de
+    la misma llave, es decir, su posición en la pila LRU: hay acierto en una
+    LRU de capacidad C si y solo si la distancia es <= C.
+
+    Memoria O(max_cap + ventana): el Fenwick cubre solo una ventana de
+    instantes y, al llenarse, se conservan solo las max_cap llaves más
+    recientes (renumeradas en orden). Una llave más lejana ya no puede dar
+    acierto en ninguna capacidad evaluada, así que se olvida; su siguiente
+    acceso cuenta como frío, igual que un primer acceso. Las distancias
+    mayores a max_cap se cuentan juntas.
+    """
+    def __init__(self, max_cap: int, ventana: int = 1 << 20):
+        self.max_cap = max_cap
+        self.ventana = ventana
+        self.fenwick = Fenwick(ventana)
+        self.ultimo = {}  # Diccionario: key -> instante de su último acceso
+        self.t = 0
+        self.hist = array('q', [0]) * (max_cap + 2)  # hist[d], y hist[max_cap + 1] = "más lejos"
+        self.accesos = 0
+        self.frios = 0  # Accesos sin marca: primer acceso o llave olvidada (fallo en toda capacidad)
+
+    def _compactar(self):
+        """Olvida las llaves a distancia > max_cap y renumera las demás a 0..D-1 en orden."""
+        orden = sorted(self.ultimo, key=self.ultimo.__getitem__)
+        sobrantes = len(orden) - self.max_cap
+        if sobrantes > 0:
+            for llave in orden[:sobrantes]:
+                del self.ultimo[llave]
+            orden = orden[sobrantes:]
+        for nuevo, llave in enumerate(orden):
+            self.ultimo[llave] = nuevo
+        vivas = len(orden)
+        # Si casi todas las posiciones están ocupadas por llaves distintas, crecer
+        while self.ventana < 2 * vivas:
+            self.ventana *= 2
+        self.fenwick = Fenwick.de_unos(self.ventana, vivas)
+        self.t = vivas
+
+    def registrar(self, k):
+        if self.t == self.ventana:
+            self._compactar()
+        t = self.t
+        ultimo = self.ultimo
+        p = ultimo.get(k)
+        if p is None:
+            self.frios += 1
+        else:
+            distancia = len(ultimo) - self.fenwick.prefijo(p + 1) + 1
+            self.hist[min(distancia, self.max_cap + 1)] += 1
+            self.fenwick.sumar(p, -1)
+        self.fenwick.sumar(t, 1)
+        ultimo[k] = t
+        self.t = t + 1
+        self.accesos += 1
+
+    def procesar(self, llaves):
+        for k in llaves:
+            self.registrar(k)
+        return self
+
+    def aciertos(self, capacidades):
+        """Aciertos para cada capacidad (en orden creciente) con un solo recorrido del histograma."""
+        res, acumulado, d = {}, 0, 0
+        for c in sorted(capacidades):
+            if c > self.max_cap:
+                raise ValueError(f"La capacidad {c} excede max_cap={self.max_cap}.")
+            while d < c:
+                d += 1
+                acumulado += self.hist[d]
+            res[c] = acumulado
+        return res
+
+    def curva(self, capacidades):
+        """Tasa de aciertos para cada capacidad."""
+        return {c: h / self.accesos if self.accesos else 0.0
+                for c, h in self.aciertos(capacidades).items()}
+
+# -------------------------
+# VERIFICACIÓN CON LA LRU REAL
+# -------------------------
+
+def cargar_lru_real():
+    """
+    Carga la clase LRU de 6. LRUCache.py. El nombre del archivo no es un
+    módulo importable; con run_name distinto de "__main__" no corren sus
+    demostraciones ni benchmarks.
+    """
+    ruta = os.path.join(os.path.dirname(os.path.abspath(__file__)), "6. LRUCache.py")
+    return runpy.run_path(ruta, run_name="lru_cache")["LRU"]
+
+def reproducir(clase_lru, cap, llaves):
+    """Reproduce la traza (get y, en un fallo, put) y devuelve los aciertos."""
+    cache = clase_lru(cap)
+    for k in llaves:
+        if cache.get(k) == -1:
+            cache.put(k, 1)
+    return cache.stats()["hits"]
+
+# -------------------------
+# PROGRAMA PRINCIPAL
+# -------------------------
+
+def potencias_de_dos(max_cap):
+    caps, c = [], 1
+    while c <= max_cap:
+        caps.append(c)
+        c *= 2
+    return caps
+
+def main():
+    parser = argparse.ArgumentParser(description="Curvas de tasa de aciertos LRU en una sola pasada.")
+    parser.add_argument("traza", nargs="?", help="Archivo de traza (si falta se genera uno de ejemplo)")
+    parser.add_argument("--binario", action="store_true", help="Traza binaria de llaves uint64")
+    parser.add_argument("--max-cap", type=int, default=1 << 16, help="Capacidad máxima a evaluar")
+    parser.add_argument("--capacidades", help="Capacidades separadas por coma (por defecto potencias de 2)")
+    parser.add_argument("--verificar", action="store_true", help="Comparar contra la LRU real")
+    args = parser.parse_args()
+
+    ruta, temporal = args.traza, False
+    if ruta is None:
+        # Traza de ejemplo: 200k accesos con sesgo hacia llaves pequeñas
+        rnd = random.Random(3)
+        ruta = os.path.join(tempfile.gettempdir(), "traza_ejemplo.bin")
+        escribir_binario(ruta, (int(rnd.paretovariate(0.8)) % 50_000 for _ in range(200_000)))
+        args.binario, args.max_cap, temporal = True, 1_024, True
+        args.verificar = True
+        print(f"--- Traza de ejemplo generada en {ruta} ---")
+
+    leer = leer_binario if args.binario else leer_texto
+    if args.capacidades:
+        capacidades = [int(c) for c in args.capacidades.split(",")]
+        args.max_cap = max(args.max_cap, max(capacidades))
+    else:
+        capacidades = potencias_de_dos(args.max_cap)
+
+    curva = CurvaLRU(args.max_cap).procesar(leer(ruta))
+    lejanos = curva.frios + curva.hist[args.max_cap + 1]
+    print(f"Accesos: {curva.accesos:,} | Fallos en toda capacidad: {lejanos:,} | "
+          f"Llaves en memoria: {len(curva.ultimo):,}")
+    print(f"{'capacidad':>10} | {'tasa de aciertos':>16}")
+    for c, tasa in curva.curva(capacidades).items():
+        print(f"{c:>10,} | {tasa:>16.2%}")
+
+    if temporal:
+        # Con una ventana chica se compacta seguido y se olvidan llaves lejanas:
+        # la curva debe salir igual con memoria acotada por max_cap + ventana
+        chica = CurvaLRU(args.max_cap, ventana=1 << 12).procesar(leer(ruta))
+        print(f"\nVentana de 4,096: misma curva = {chica.aciertos(capacidades) == curva.aciertos(capacidades)} | "
+              f"Llaves en memoria: {len(chica.ultimo):,} (<= {args.max_cap + (1 << 12):,})")
+
+    if args.verificar:
+        lru = cargar_lru_real()
+        aciertos = curva.aciertos(capacidades)
+        print("\n--- Verificación contra la LRU real (aciertos) ---")
+        for c in capacidades[::max(1, len(capacidades) // 4)]:
+            reales = reproducir(lru, c, leer(ruta))
+            estado = "OK" if reales == aciertos[c] else "DIFERENTE"
+            print(f"  cap={c:>6,}: Mattson {aciertos[c]:>9,} | LRU {reales:>9,} [{estado}]")
+
+    if temporal:
+        os.remove(ruta)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+import itertools
+import random
+import time
+
+# LFU Cache en O(1) construida con la misma maquinaria del Ejercicio 6:
+# NodoKV y listas dobles con nodos centinela. Hay una lista por frecuencia
+# (cubeta) y dentro de cada cubeta el orden es por recencia, así que los
+# empates se rompen expulsando al menos reciente.
+
+# -------------------------
+# CLASE DE NODO (Key-Value)
+# -------------------------
+
+class NodoKV:
+    """Nodo especializado para la cache, guarda llave (k), valor (v) y su frecuencia."""
+    __slots__ = ("k", "v", "prev", "next", "freq")
+    def __init__(self, k, v):
+        self.k, self.v = k, v
+        self.prev = None
+        self.next = None
+        self.freq = 1
+
+# -------------------------
+# LISTA DOBLE CON CENTINELAS (una por frecuencia)
+# -------------------------
+
+class ListaKV:
+    """Lista doble entre centinelas head (más reciente) y tail (menos reciente)."""
+    def __init__(self):
+        self.head = NodoKV(0, 0)
+        self.tail = NodoKV(0, 0)
+        self.head.next = self.tail
+        self.tail.prev = self.head
+        self.n = 0
+
+    def _add_front(self, n: NodoKV):
+        """Añade un nodo inmediatamente después del head."""
+        n.prev = self.head
+        n.next = self.head.next
+        self.head.next.prev = n
+        self.head.next = n
+        self.n += 1
+
+    def _remove(self, n: NodoKV):
+        """Desenlaza un nodo de la lista."""
+        n.prev.next = n.next
+        n.next.prev = n.prev
+        n.prev = n.next = None
+        self.n -= 1
+
+# -------------------------
+# CLASE LRU (Ejercicio 6, para comparar)
+# -------------------------
+
+class LRU:
+    """LRU Cache usando un diccionario y una lista doble."""
+    def __init__(self, cap: int):
+        self.cap = cap
+        self.map = {}
+        self.lista = ListaKV()
+        self.hits = self.misses = 0
+
+    def get(self, k: int) -> int:
+        n = self.map.get(k)
+        if n is None:
+            self.misses += 1
+            return -1
+        self.hits += 1
+        self.lista._remove(n)
+        self.lista._add_front(n)
+        return n.v
+
+    def put(self, k: int, v: int):
+        n = self.map.get(k)
+        if n is not None:
+            n.v = v
+            self.lista._remove(n)
+            self.lista._add_front(n)
+            return
+        n = NodoKV(k, v)
+        self.map[k] = n
+        self.lista._add_front(n)
+        if len(self.map) > self.cap:
+            victima = self.lista.tail.prev
+            self.lista._remove(victima)
+            del self.map[victima.k]
+
+# -------------------------
+# CLASE LFU CACHE
+# -------------------------
+
+class LFU:
+    """
+    LFU Cache con get, put y expulsión en O(1).
+
+    - map: key -> NodoKV
+    - cubetas: frecuencia -> ListaKV con los nodos de esa frecuencia
+    - min_freq: la menor frecuencia presente (de ahí sale la víctima)
+    """
+    def __init__(self, cap: int):
+        self.cap = cap
+        self.map = {}
+        self.cubetas = {}
+        self.min_freq = 0
+        self.hits = self.misses = 0
+
+    def _tocar(self, n: NodoKV):
+        """Sube la frecuencia del nodo y lo mueve a la cubeta siguiente."""
+        lista = self.cubetas[n.freq]
+        lista._remove(n)
+        if lista.n == 0:
+            del self.cubetas[n.freq]
+            if self.min_freq == n.freq:
+                self.min_freq += 1
+        n.freq += 1
+        self._cubeta(n.freq)._add_front(n)
+
+    def _cubeta(self, freq: int) -> ListaKV:
+        lista = self.cubetas.get(freq)
+        if lista is None:
+            lista = self.cubetas[freq] = ListaKV()
+        return lista
+
+    def _evict_lfu(self):
+        """Expulsa el menos frecuente; entre empates, el menos reciente (tail)."""
+        lista = self.cubetas[self.min_freq]
+        victima = lista.tail.prev
+        lista._remove(victima)
+        if lista.n == 0:
+            del self.cubetas[self.min_freq]
+        del self.map[victima.k]
+
+    # --- API (misma que LRU) ---
+
+    def get(self, k: int) -> int:
+        n = self.map.get(k)
+        if n is None:
+            self.misses += 1
+            return -1
+        self.hits += 1
+        self._tocar(n)
+        return n.v
+
+    def put(self, k: int, v: int):
+        if self.cap <= 0:
+            return
+        n = self.map.get(k)
+        if n is not None:
+            n.v = v
+            self._tocar(n)
+            return
+        if len(self.map) >= self.cap:
+            self._evict_lfu()
+        n = NodoKV(k, v)
+        self.map[k] = n
+        self._cubeta(1)._add_front(n)
+        self.min_freq = 1
+
+# -------------------------
+# BENCHMARK CONTRA LRU
+# -------------------------
+
+def traza_zipf(n_accesos, n_llaves, s, semilla=5):
+    rnd = random.Random(semilla)
+    pesos = list(itertools.accumulate(1 / (i + 1) ** s for i in range(n_llaves)))
+    return rnd.choices(range(n_llaves), cum_weights=pesos, k=n_accesos)
+
+def traza_recencia(n_accesos, n_llaves, ancho, semilla=5):
+    """Ventana de llaves populares que se desplaza con el tiempo (favorece a LRU)."""
+    rnd = random.Random(semilla)
+    paso = n_llaves / n_accesos
+    return [int(i * paso + rnd.randrange(ancho)) % n_llaves for i in range(n_accesos)]
+
+def correr(cache, traza):
+    inicio = time.perf_counter()
+    for k in traza:
+        if cache.get(k) == -1:
+            cache.put(k, k)
+    transcurrido = time.perf_counter() - inicio
+    return cache.hits / len(traza), transcurrido / len(traza) * 1e9
+
+if __name__ == "__main__":
+    # --------------------------------------------------
+    # PRUEBA 1: expulsa al menos frecuente y, en empate, al menos reciente
+    # --------------------------------------------------
+    cache = LFU(2)
+    cache.put(1, 10); cache.put(2, 20)
+    cache.get(1)                                # freq(1) = 2, freq(2) = 1
+    cache.put(3, 30)                            # Expulsa 2 (menos frecuente)
+    print(f"Resultado get(2): {cache.get(2)}")  # -1
+    cache.get(3)                                # freq(1) = 2, freq(3) = 2
+    cache.put(4, 40)                            # Empate: expulsa 1 (menos reciente)
+    print(f"Resultado get(1): {cache.get(1)} | get(3): {cache.get(3)} | get(4): {cache.get(4)}")
+
+    # --------------------------------------------------
+    # BENCHMARK: tasa de aciertos y ns por acceso
+    # --------------------------------------------------
+    cap, n = 1_000, 300_000
+    trazas = {
+        "Zipf s=0.8": traza_zipf(n, 50_000, 0.8),
+        "Zipf s=1.0": traza_zipf(n, 50_000, 1.0),
+        "Ventana móvil": traza_recencia(n, 50_000, 800),
+    }
+    print(f"\n--- LFU contra LRU (cap={cap}, {n:,} accesos) ---")
+    for nombre, traza in trazas.items():
+        tasa_lru, ns_lru = correr(LRU(cap), traza)
+        tasa_lfu, ns_lfu = correr(LFU(cap), traza)
+        print(f"  {nombre:<14} LRU {tasa_lru:6.2%} ({ns_lru:5.0f} ns) | "
+              f"LFU {tasa_lfu:6.2%} ({ns_lfu:5.0f} ns)")
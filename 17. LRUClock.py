@@ -0,0 +1,187 @@
+import itertools
+import random
+import time
+
+# Modo CLOCK (segunda oportunidad) para la cache del Ejercicio 6.
+# En un hit solo se prende un bit de referencia, sin tocar enlaces. Para
+# expulsar, una manecilla recorre los slots en círculo: si el bit está
+# prendido lo apaga (segunda oportunidad) y avanza; si está apagado, expulsa.
+# Misma API (get/put) y misma capacidad que LRU.
+
+# -------------------------
+# CLASES DEL EJERCICIO 6 (para comparar)
+# -------------------------
+
+class NodoKV:
+    """Nodo especializado para la LRU, guarda llave (k) y valor (v)."""
+    __slots__ = ("k", "v", "prev", "next")
+    def __init__(self, k, v):
+        self.k, self.v = k, v
+        self.prev = None
+        self.next = None
+
+class LRU:
+    """Implementación de LRU Cache usando un diccionario y una lista doble (asumida del Ejercicio 6)."""
+    def __init__(self, cap: int):
+        self.cap = cap
+        self.map = {}
+        self.head = NodoKV(0, 0)
+        self.tail = NodoKV(0, 0)
+        self.head.next = self.tail
+        self.tail.prev = self.head
+
+    def _add_front(self, n: NodoKV):
+        n.prev = self.head
+        n.next = self.head.next
+        self.head.next.prev = n
+        self.head.next = n
+
+    def _remove(self, n: NodoKV):
+        n.prev.next = n.next
+        n.next.prev = n.prev
+        n.prev = n.next = None
+
+    def _move_to_front(self, n: NodoKV):
+        self._remove(n)
+        self._add_front(n)
+
+    def _evict_lru(self):
+        lru_node = self.tail.prev
+        if lru_node is self.head: return
+        self._remove(lru_node)
+        del self.map[lru_node.k]
+
+    def get(self, k: int) -> int:
+        if k not in self.map: return -1
+        n = self.map[k]
+        self._move_to_front(n)
+        return n.v
+
+    def put(self, k: int, v: int):
+        if k in self.map:
+            n = self.map[k]
+            n.v = v
+            self._move_to_front(n)
+        else:
+            n = NodoKV(k, v)
+            self.map[k] = n
+            self._add_front(n)
+            if len(self.map) > self.cap:
+                self._evict_lru()
+
+# -------------------------
+# CLASE LRU EN MODO CLOCK
+# -------------------------
+
+class LRUClock:
+    """
+    Aproximación CLOCK de LRU.
+
+    - keys / vals: slots en un arreglo circular de tamaño cap.
+    - ref: un bit de referencia por slot (bytearray).
+    - map: key -> índice de slot.
+    - mano: posición de la manecilla.
+    """
+    def __init__(self, cap: int):
+        self.cap = cap
+        self.map = {}
+        self.keys = [None] * cap
+        self.vals = [None] * cap
+        self.ref = bytearray(cap)
+        self.mano = 0
+
+    def _evict(self) -> int:
+        """Gira la manecilla hasta un slot con bit apagado, lo libera y devuelve su índice."""
+        ref, cap = self.ref, self.cap
+        mano = self.mano
+        while ref[mano]:
+            ref[mano] = 0  # Segunda oportunidad
+            mano += 1
+            if mano == cap: mano = 0
+        del self.map[self.keys[mano]]
+        self.mano = mano
+        return mano
+
+    # --- API (misma que LRU) ---
+
+    def get(self, k: int) -> int:
+        i = self.map.get(k)
+        if i is None: return -1
+        self.ref[i] = 1
+        return self.vals[i]
+
+    def put(self, k: int, v: int):
+        i = self.map.get(k)
+        if i is not None:
+            self.vals[i] = v
+            self.ref[i] = 1
+            return
+        if self.cap <= 0: return
+        # Mientras la cache no se llena, la manecilla avanza sobre slots vacíos
+        i = self.mano if len(self.map) < self.cap else self._evict()
+        self.keys[i] = k
+        self.vals[i] = v
+        self.ref[i] = 0
+        self.map[k] = i
+        self.mano = i + 1 if i + 1 < self.cap else 0
+
+# -------------------------
+# BENCHMARK DE LATENCIA
+# -------------------------
+
+def ns_por_op(fn, args):
+    inicio = time.perf_counter()
+    for a in args:
+        fn(a)
+    return (time.perf_counter() - inicio) / len(args) * 1e9
+
+def medir(clase, cap=10_000, n=200_000):
+    rnd = random.Random(1)
+    cache = clase(cap)
+    for k in range(cap):
+        cache.put(k, k)
+    hits = [rnd.randrange(cap) for _ in range(n)]
+    fallos = [cap + rnd.randrange(cap) for _ in range(n)]
+    res = {
+        "get (hit)": ns_por_op(cache.get, hits),
+        "get (miss)": ns_por_op(cache.get, fallos),
+        "put (update)": ns_por_op(lambda k: cache.put(k, k), hits),
+    }
+    nuevas = range(10 * cap, 10 * cap + n)
+    res["put (nuevo + expulsión)"] = ns_por_op(lambda k: cache.put(k, k), nuevas)
+    return res
+
+def tasa_de_aciertos(cache, traza):
+    hits = 0
+    for k in traza:
+        if cache.get(k) == -1:
+            cache.put(k, k)
+        else:
+            hits += 1
+    return hits / len(traza)
+
+if __name__ == "__main__":
+    # --------------------------------------------------
+    # PRUEBA 1: una llave referenciada sobrevive a la siguiente expulsión
+    # --------------------------------------------------
+    cache = LRUClock(2)
+    cache.put(1, 10); cache.put(2, 20)
+    print(f"Resultado get(1): {cache.get(1)}")  # 10, prende el bit de 1
+    cache.put(3, 30)                            # 1 tiene segunda oportunidad: expulsa 2
+    print(f"Resultado get(2): {cache.get(2)} | get(1): {cache.get(1)} | get(3): {cache.get(3)}")
+    assert len(cache.map) <= cache.cap
+
+    # --------------------------------------------------
+    # BENCHMARK: latencia por operación (ns)
+    # --------------------------------------------------
+    print("\n--- Latencia (ns/op, cap=10,000) ---")
+    lru, clock = medir(LRU), medir(LRUClock)
+    for op in lru:
+        print(f"  {op:<24} LRU {lru[op]:7.0f} | CLOCK {clock[op]:7.0f}")
+
+    # CLOCK es una aproximación: comparar también la tasa de aciertos
+    rnd = random.Random(2)
+    pesos = list(itertools.accumulate(1 / (i + 1) ** 0.9 for i in range(100_000)))
+    traza = rnd.choices(range(100_000), cum_weights=pesos, k=300_000)
+    print(f"\n  Tasa de aciertos (cap=1000): LRU {tasa_de_aciertos(LRU(1_000), traza):6.2%} | "
+          f"CLOCK {tasa_de_aciertos(LRUClock(1_000), traza):6.2%}")
@@ -0,0 +1,444 @@
+import asyncio
+import itertools
+import json
+import os
+import random
+import socket
+import struct
+import tempfile
+import time
+from collections import deque
+
+# Servidor asyncio que comparte una sola LRU (Ejercicio 6) con otros
+# servicios del mismo equipo, por socket TCP de loopback o socket Unix.
+#
+# Protocolo binario con prefijo de largo. Cada trama es:
+#
+#   largo   uint32 big-endian  bytes que siguen (1 + cuerpo)
+#   código  uint8              operación (petición) o estado (respuesta)
+#   cuerpo  JSON UTF-8         argumentos o resultado
+#
+# Las peticiones se pueden encadenar (pipelining) sin esperar respuesta: el
+# servidor contesta cada conexión en el mismo orden en que llegaron.
+# Se usa JSON y no pickle para que un cliente no pueda ejecutar código en el
+# servidor; llaves y valores deben ser serializables en JSON.
+#
+# Una trama con cuerpo JSON inválido se contesta con ERROR. Una trama con
+# largo 0 o mayor que MAX_TRAMA desincroniza el flujo: se cierra la conexión
+# sin reservar memoria para ella.
+
+ENCABEZADO = struct.Struct(">IB")
+MAX_TRAMA = 16 * 1024 * 1024
+
+# Operaciones
+GET, PUT, GET_MANY, DELETE, STATS = 1, 2, 3, 4, 5
+# Estados de respuesta
+OK, ERROR = 0, 1
+
+# -------------------------
+# CLASES DEL EJERCICIO 6 (con delete y stats)
+# -------------------------
+
+class NodoKV:
+    """Nodo especializado para la LRU, guarda llave (k) y valor (v)."""
+    __slots__ = ("k", "v", "prev", "next")
+    def __init__(self, k, v):
+        self.k, self.v = k, v
+        self.prev = None
+        self.next = None
+
+class LRU:
+    """Implementación de LRU Cache usando un diccionario y una lista doble (asumida del Ejercicio 6)."""
+    def __init__(self, cap: int):
+        self.cap = cap
+        self.map = {}
+        self.head = NodoKV(0, 0)
+        self.tail = NodoKV(0, 0)
+        self.head.next = self.tail
+        self.tail.prev = self.head
+        self.hits = self.misses = self.expulsados = 0
+
+    def _add_front(self, n: NodoKV):
+        n.prev = self.head
+        n.next = self.head.next
+        self.head.next.prev = n
+        self.head.next = n
+
+    def _remove(self, n: NodoKV):
+        n.prev.next = n.next
+        n.next.prev = n.prev
+        n.prev = n.next = None
+
+    def _move_to_front(self, n: NodoKV):
+        self._remove(n)
+        self._add_front(n)
+
+    def _evict_lru(self):
+        lru_node = self.tail.prev
+        if lru_node is self.head: return
+        self._remove(lru_node)
+        del self.map[lru_node.k]
+        self.expulsados += 1
+
+    def get(self, k) -> int:
+        n = self.map.get(k)
+        if n is None:
+            self.misses += 1
+            return -1
+        self.hits += 1
+        self._move_to_front(n)
+        return n.v
+
+    def put(self, k, v):
+        n = self.map.get(k)
+        if n is not None:
+            n.v = v
+            self._move_to_front(n)
+            return
+        n = NodoKV(k, v)
+        self.map[k] = n
+        self._add_front(n)
+        if len(self.map) > self.cap:
+            self._evict_lru()
+
+    def get_many(self, keys):
+        """Retorna (encontrados, faltantes) como en el Ejercicio 6."""
+        encontrados, faltantes = {}, []
+        for k in keys:
+            v = self.get(k)
+            if v == -1:
+                faltantes.append(k)
+            else:
+                encontrados[k] = v
+        return encontrados, faltantes
+
+    def delete(self, k) -> bool:
+        """Elimina la llave si existe; retorna si se eliminó."""
+        n = self.map.pop(k, None)
+        if n is None:
+            return False
+        self._remove(n)
+        return True
+
+    def stats(self) -> dict:
+        consultas = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.expulsados,
+                "size": len(self.map), "hit_ratio": self.hits / consultas if consultas else 0.0}
+
+# -------------------------
+# TRAMAS
+# -------------------------
+
+def _trama(codigo: int, cuerpo) -> bytes:
+    datos = json.dumps(cuerpo, separators=(",", ":")).encode()
+    return ENCABEZADO.pack(len(datos) + 1, codigo) + datos
+
+class ErrorTrama(ValueError):
+    """Largo de trama fuera de rango: ya no se sabe dónde empieza la siguiente."""
+
+async def _leer_trama(reader: asyncio.StreamReader):
+    """
+    Lee una trama completa; retorna (código, bytes del cuerpo) o None si la
+    conexión se cerró. Lanza ErrorTrama si el largo es 0 o excede MAX_TRAMA.
+    """
+    try:
+        largo, codigo = ENCABEZADO.unpack(await reader.readexactly(ENCABEZADO.size))
+        if not 1 <= largo <= MAX_TRAMA:
+            raise ErrorTrama(f"Largo de trama fuera de rango: {largo}")
+        datos = await reader.readexactly(largo - 1)
+    except asyncio.IncompleteReadError:
+        return None
+    return codigo, datos
+
+def _cuerpo(datos: bytes):
+    """Decodifica el cuerpo JSON; lanza ValueError si no es UTF-8 o JSON válido."""
+    return json.loads(datos) if datos else None
+
+# -------------------------
+# SERVIDOR
+# -------------------------
+
+class ServidorCache:
+    """
+    Expone una LRU por socket. Todas las conexiones comparten la misma
+    instancia; como asyncio corre en un solo hilo, cada operación es atómica.
+    """
+    def __init__(self, cache: LRU):
+        self.cache = cache
+        self.servidor = None
+        self.peticiones = 0
+
+    def _ejecutar(self, op: int, args):
+        cache = self.cache
+        if op == GET:
+            return cache.get(args)
+        if op == PUT:
+            cache.put(args[0], args[1])
+            return None
+        if op == GET_MANY:
+            encontrados, faltantes = cache.get_many(args)
+            # JSON solo admite llaves str en objetos: se envían pares [k, v]
+            return [list(encontrados.items()), faltantes]
+        if op == DELETE:
+            return cache.delete(args)
+        if op == STATS:
+            return cache.stats()
+        raise ValueError(f"Operación desconocida: {op}")
+
+    async def _atender(self, reader, writer):
+        try:
+            while True:
+                trama = await _leer_trama(reader)
+                if trama is None:
+                    break
+                op, datos = trama
+                try:
+                    respuesta = _trama(OK, self._ejecutar(op, _cuerpo(datos)))
+                except (ValueError, TypeError, IndexError) as e:
+                    respuesta = _trama(ERROR, str(e))
+                writer.write(respuesta)
+                self.peticiones += 1
+                # drain() solo suspende si el buffer de salida rebasó su límite,
+                # así que las peticiones encadenadas se contestan sin esperas
+                await writer.drain()
+        except (ConnectionError, ErrorTrama, struct.error):
+            pass
+        finally:
+            writer.close()
+
+    async def iniciar_tcp(self, host="127.0.0.1", port=0):
+        self.servidor = await asyncio.start_server(self._atender, host, port)
+        return self.servidor.sockets[0].getsockname()[:2]
+
+    async def iniciar_unix(self, path):
+        self.servidor = await asyncio.start_unix_server(self._atender, path)
+        return path
+
+    async def cerrar(self):
+        self.servidor.close()
+        await self.servidor.wait_closed()
+
+# -------------------------
+# CLIENTE CON POOL DE CONEXIONES
+# -------------------------
+
+class ErrorCache(Exception):
+    """El servidor rechazó la petición."""
+
+class _Conexion:
+    """Una conexión con peticiones encadenadas: las respuestas llegan en orden FIFO."""
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.pendientes = deque()
+        self.cerrada = False
+        self.lector = asyncio.create_task(self._leer())
+
+    async def _leer(self):
+        try:
+            while True:
+                trama = await _leer_trama(self.reader)
+                if trama is None or not self.pendientes:
+                    break
+                codigo, datos = trama
+                futuro = self.pendientes.popleft()
+                if futuro.done():
+                    # Quien la pidió canceló o agotó su tiempo: la respuesta se
+                    # consume igual para no desalinear las siguientes
+                    continue
+                try:
+                    cuerpo = _cuerpo(datos)
+                except ValueError as e:
+                    futuro.set_exception(ErrorCache(f"Respuesta inválida: {e}"))
+                    continue
+                if codigo == OK:
+                    futuro.set_result(cuerpo)
+                else:
+                    futuro.set_exception(ErrorCache(cuerpo))
+        except (ConnectionError, ErrorTrama, struct.error):
+            pass
+        finally:
+            # Sin lector nadie contestaría: las peticiones nuevas fallan de inmediato
+            self.cerrada = True
+            while self.pendientes:
+                futuro = self.pendientes.popleft()
+                if not futuro.done():
+                    futuro.set_exception(ConnectionError("Conexión cerrada."))
+
+    async def pedir(self, op: int, args):
+        if self.cerrada:
+            raise ConnectionError("Conexión cerrada.")
+        futuro = asyncio.get_running_loop().create_future()
+        self.pendientes.append(futuro)
+        self.writer.write(_trama(op, args))
+        try:
+            await self.writer.drain()
+            return await futuro
+        finally:
+            futuro.cancel()  # No hace nada si ya tiene resultado
+
+    async def cerrar(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+        await self.lector
+
+class ClienteCache:
+    """
+    Cliente asíncrono con un pool de 'tam_pool' conexiones usadas en ronda.
+    Varias tareas pueden compartir una conexión: sus peticiones se encadenan.
+    Misma API que LRU, pero con await.
+    """
+    def __init__(self, tam_pool: int = 4, host="127.0.0.1", port=None, path=None):
+        self.tam_pool = tam_pool
+        self.host, self.port, self.path = host, port, path
+        self.conexiones = []
+        self._ronda = None
+
+    async def conectar(self):
+        for _ in range(self.tam_pool):
+            if self.path is not None:
+                reader, writer = await asyncio.open_unix_connection(self.path)
+            else:
+                reader, writer = await asyncio.open_connection(self.host, self.port)
+                writer.get_extra_info("socket").setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.conexiones.append(_Conexion(reader, writer))
+        self._ronda = itertools.cycle(self.conexiones)
+        return self
+
+    async def cerrar(self):
+        for c in self.conexiones:
+            await c.cerrar()
+        self.conexiones = []
+
+    def _pedir(self, op, args=None):
+        return next(self._ronda).pedir(op, args)
+
+    async def get(self, k):
+        return await self._pedir(GET, k)
+
+    async def put(self, k, v):
+        await self._pedir(PUT, [k, v])
+
+    async def get_many(self, keys):
+        pares, faltantes = await self._pedir(GET_MANY, list(keys))
+        return {k: v for k, v in pares}, faltantes
+
+    async def delete(self, k) -> bool:
+        return await self._pedir(DELETE, k)
+
+    async def stats(self) -> dict:
+        return await self._pedir(STATS)
+
+# -------------------------
+# GENERADOR DE CARGA
+# -------------------------
+
+async def generar_carga(cliente: ClienteCache, n_tareas=64, ops_por_tarea=1_000, n_llaves=5_000):
+    """
+    n_tareas concurrentes, cada una con 90% get / 10% put (y put en un fallo).
+    Retorna (ops/seg, latencia p50 en µs, latencia p99 en µs).
+    """
+    latencias = []
+
+    async def tarea(semilla):
+        rnd = random.Random(semilla)
+        for _ in range(ops_por_tarea):
+            k = rnd.randrange(n_llaves)
+            inicio = time.perf_counter()
+            if rnd.random() < 0.9:
+                if await cliente.get(k) == -1:
+                    await cliente.put(k, k)
+            else:
+                await cliente.put(k, k)
+            latencias.append(time.perf_counter() - inicio)
+
+    inicio = time.perf_counter()
+    await asyncio.gather(*(tarea(i) for i in range(n_tareas)))
+    transcurrido = time.perf_counter() - inicio
+    latencias.sort()
+    p50 = latencias[len(latencias) // 2] * 1e6
+    p99 = latencias[int(len(latencias) * 0.99)] * 1e6
+    return len(latencias) / transcurrido, p50, p99
+
+async def main():
+    # --------------------------------------------------
+    # PRUEBA 1: mismo comportamiento que el Ejercicio 6, ahora por TCP
+    # --------------------------------------------------
+    servidor = ServidorCache(LRU(2))
+    host, port = await servidor.iniciar_tcp()
+    cliente = await ClienteCache(tam_pool=2, host=host, port=port).conectar()
+    await cliente.put(1, 10); await cliente.put(2, 20)
+    print(f"Resultado get(1): {await cliente.get(1)}")  # 10
+    await cliente.put(3, 30)                            # Expulsa 2
+    print(f"Resultado get(2): {await cliente.get(2)}")  # -1
+    print(f"Resultado get_many([1, 2, 3]): {await cliente.get_many([1, 2, 3])}")  # ({1: 10, 3: 30}, [2])
+    print(f"Resultado delete(1): {await cliente.delete(1)} | get(1): {await cliente.get(1)}")  # True | -1
+
+    # --------------------------------------------------
+    # PRUEBA 2: 100 peticiones encadenadas en una sola conexión llegan en orden
+    # --------------------------------------------------
+    await cliente.put("x", 0)
+    respuestas = await asyncio.gather(*(cliente.conexiones[0].pedir(GET, "x") for _ in range(100)))
+    print(f"Peticiones encadenadas respondidas: {len(respuestas)} | Stats: {await cliente.stats()}")
+
+    # --------------------------------------------------
+    # PRUEBA 3: una petición cancelada no rompe la conexión
+    # --------------------------------------------------
+    conexion = cliente.conexiones[0]
+    tarea = asyncio.create_task(conexion.pedir(GET, "x"))
+    await asyncio.sleep(0)      # La trama ya salió; falta la respuesta
+    tarea.cancel()
+    try:
+        await asyncio.wait_for(conexion.pedir(GET, "x"), timeout=0)
+    except (asyncio.TimeoutError, asyncio.CancelledError):
+        pass
+    print(f"Tras cancelar 2 peticiones, get('x'): {await asyncio.wait_for(conexion.pedir(GET, 'x'), 1)}")  # 0
+
+    # --------------------------------------------------
+    # PRUEBA 4: tramas malformadas no tumban al servidor
+    # --------------------------------------------------
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(ENCABEZADO.pack(5, GET) + b"{no}")        # JSON inválido -> ERROR
+    await writer.drain()
+    codigo, datos = await _leer_trama(reader)
+    print(f"JSON inválido -> código {codigo} ({_cuerpo(datos)!r})")  # 1 (ERROR)
+    for encabezado in (ENCABEZADO.pack(0, GET), ENCABEZADO.pack(0xFFFFFFFF, GET)):
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(encabezado)                           # Largo 0 / ~4 GiB -> cierre
+        await writer.drain()
+        print(f"Largo {ENCABEZADO.unpack(encabezado)[0]:,}: conexión cerrada = {await _leer_trama(reader) is None}")
+        writer.close()
+    assert await cliente.get("x") == 0, "el servidor dejó de atender a los demás clientes"
+    print(f"Los demás clientes siguen atendidos, get('x'): {await cliente.get('x')}")  # 0
+
+    await cliente.cerrar()
+    await servidor.cerrar()
+
+    # --------------------------------------------------
+    # BENCHMARK: ops/seg y latencia en loopback
+    # --------------------------------------------------
+    print("\n--- Carga: 64 tareas x 1,000 ops (cap=2,000, 5,000 llaves, 90% lecturas) ---")
+    transportes = ["TCP"] + (["Unix"] if hasattr(socket, "AF_UNIX") else [])
+    for transporte in transportes:
+        for tam_pool in (1, 4):
+            servidor = ServidorCache(LRU(2_000))
+            if transporte == "TCP":
+                host, port = await servidor.iniciar_tcp()
+                cliente = ClienteCache(tam_pool, host=host, port=port)
+            else:
+                path = os.path.join(tempfile.mkdtemp(), "cache.sock")
+                await servidor.iniciar_unix(path)
+                cliente = ClienteCache(tam_pool, path=path)
+            await cliente.conectar()
+            ops, p50, p99 = await generar_carga(cliente)
+            tasa = (await cliente.stats())["hit_ratio"]
+            await cliente.cerrar()
+            await servidor.cerrar()
+            if transporte == "Unix":
+                os.remove(path)
+                os.rmdir(os.path.dirname(path))
+            print(f"  {transporte:<4} pool={tam_pool}: {ops:>9,.0f} ops/seg | p50 {p50:7.0f} µs | "
+                  f"p99 {p99:7.0f} µs | tasa de aciertos {tasa:6.2%}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,79 @@
+import ast
+import os
+import sys
+import tracemalloc
+
+# Reporte de memoria por elemento de cada clase de nodo del repositorio, con
+# y sin __slots__. Cada clase se compila directamente desde su archivo (solo
+# la definición de la clase, con ast) para no ejecutar las demostraciones de
+# los ejercicios. La versión "antes" es la misma clase sin la línea __slots__,
+# es decir, con un __dict__ por instancia.
+
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+N = 100_000
+
+# (archivo, clase, argumentos del constructor). Se usan datos constantes para
+# medir solo el costo del nodo y no el de los valores que guarda.
+ESTRUCTURAS = [
+    ("1. ConstruyeYRecorre.py", "Nodo", (0,)),
+    ("2. InsertarDespuesValor.py", "Nodo", (0,)),
+    ("3. EliminarPrimeraOcurrenciaValor.py", "Nodo", (0,)),
+    ("4. ContarNodosK-esimo.py", "Nodo", (0,)),
+    ("5.RemoverDupe.py", "Nodo", (0,)),
+    ("7. TodosJuntos.py", "Nodo", (0,)),
+    ("7. TodosJuntos.py", "NodoKV", (0, 0)),
+    ("MiniImplementacion.py", "Nodo", (0,)),
+    ("DobleLigada.py", "Nodo", (0,)),
+    ("NodoCiclos.py", "Nodo", (0,)),
+    ("NodoCiclosClase.py", "Nodo", (0,)),
+    ("NodoCiclosClase.py", "Mascota", ("Maggie",)),
+    ("NodoNumeros.py", "Nodo", (0,)),
+    ("NodoRecursivo.py", "Nodo", (0,)),
+    ("PreExamen Menu Final.py", "Nodo", (0,)),
+    ("PreExamen Menu Final.py", "Alumno", ("Ana", 9.5)),
+    ("6. LRUCache.py", "NodoKV", (0, 0)),
+    ("8. LRUConcurrente.py", "NodoKV", (0, 0)),
+    ("9. LRUMemoize.py", "NodoKV", (0, 0)),
+    ("10. LRUAsync.py", "NodoKV", (0, 0)),
+    ("11. LRUArreglos.py", "NodoKV", (0, 0)),
+    ("12. PoliticasCache.py", "NodoKV", (0, 0)),
+    ("13. TinyLFU.py", "NodoKV", (0, 0)),
+    ("16. LFUCache.py", "NodoKV", (0, 0)),
+    ("17. LRUClock.py", "NodoKV", (0, 0)),
+    ("18. ServidorCache.py", "NodoKV", (0, 0)),
+]
+
+def _es_slots(sentencia):
+    return isinstance(sentencia, ast.Assign) and any(
+        isinstance(t, ast.Name) and t.id == "__slots__" for t in sentencia.targets)
+
+def cargar_clase(archivo, nombre, con_slots=True):
+    """Compila solo la clase 'nombre' de 'archivo'; con_slots=False quita su __slots__."""
+    ruta = os.path.join(DIRECTORIO, archivo)
+    with open(ruta, encoding="utf-8") as f:
+        arbol = ast.parse(f.read(), filename=archivo)
+    definicion = next(n for n in arbol.body if isinstance(n, ast.ClassDef) and n.name == nombre)
+    if not con_slots:
+        definicion.body = [s for s in definicion.body if not _es_slots(s)] or [ast.Pass()]
+    modulo = ast.fix_missing_locations(ast.Module(body=[definicion], type_ignores=[]))
+    espacio = {}
+    exec(compile(modulo, ruta, "exec"), espacio)
+    return espacio[nombre]
+
+def bytes_por_elemento(clase, args, n=N):
+    """Memoria asignada (tracemalloc) por instancia, descontando la lista que las guarda."""
+    tracemalloc.start()
+    inicio = tracemalloc.get_traced_memory()[0]
+    elementos = [clase(*args) for _ in range(n)]
+    usado = tracemalloc.get_traced_memory()[0] - inicio - sys.getsizeof(elementos)
+    tracemalloc.stop()
+    del elementos
+    return usado / n
+
+if __name__ == "__main__":
+    print(f"--- Bytes por elemento ({N:,} instancias, Python {sys.version.split()[0]}) ---")
+    print(f"{'archivo':<38} {'clase':<8} {'__dict__':>9} {'__slots__':>10} {'ahorro':>7}")
+    for archivo, nombre, args in ESTRUCTURAS:
+        antes = bytes_por_elemento(cargar_clase(archivo, nombre, con_slots=False), args)
+        despues = bytes_por_elemento(cargar_clase(archivo, nombre), args)
+        print(f"{archivo:<38} {nombre:<8} {antes:>9.1f} {despues:>10.1f} {1 - despues / antes:>7.0%}")
@@ -1,20 +1,105 @@
+import bisect
+import contextlib
+import io
+import random
+import time
+from operator import attrgetter
+
+# Separación entre etiquetas de posición consecutivas (modo indexado)
+SALTO = 1 << 20
+_orden = attrgetter("orden")
+
+def _orden_ultimo(bloque):
+    return bloque[-1].orden
+
 class Nodo:
     """Representa un nodo en la lista doblemente ligada."""
+    __slots__ = ("dato", "prev", "next", "orden")
     def __init__(self, dato):
         self.dato = dato
         self.prev = None  
         self.next = None  
+        self.orden = 0  # Etiqueta de posición (solo se usa en modo indexado)
 
-class ListaDoble:
-    """Implementa una lista doblemente ligada."""
+class Ocurrencias:
+    """
+    Nodos con un mismo valor en modo indexado, ordenados por su etiqueta
+    'orden'. Se guardan en bloques cortos (a lo más 2*CARGA nodos), así que
+    insertar o quitar cuesta O(log k) sin mover los k nodos, y la primera
+    ocurrencia es siempre bloques[0][0]. Reetiquetar conserva el orden, por
+    lo que los bloques nunca hay que reordenarlos.
+    """
+    CARGA = 64
+    __slots__ = ("bloques", "n")
     def __init__(self):
+        self.bloques = []
+        self.n = 0
+
+    def __len__(self):
+        return self.n
+
+    def primero(self):
+        return self.bloques[0][0]
+
+    def _bloque_de(self, orden):
+        """Índice del primer bloque cuyo último nodo tiene etiqueta >= orden."""
+        return bisect.bisect_left(self.bloques, orden, key=_orden_ultimo)
+
+    def agregar(self, n):
+        bloques = self.bloques
+        self.n += 1
+        if not bloques:
+            bloques.append([n])
+            return
+        b = self._bloque_de(n.orden)
+        if b == len(bloques):
+            b -= 1
+            bloque = bloques[b]
+            bloque.append(n)                 # Caso común: push_back
+        else:
+            bloque = bloques[b]
+            bisect.insort(bloque, n, key=_orden)
+        if len(bloque) > 2 * self.CARGA:
+            bloques.insert(b + 1, bloque[self.CARGA:])
+            del bloque[self.CARGA:]
+
+    def anteponer(self, nuevos):
+        """Agrega nodos (ya ordenados) que quedan antes de todos los actuales."""
+        c = self.CARGA
+        self.bloques[:0] = [nuevos[i:i + c] for i in range(0, len(nuevos), c)]
+        self.n += len(nuevos)
+
+    def quitar(self, n):
+        b = self._bloque_de(n.orden)
+        bloque = self.bloques[b]
+        del bloque[bisect.bisect_left(bloque, n.orden, key=_orden)]
+        if not bloque:
+            del self.bloques[b]
+        self.n -= 1
+
+class ListaDoble:
+    """
+    Implementa una lista doblemente ligada.
+
+    Modo indexado (indexada=True): se mantiene un diccionario valor -> nodos
+    con ese valor, y cada nodo lleva una etiqueta 'orden' creciente de head a
+    tail. Los nodos de cada valor se guardan ordenados por etiqueta, así find
+    (y con él insert_after) no recorre la lista: es O(1) aun con duplicados.
+    Cuando dos etiquetas vecinas se juntan se reetiqueta solo una vecindad.
+    Los valores deben ser hashables.
+    """
+    def __init__(self, indexada=False):
         self.head = None  
         self.tail = None  
+        self.indice = {} if indexada else None  # Diccionario: valor -> Ocurrencias
 
     # Inserción al inicio (push_front)
     # Complejidad: O(1)
     def push_front(self, x):
         n = Nodo(x)
+        if self.indice is not None:
+            n.orden = self.head.orden - SALTO if self.head else 0
+            self._indexar(n)
         n.next = self.head  
         
         if self.head: 
@@ -29,6 +114,9 @@ class ListaDoble:
     # Complejidad: O(1)
     def push_back(self, x):
         n = Nodo(x)
+        if self.indice is not None:
+            n.orden = self.tail.orden + SALTO if self.tail else 0
+            self._indexar(n)
         n.prev = self.tail  
         
         if self.tail: 
@@ -62,6 +150,10 @@ class ListaDoble:
     # ----------------------------------------------------
     def find(self, v):
         """Busca y retorna la PRIMERA ocurrencia de un valor (v) en la lista."""
+        if self.indice is not None:
+            # Modo indexado: la primera ocurrencia es la de menor etiqueta 'orden'
+            nodos = self.indice.get(v)
+            return nodos.primero() if nodos else None
         cur = self.head
         while cur:
             if cur.dato == v: 
@@ -86,6 +178,9 @@ class ListaDoble:
         
         # 2. Inserción/Enlace (O(1)): crear y enlazar el nuevo nodo
         n = Nodo(x)
+        if self.indice is not None:
+            n.orden = self._orden_despues(nodo_objetivo)
+            self._indexar(n)
         
         # Configurar los punteros del nuevo nodo
         n.prev = nodo_objetivo      # 'prev' apunta al objetivo
@@ -104,6 +199,51 @@ class ListaDoble:
         
         print(f"  [ÉXITO]: Insertado {x} después de {valor_objetivo}.")
         # Complejidad: O(n) por la búsqueda (find) + O(1) por el enlace.
+        # En modo indexado la búsqueda también es O(1).
+
+    # ------------------------------------------------------------------------
+    # MODO INDEXADO: índice valor -> nodos y etiquetas de posición
+    # ------------------------------------------------------------------------
+    def _indexar(self, n):
+        nodos = self.indice.get(n.dato)
+        if nodos is None:
+            nodos = self.indice[n.dato] = Ocurrencias()
+        nodos.agregar(n)
+
+    def _orden_despues(self, nodo):
+        """Etiqueta para un nodo nuevo entre 'nodo' y su sucesor."""
+        if nodo.next is None:
+            return nodo.orden + SALTO
+        if nodo.next.orden - nodo.orden < 2:
+            self._reetiquetar(nodo)  # Sin espacio entre vecinos
+        return (nodo.orden + nodo.next.orden) // 2
+
+    def _reetiquetar(self, nodo):
+        """
+        Reparte de nuevo las etiquetas solo alrededor de 'nodo': busca el menor
+        rango alineado de 2**i etiquetas que lo contiene y tiene a lo más
+        (4/3)**i nodos (contando el que se va a insertar), y los reparte
+        parejo dentro del rango. Costo amortizado O(log n) por inserción.
+        """
+        primero = ultimo = nodo
+        cuenta, i = 1, 0
+        while True:
+            i += 1
+            base = nodo.orden >> i << i
+            tope = base + (1 << i)
+            while primero.prev and primero.prev.orden >= base:
+                primero = primero.prev
+                cuenta += 1
+            while ultimo.next and ultimo.next.orden < tope:
+                ultimo = ultimo.next
+                cuenta += 1
+            if (cuenta + 1) * 3 ** i <= 4 ** i:
+                break
+        paso = (1 << i) // (cuenta + 1)
+        cur = primero
+        for j in range(cuenta):
+            cur.orden = base + j * paso
+            cur = cur.next
         
     # Agregamos el forward del ejercicio anterior para las pruebas
     def forward(self):
@@ -144,4 +284,61 @@ print(f"Lista después de insert_after(30, 40): {ld.forward()}")
 ld.insert_after(99, 100)
 print(f"Lista después de insert_after(99, 100): {ld.forward()}")
 
-print("-" * 30)
\ No newline at end of file
+print("-" * 30)
+
+# --------------------------------------------------
+# PRUEBA 4: Modo indexado con duplicados (misma salida que el modo lineal)
+# Esperado: [1, 2, 7, 1, 2] (7 va después del PRIMER 2)
+# --------------------------------------------------
+ldi = ListaDoble(indexada=True)
+for x in (2, 1, 2):
+    ldi.push_back(x)
+ldi.push_front(1)             # [1, 2, 1, 2]
+ldi.insert_after(2, 7)
+print(f"Lista indexada después de insert_after(2, 7): {ldi.forward()}")
+print("-" * 30)
+
+# --------------------------------------------------
+# BENCHMARK: insert_after con búsqueda lineal contra modo indexado
+# --------------------------------------------------
+print("--- insert_after sobre valores aleatorios (µs por operación) ---")
+rnd = random.Random(21)
+for n in (100_000, 1_000_000):
+    objetivos = [rnd.randrange(n) for _ in range(100)]
+    tiempos = {}
+    for indexada in (False, True):
+        lista = ListaDoble(indexada)
+        for i in range(n):
+            lista.push_back(i)
+        inicio = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):  # insert_after imprime cada inserción
+            for j, objetivo in enumerate(objetivos):
+                lista.insert_after(objetivo, n + j)
+        tiempos[indexada] = (time.perf_counter() - inicio) / len(objetivos) * 1e6
+    print(f"  n={n:>9,}: lineal {tiempos[False]:10,.1f} µs | indexado {tiempos[True]:6.1f} µs")
+
+# --------------------------------------------------
+# BENCHMARK: casos adversos para el modo indexado
+# --------------------------------------------------
+# 1) 5,000 inserciones después del mismo objetivo: el hueco entre sus
+#    etiquetas se agota cada ~20 inserciones y hay que reetiquetar.
+# 2) Todos los valores iguales: la primera ocurrencia siempre es el head, así
+#    que la búsqueda lineal es O(1) y el índice tiene que empatarla.
+print("--- insert_after en casos adversos, n=100,000 (µs por operación) ---")
+n, repeticiones = 100_000, 5_000
+casos = [
+    ("mismo objetivo (en medio)", lambda i: i, n // 2, lambda j: n + j),
+    ("todos los valores iguales", lambda i: 0, 0, lambda j: 0),
+]
+for nombre, valor, objetivo, nuevo in casos:
+    tiempos = {}
+    for indexada in (False, True):
+        lista = ListaDoble(indexada)
+        for i in range(n):
+            lista.push_back(valor(i))
+        inicio = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            for j in range(repeticiones):
+                lista.insert_after(objetivo, nuevo(j))
+        tiempos[indexada] = (time.perf_counter() - inicio) / repeticiones * 1e6
+    print(f"  {nombre:<26}: lineal {tiempos[False]:10,.1f} µs | indexado {tiempos[True]:6.1f} µs")
\ No newline at end of file
@@ -1,22 +1,105 @@
-# Reutilizamos las clases Nodo y ListaDoble, incluyendo el método find.
+# Reutilizamos las clases Nodo y ListaDoble, incluyendo el método find
+# y el modo indexado del Ejercicio 2.
+
+import bisect
+import contextlib
+import io
+import random
+import time
+from operator import attrgetter
+
+SALTO = 1 << 20
+_orden = attrgetter("orden")
+
+def _orden_ultimo(bloque):
+    return bloque[-1].orden
 
 class Nodo:
     """Representa un nodo en la lista doblemente ligada."""
+    __slots__ = ("dato", "prev", "next", "orden")
     def __init__(self, dato):
         self.dato = dato
         self.prev = None  
         self.next = None  
+        self.orden = 0  # Etiqueta de posición (solo se usa en modo indexado)
 
-class ListaDoble:
-    """Implementa una lista doblemente ligada."""
+# Asumida del Ejercicio 2
+class Ocurrencias:
+    """
+    Nodos con un mismo valor en modo indexado, ordenados por su etiqueta
+    'orden'. Se guardan en bloques cortos (a lo más 2*CARGA nodos), así que
+    insertar o quitar cuesta O(log k) sin mover los k nodos, y la primera
+    ocurrencia es siempre bloques[0][0]. Reetiquetar conserva el orden, por
+    lo que los bloques nunca hay que reordenarlos.
+    """
+    CARGA = 64
+    __slots__ = ("bloques", "n")
     def __init__(self):
+        self.bloques = []
+        self.n = 0
+
+    def __len__(self):
+        return self.n
+
+    def primero(self):
+        return self.bloques[0][0]
+
+    def _bloque_de(self, orden):
+        """Índice del primer bloque cuyo último nodo tiene etiqueta >= orden."""
+        return bisect.bisect_left(self.bloques, orden, key=_orden_ultimo)
+
+    def agregar(self, n):
+        bloques = self.bloques
+        self.n += 1
+        if not bloques:
+            bloques.append([n])
+            return
+        b = self._bloque_de(n.orden)
+        if b == len(bloques):
+            b -= 1
+            bloque = bloques[b]
+            bloque.append(n)                 # Caso común: push_back
+        else:
+            bloque = bloques[b]
+            bisect.insort(bloque, n, key=_orden)
+        if len(bloque) > 2 * self.CARGA:
+            bloques.insert(b + 1, bloque[self.CARGA:])
+            del bloque[self.CARGA:]
+
+    def anteponer(self, nuevos):
+        """Agrega nodos (ya ordenados) que quedan antes de todos los actuales."""
+        c = self.CARGA
+        self.bloques[:0] = [nuevos[i:i + c] for i in range(0, len(nuevos), c)]
+        self.n += len(nuevos)
+
+    def quitar(self, n):
+        b = self._bloque_de(n.orden)
+        bloque = self.bloques[b]
+        del bloque[bisect.bisect_left(bloque, n.orden, key=_orden)]
+        if not bloque:
+            del self.bloques[b]
+        self.n -= 1
+
+class ListaDoble:
+    """
+    Implementa una lista doblemente ligada.
+
+    Modo indexado (indexada=True): diccionario valor -> nodos ordenados por
+    etiqueta de posición, como en el Ejercicio 2; remove_value deja de
+    recorrer la lista, aun con valores repetidos.
+    """
+    def __init__(self, indexada=False):
         self.head = None  
         self.tail = None  
+        self.indice = {} if indexada else None  # Diccionario: valor -> Ocurrencias
 
     # Inserción al inicio (push_front)
     # Complejidad: O(1)
     def push_front(self, x):
         n = Nodo(x)
+        if self.indice is not None:
+            n.orden = self.head.orden - SALTO if self.head else 0
+            self._indexar(n)
         n.next = self.head  
         
         if self.head: 
@@ -31,6 +114,9 @@ class ListaDoble:
     # Complejidad: O(1)
     def push_back(self, x):
         n = Nodo(x)
+        if self.indice is not None:
+            n.orden = self.tail.orden + SALTO if self.tail else 0
+            self._indexar(n)
         n.prev = self.tail  
         
         if self.tail: 
@@ -43,6 +129,9 @@ class ListaDoble:
 
     # Método find (asumido del Ejercicio 2)
     def find(self, v):
+        if self.indice is not None:
+            nodos = self.indice.get(v)
+            return nodos.primero() if nodos else None
         cur = self.head
         while cur:
             if cur.dato == v: return cur
@@ -52,6 +141,19 @@ class ListaDoble:
     # Métodos push_front, push_back y forward (asumidos de los ejercicios anteriores)
     # ...
 
+    # Modo indexado (asumido del Ejercicio 2)
+    def _indexar(self, n):
+        nodos = self.indice.get(n.dato)
+        if nodos is None:
+            nodos = self.indice[n.dato] = Ocurrencias()
+        nodos.agregar(n)
+
+    def _desindexar(self, n):
+        nodos = self.indice[n.dato]
+        nodos.quitar(n)
+        if not nodos:
+            del self.indice[n.dato]
+
     # ----------------------------------------------------
     # NUEVO MÉTODO 1: Desenlazar un nodo (remove_node) - Complejidad O(1)
     # ----------------------------------------------------
@@ -63,6 +165,10 @@ class ListaDoble:
         if not nodo: 
             return
 
+        # 0. En modo indexado, quitar el nodo del índice (O(log k) con k repeticiones)
+        if self.indice is not None:
+            self._desindexar(nodo)
+
         # 1. Ajustar el puntero 'next' del nodo PREVIO
         if nodo.prev: 
             # Si NO es la cabeza, el nodo previo apunta al sucesor del nodo a eliminar
@@ -91,7 +197,7 @@ class ListaDoble:
         """
         Busca y elimina la primera ocurrencia del valor 'v' de la lista.
         """
-        # 1. Búsqueda (O(n)): encontrar el nodo objetivo
+        # 1. Búsqueda (O(n), u O(1) en modo indexado): encontrar el nodo objetivo
         nodo_a_eliminar = self.find(v)
         
         # 2. Eliminación (O(1)): desenlazar el nodo (si existe)
@@ -162,4 +268,54 @@ ld.remove_value(20) # Queda [10]
 ld.remove_value(10) # Queda []
 
 print(f"Lista después de vaciarla: {ld.forward()} (¿Vacía? {'Sí' if ld.is_empty() else 'No'})")
-print("-" * 40)
\ No newline at end of file
+print("-" * 40)
+
+# --------------------------------------------------
+# PRUEBA 6: Modo indexado con duplicados
+# Esperado: [2, 1, 2] (se elimina el PRIMER 1)
+# --------------------------------------------------
+ldi = ListaDoble(indexada=True)
+for x in (1, 2, 1, 2):
+    ldi.push_back(x)
+ldi.remove_value(1)
+print(f"Lista indexada después de eliminar (1): {ldi.forward()} | Índice de 1: {len(ldi.indice[1])} nodo")
+print("-" * 40)
+
+# --------------------------------------------------
+# BENCHMARK: remove_value con búsqueda lineal contra modo indexado
+# --------------------------------------------------
+print("--- remove_value sobre valores aleatorios (µs por operación) ---")
+rnd = random.Random(21)
+for n in (100_000, 1_000_000):
+    valores = rnd.sample(range(n), 100)
+    tiempos = {}
+    for indexada in (False, True):
+        lista = ListaDoble(indexada)
+        for i in range(n):
+            lista.push_back(i)
+        inicio = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):  # remove_value imprime cada eliminación
+            for v in valores:
+                lista.remove_value(v)
+        tiempos[indexada] = (time.perf_counter() - inicio) / len(valores) * 1e6
+    print(f"  n={n:>9,}: lineal {tiempos[False]:10,.1f} µs | indexado {tiempos[True]:6.1f} µs")
+
+# --------------------------------------------------
+# BENCHMARK: valores repetidos (caso adverso para el índice)
+# --------------------------------------------------
+# Solo 10 valores distintos: cada uno tiene ~10,000 repeticiones y se elimina
+# siempre la primera, que en la lista está cerca del head.
+print("--- remove_value con 10 valores repetidos, n=100,000 (µs por operación) ---")
+n = 100_000
+valores = [rnd.randrange(10) for _ in range(5_000)]
+tiempos = {}
+for indexada in (False, True):
+    lista = ListaDoble(indexada)
+    for i in range(n):
+        lista.push_back(i % 10)
+    inicio = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for v in valores:
+            lista.remove_value(v)
+    tiempos[indexada] = (time.perf_counter() - inicio) / len(valores) * 1e6
+print(f"  lineal {tiempos[False]:10,.1f} µs | indexado {tiempos[True]:6.1f} µs")
\ No newline at end of file
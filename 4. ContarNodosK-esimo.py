@@ -1,15 +1,47 @@
 # Reutilizar las implementaciones de Nodo y ListaDoble con los métodos de inserción.
+#
+# Capa de saltos indexable: además de la lista base, algunos nodos (torres)
+# tienen enlaces "exprés" por nivel que guardan cuántas posiciones avanzan.
+# Bajando por esos enlaces se llega a cualquier posición en O(log n)
+# esperado, y el tamaño se mantiene en un contador, así len() es O(1).
+
+import contextlib
+import io
+import random
+import time
+
+P_NIVEL = 0.25   # Probabilidad de que una torre suba un nivel más
+MAX_NIVEL = 32
+
+_aleatorio = random.random
+
+def _altura_aleatoria():
+    h = 0
+    while h < MAX_NIVEL and _aleatorio() < P_NIVEL:
+        h += 1
+    return h
 
 class Nodo:
+    __slots__ = ("dato", "prev", "next", "sig_nivel", "ancho_nivel", "ant_nivel")
     def __init__(self, dato):
         self.dato = dato
         self.prev = None
         self.next = None
+        # Torre en la capa de saltos (None si el nodo solo vive en la lista base)
+        self.sig_nivel = None    # sig_nivel[j]: siguiente torre en el nivel j
+        self.ancho_nivel = None  # ancho_nivel[j]: posiciones que avanza ese enlace
+        self.ant_nivel = None    # ant_nivel[j]: torre anterior en el nivel j (None = head)
 
 class ListaDoble:
     def __init__(self):
         self.head = None
         self.tail = None
+        self.n = 0  # Tamaño mantenido en cada inserción y eliminación
+        # Enlaces del head por nivel. El ancho real del enlace j es
+        # _ancho_nivel[j] + _frente: push_front suma 1 a todos con un solo incremento.
+        self._sig_nivel = []
+        self._ancho_nivel = []
+        self._frente = 0
     
     # Métodos de inserción
     def push_front(self, x):
@@ -18,37 +50,192 @@ class ListaDoble:
         if self.head: self.head.prev = n
         else: self.tail = n
         self.head = n
+        self.n += 1
+        # Solo 1 de cada 4 nodos es torre; los demás solo recorren el head con _frente
+        if _aleatorio() < P_NIVEL: self._enlazar_niveles(n, None, 1 + _altura_aleatoria())
+        else: self._frente += 1
     def push_back(self, x):
         n = Nodo(x)
+        anterior = self.tail
         n.prev = self.tail
         if self.tail: self.tail.next = n
         else: self.head = n
         self.tail = n
+        self.n += 1
+        # Al final, un nodo sin torre no cambia ningún enlace de la capa de saltos
+        if _aleatorio() < P_NIVEL: self._enlazar_niveles(n, anterior, 1 + _altura_aleatoria(), True)
     def forward(self):
         cur, out = self.head, []
         while cur: out.append(cur.dato); cur = cur.next
         return out
+
+    # --- Capa de saltos (helpers) ---
+    def _ancho(self, torre, j):
+        """Ancho del enlace j que sale de 'torre' (None = head)."""
+        return self._ancho_nivel[j] + self._frente if torre is None else torre.ancho_nivel[j]
+
+    def _siguiente(self, torre, j):
+        return self._sig_nivel[j] if torre is None else torre.sig_nivel[j]
+
+    def _fijar(self, torre, j, sig, ancho):
+        """Hace que el enlace j de 'torre' apunte a sig (que puede ser None) con ese ancho."""
+        if torre is None:
+            self._sig_nivel[j] = sig
+            self._ancho_nivel[j] = ancho - self._frente
+        else:
+            torre.sig_nivel[j] = sig
+            torre.ancho_nivel[j] = ancho
+        if sig is not None: sig.ant_nivel[j] = torre
+
+    def _sumar_ancho(self, torre, j, delta):
+        if torre is None: self._ancho_nivel[j] += delta
+        else: torre.ancho_nivel[j] += delta
+
+    def _predecesores(self, nodo, niveles):
+        """
+        Para cada nivel j < niveles retorna (torre, d): la última torre de ese
+        nivel en o antes de 'nodo' (None = head) y a cuántas posiciones está de
+        'nodo'. Sube por los enlaces ant_nivel: O(log n) esperado.
+        """
+        res = []
+        if not niveles: return res
+        cur, d = nodo, 0
+        while cur is not None and cur.sig_nivel is None:
+            cur = cur.prev
+            d += 1
+        for j in range(niveles):
+            while cur is not None and len(cur.sig_nivel) <= j:
+                p = cur.ant_nivel[j - 1]
+                d += self._ancho(p, j - 1)
+                cur = p
+            res.append((cur, d))
+        return res
+
+    def _enlazar_niveles(self, nodo, anterior, h, al_final=False):
+        """
+        Registra en la capa de saltos, con altura h, un nodo ya enlazado justo
+        después de 'anterior' (None = al inicio).
+        """
+        if h:
+            nodo.sig_nivel, nodo.ancho_nivel, nodo.ant_nivel = [None] * h, [0] * h, [None] * h
+        L = len(self._sig_nivel)
+        if anterior is None:
+            # Al inicio: todas las posiciones se recorren 1 con un solo incremento de
+            # _frente; solo se tocan los h enlaces del head que ahora llegan al nodo
+            anchos = [self._ancho(None, j) for j in range(min(h, L))]
+            self._frente += 1
+            for j in range(h):
+                if j >= L:
+                    self._sig_nivel.append(None)
+                    self._ancho_nivel.append(0)
+                elif self._sig_nivel[j] is not None:
+                    self._fijar(nodo, j, self._sig_nivel[j], anchos[j])
+                self._fijar(None, j, nodo, 1)
+            return
+        # Al final ningún enlace arriba de h cruza al nodo nuevo: basta subir h niveles
+        preds = self._predecesores(anterior, h if al_final else max(L, h))
+        for j, (pred, d) in enumerate(preds):
+            if j >= len(self._sig_nivel):
+                self._sig_nivel.append(None)
+                self._ancho_nivel.append(0)
+            if j < h:
+                sig = self._siguiente(pred, j)
+                if sig is not None:
+                    self._fijar(nodo, j, sig, self._ancho(pred, j) - d)
+                self._fijar(pred, j, nodo, d + 1)
+            elif self._siguiente(pred, j) is not None:
+                self._sumar_ancho(pred, j, 1)
+
+    def _quitar_niveles(self, nodo):
+        """Quita de la capa de saltos un nodo que todavía está enlazado en la lista base."""
+        self.n -= 1
+        h = len(nodo.sig_nivel) if nodo.sig_nivel else 0
+        for j, (pred, d) in enumerate(self._predecesores(nodo.prev, len(self._sig_nivel))):
+            if j < h:
+                sig = nodo.sig_nivel[j]
+                ancho = self._ancho(pred, j) + nodo.ancho_nivel[j] - 1 if sig is not None else 0
+                self._fijar(pred, j, sig, ancho)
+            elif self._siguiente(pred, j) is not None:
+                self._sumar_ancho(pred, j, -1)
+        # Los niveles que quedaron vacíos se eliminan
+        while self._sig_nivel and self._sig_nivel[-1] is None:
+            self._sig_nivel.pop()
+            self._ancho_nivel.pop()
+        nodo.sig_nivel = nodo.ancho_nivel = nodo.ant_nivel = None
+
+    def _nodo_en(self, i):
+        """Nodo en la posición i (0 = head), bajando por la capa de saltos."""
+        objetivo = i + 1  # Posiciones desde 1; el head está en la posición 0
+        cur, pos = None, 0
+        for j in range(len(self._sig_nivel) - 1, -1, -1):
+            if cur is None:
+                # Todavía en el head: a lo más un salto por nivel desde aquí
+                sig = self._sig_nivel[j]
+                w = self._ancho_nivel[j] + self._frente
+                if sig is None or w > objetivo: continue
+                cur, pos = sig, w
+            while True:
+                sig = cur.sig_nivel[j]
+                if sig is None: break
+                w = cur.ancho_nivel[j]
+                if pos + w > objetivo: break
+                cur, pos = sig, pos + w
+        if cur is None:
+            cur, pos = self.head, 1
+        while pos < objetivo:
+            cur = cur.next
+            pos += 1
+        return cur
+
+    def _indice(self, i):
+        if i < 0: i += self.n
+        if not 0 <= i < self.n:
+            raise IndexError("Índice fuera del rango de la lista.")
+        return i
     
     # Métodos a probar
     def __len__(self):
-        cur, count = self.head, 0
-        while cur: count += 1; cur = cur.next
-        return count
+        # O(1): el tamaño se mantiene en cada operación
+        return self.n
+
+    def __getitem__(self, i):
+        """ld[i] en O(log n) esperado; acepta índices negativos."""
+        return self._nodo_en(self._indice(i)).dato
+
+    def insert_at(self, i, x):
+        """Inserta x para que quede en la posición i (como list.insert)."""
+        if i < 0: i = max(0, i + self.n)
+        if i == 0: return self.push_front(x)
+        if i >= self.n: return self.push_back(x)
+        anterior = self._nodo_en(i - 1)
+        n = Nodo(x)
+        n.prev, n.next = anterior, anterior.next
+        anterior.next.prev = n
+        anterior.next = n
+        self.n += 1
+        self._enlazar_niveles(n, anterior, _altura_aleatoria())
+
+    def pop_at(self, i=-1):
+        """Quita y retorna el dato de la posición i (como list.pop)."""
+        nodo = self._nodo_en(self._indice(i))
+        self._quitar_niveles(nodo)
+        if nodo.prev: nodo.prev.next = nodo.next
+        else: self.head = nodo.next
+        if nodo.next: nodo.next.prev = nodo.prev
+        else: self.tail = nodo.prev
+        nodo.prev = nodo.next = None
+        return nodo.dato
     
     def k_from_end(self, k):
         if k <= 0:
             print(f"  [ERROR]: k debe ser un valor positivo.")
             return None
             
-        cur = self.tail
-        i = 1 
-        while cur and i < k:
-            cur = cur.prev
-            i += 1
-            
-        if cur and i == k:
-            print(f"  [ÉXITO]: El {k}-ésimo desde el final es {cur.dato}.")
-            return cur.dato
+        # O(log n): el k-ésimo desde el final es la posición n - k
+        if k <= self.n:
+            dato = self._nodo_en(self.n - k).dato
+            print(f"  [ÉXITO]: El {k}-ésimo desde el final es {dato}.")
+            return dato
         else:
             print(f"  [AVISO]: La posición k={k} excede el tamaño de la lista ({len(self)}).")
             return None
@@ -96,4 +283,49 @@ ld.k_from_end(5)
 # --------------------------------------------------
 ld.k_from_end(6) 
 
-print("-" * 50)
\ No newline at end of file
+print("-" * 50)
+
+# --------------------------------------------------
+# PRUEBA (c): Acceso, inserción y extracción por posición
+# Esperado: ld[1] = 10, ld[-1] = 30; después [5, 10, 12, 15, 20, 30]; pop_at(0) = 5
+# --------------------------------------------------
+print(f"(c) ld[1]: {ld[1]} | ld[-1]: {ld[-1]}")
+ld.insert_at(2, 12)
+print(f"    Después de insert_at(2, 12): {ld.forward()} | len: {len(ld)}")
+print(f"    pop_at(0): {ld.pop_at(0)} | Lista: {ld.forward()} | len: {len(ld)}")
+print("-" * 50)
+
+# --------------------------------------------------
+# BENCHMARK: recorrido lineal contra capa de saltos (µs por operación)
+# --------------------------------------------------
+def k_from_end_lineal(lista, k):
+    cur, i = lista.tail, 1
+    while cur and i < k: cur = cur.prev; i += 1
+    return cur.dato
+
+def len_lineal(lista):
+    cur, count = lista.head, 0
+    while cur: count += 1; cur = cur.next
+    return count
+
+def medir(fn, args):
+    inicio = time.perf_counter()
+    for a in args: fn(a)
+    return (time.perf_counter() - inicio) / len(args) * 1e6
+
+rnd = random.Random(22)
+for n in (100_000, 1_000_000):
+    lista = ListaDoble()
+    inicio = time.perf_counter()
+    for i in range(n): lista.push_back(i)
+    push = (time.perf_counter() - inicio) / n * 1e6
+    ks = [rnd.randint(1, n) for _ in range(50)]
+    print(f"n={n:,} (push_back: {push:.2f} µs por nodo)")
+    print(f"  len():       lineal {medir(lambda _: len_lineal(lista), range(5)):10,.1f} µs | "
+          f"contador {medir(lambda _: len(lista), range(1000)):6.2f} µs")
+    with contextlib.redirect_stdout(io.StringIO()):  # k_from_end imprime el resultado
+        saltos = medir(lista.k_from_end, ks)
+    print(f"  k_from_end:  lineal {medir(lambda k: k_from_end_lineal(lista, k), ks):10,.1f} µs | "
+          f"saltos {saltos:8.2f} µs")
+    print(f"  insert_at:   {medir(lambda i: lista.insert_at(i, -1), ks):8.2f} µs | "
+          f"pop_at: {medir(lambda i: lista.pop_at(i - 1), ks):8.2f} µs")
\ No newline at end of file
@@ -2,6 +2,7 @@
 
 class Nodo:
     """Representa un nodo en la lista doblemente ligada."""
+    __slots__ = ("dato", "prev", "next")
     def __init__(self, dato):
         self.dato = dato
         self.prev = None  
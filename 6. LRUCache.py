@@ -1,25 +1,153 @@
+import os
+import pickle
+import queue
+import random
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+
 # -------------------------
 # CLASE DE NODO (Key-Value)
 # -------------------------
 
 class NodoKV:
     """Nodo especializado para la LRU, guarda llave (k) y valor (v)."""
+    __slots__ = ("k", "v", "prev", "next", "expira", "peso", "tags")  # Sin __dict__: la mayor parte del costo por entrada
     def __init__(self, k, v):
         self.k, self.v = k, v
         self.prev = None
         self.next = None
+        self.expira = None  # Instante (time.monotonic) en que caduca, None = nunca
+        self.peso = 0       # Peso de la entrada (solo en modo por peso)
+        self.tags = None    # Etiquetas para invalidación en bloque
+
+def peso_por_defecto(k, v):
+    """Peso aproximado en bytes de una entrada, basado en sys.getsizeof."""
+    return sys.getsizeof(k) + sys.getsizeof(v)
 
 # -------------------------
 # CLASE LRU CACHE
 # -------------------------
 
+def _despachar_avisos(cola, listeners):
+    """
+    Hilo de listeners: recibe lotes de expulsiones y llama a cada listener.
+    Un listener que falla se reporta y no detiene el hilo; None lo termina.
+    """
+    while True:
+        lote = cola.get()
+        try:
+            if lote is None:
+                return
+            for k, v, causa in lote:
+                for fn in listeners:
+                    try:
+                        fn(k, v, causa)
+                    except Exception as e:
+                        print(f"  [ERROR]: Listener {getattr(fn, '__name__', fn)} falló con la llave {k!r}: {e!r}")
+        finally:
+            # Siempre, para que esperar_avisos() no se quede bloqueado
+            cola.task_done()
+
 class LRU:
     """
     Implementación de LRU Cache usando un diccionario y una lista doble.
+
+    Cada entrada puede tener un TTL opcional. La expiración es perezosa en get()
+    y además una rueda de tiempo (timer wheel) permite purgar en lote las
+    entradas caducadas con costo O(1) amortizado por entrada.
+
+    Modo por peso: si se da 'max_weight', la capacidad se mide con
+    weigher(k, v) (por defecto en bytes con sys.getsizeof) en lugar de contar
+    entradas. 'cap' puede ser None para no limitar el número de entradas.
+
+    El camino caliente no imprime nada: las expulsiones se avisan a los
+    listeners registrados (key, value, causa) y los contadores se consultan
+    con stats().
+
+    Promoción en lote (opcional, apagada por defecto): con 'buffer_lecturas'
+    > 0 un hit no reordena la lista al momento; el nodo se anota en un buffer
+    que se vacía en orden (con _move_to_front) antes de cualquier escritura,
+    así que las expulsiones ven el orden LRU exacto. Si el buffer se llena
+    entre dos escrituras, cada get aplica solo las PASO_DRENADO promociones
+    más viejas, para que ninguna lectura pague el buffer completo. Conviene
+    cuando hay escrituras frecuentes (las lecturas entre ellas no mueven
+    nodos) o cuando la lista se protege con un lock; en un solo hilo con
+    puras lecturas cuesta lo mismo que la promoción inmediata.
+    'perdida' (0 a 1) es la fracción de hits que se permite no anotar cuando
+    se acepta un orden aproximado.
+
+    Etiquetas: put(k, v, tags=...) registra el nodo en un índice
+    etiqueta -> conjunto de nodos, así invalidate_tag(tag) cuesta O(entradas
+    con esa etiqueta). El índice se mantiene al día en cada expulsión.
+
+    Capacidad adaptable: resize(new_cap) cambia la capacidad (al reducir
+    expulsa la cola en bloque). Con 'tam_fantasmas' > 0 se recuerdan las
+    últimas llaves expulsadas (sin valor); un fallo sobre una de ellas es un
+    hit que una cache con tam_fantasmas lugares más habría tenido, lo que
+    estima la ganancia marginal de crecer. autoajustar() usa esa estimación.
+
+    Marcas de agua: 'cap' es la marca alta y 'marca_baja' la baja. Al rebasar
+    cap no se expulsa un solo nodo: se recorta la cola hasta marca_baja con un
+    solo empalme y se borran las llaves del mapa en lote, así una ráfaga de
+    inserciones paga una expulsión cada (cap - marca_baja) inserciones. Con
+    'avisos_en_hilo' los listeners de esos lotes corren en un hilo aparte,
+    que se crea con el primer lote (esperar_avisos() espera a que terminen y
+    cerrar() termina el hilo).
     """
-    def __init__(self, cap: int):
+    PASO_DRENADO = 4  # Promociones que aplica un get cuando el buffer está lleno
+
+    def __init__(self, cap: int, resolucion: float = 1.0, max_weight: int = None, weigher=None,
+                 buffer_lecturas: int = 0, perdida: float = 0.0, tam_fantasmas: int = 0,
+                 marca_baja: int = None, avisos_en_hilo: bool = False):
+        if marca_baja is not None and (cap is None or not 0 <= marca_baja <= cap):
+            raise ValueError("marca_baja debe estar entre 0 y cap.")
         self.cap = cap
+        self.marca_baja = marca_baja  # None = recortar solo hasta cap (un nodo a la vez)
         self.map = {}  # Diccionario: key -> NodoKV
+
+        # Presupuesto por peso; peso_actual se mantiene al día para leerlo en O(1)
+        self.max_weight = max_weight
+        self.weigher = weigher or peso_por_defecto
+        self.peso_actual = 0
+
+        # Rueda de tiempo: slot -> lista de nodos que caducan dentro de ese slot
+        self.resolucion = resolucion
+        self.rueda = {}
+        self._ultimo_slot = int(time.monotonic() // resolucion)
+
+        # Contadores separados para ajustar TTL y capacidad por separado
+        self.expirados = 0
+        self.expulsados = 0
+        self.hits = 0
+        self.misses = 0
+        self.inserciones = 0
+        self.actualizaciones = 0
+
+        # Funciones (key, value, causa) a llamar en cada expulsión
+        self._listeners = []
+        # Cola de lotes de avisos e hilo de listeners; se crean con el primer lote
+        self.avisos_en_hilo = avisos_en_hilo
+        self._avisos = None
+        self._hilo_avisos = None
+
+        # Índice de etiquetas: tag -> set de NodoKV
+        self.etiquetas = {}
+        self.invalidados = 0
+
+        # Buffer de hits pendientes de promover (None = promoción inmediata)
+        self.tam_buffer = buffer_lecturas
+        self.perdida = perdida
+        self._buffer = deque() if buffer_lecturas > 0 else None
+
+        # Lista fantasma acotada: llaves expulsadas recientemente (dict en orden de inserción)
+        self.tam_fantasmas = tam_fantasmas
+        self.fantasmas = {}
+        self.aciertos_fantasma = 0
+        self._ventana = (0, 0)  # (consultas, aciertos_fantasma) en el último autoajuste
+        self._piso = 1          # autoajustar no reduce por debajo de esto (ya resultó chica)
         
         # Nodos centinela (dummy nodes) para head y tail
         # Simplifican las operaciones _add_front y _remove
@@ -46,91 +174,781 @@ class LRU:
         # Opcional: limpiar punteros del nodo
         n.prev = n.next = None
 
+    def _add_back(self, n: NodoKV):
+        """Añade un nodo inmediatamente antes del tail (LRU)."""
+        n.next = self.tail
+        n.prev = self.tail.prev
+        self.tail.prev.next = n
+        self.tail.prev = n
+
     def _move_to_front(self, n: NodoKV):
         """Mueve un nodo existente a la posición MRU."""
         self._remove(n)
         self._add_front(n)
 
+    def _drenar(self, limite: int = None):
+        """
+        Aplica en orden las promociones pendientes del buffer de lecturas:
+        todas, o solo las 'limite' más viejas.
+        """
+        buffer = self._buffer
+        if not buffer:
+            return
+        if limite is None or limite >= len(buffer):
+            for n in buffer:
+                # Un nodo que ya salió de la lista (expulsado o expirado) tiene prev = None
+                if n.prev is not None:
+                    self._move_to_front(n)
+            buffer.clear()
+            return
+        for _ in range(limite):
+            n = buffer.popleft()
+            if n.prev is not None:
+                self._move_to_front(n)
+
+    def _excedida(self) -> bool:
+        """Indica si se rebasó el número de entradas o el presupuesto de peso."""
+        if self.cap is not None and len(self.map) > self.cap:
+            return True
+        return self.max_weight is not None and self.peso_actual > self.max_weight
+
     def _evict_lru(self):
-        """Expulsa el nodo LRU (el que está justo antes del tail) si la capacidad se excede."""
-        # El nodo LRU es el penúltimo nodo (self.tail.prev)
-        lru_node = self.tail.prev
-        
-        # Verificar que no estemos intentando borrar el head centinela (solo pasa si la lista está vacía)
-        if lru_node is self.head: 
-            return # Lista vacía, nada que borrar
+        """Expulsa nodos LRU (los que están justo antes del tail) mientras la capacidad se exceda."""
+        # Marca alta rebasada: se recorta la cola hasta la marca baja en un solo empalme
+        if self.cap is not None and len(self.map) > self.cap:
+            objetivo = self.cap if self.marca_baja is None else self.marca_baja
+            self._recortar_cola(len(self.map) - objetivo)
 
-        self._remove(lru_node)
-        # Eliminar también del mapa para liberar memoria
-        del self.map[lru_node.k]
-        
-        print(f"  [EVICT]: Expulsado el LRU (key: {lru_node.k}, value: {lru_node.v}).")
+        # Presupuesto de peso: nodo por nodo, porque no se sabe cuántos hay que sacar
+        while self._excedida():
+            if not self._recortar_cola(1):
+                return  # Lista vacía, nada que borrar
+
+    # --- CAPACIDAD ADAPTABLE (resize y lista fantasma) ---
+
+    def _recordar(self, k):
+        """Agrega k a la lista fantasma y olvida la más vieja si se llena."""
+        fantasmas = self.fantasmas
+        fantasmas.pop(k, None)  # Si ya estaba, pasa al final como la más reciente
+        fantasmas[k] = None
+        if len(fantasmas) > self.tam_fantasmas:
+            del fantasmas[next(iter(fantasmas))]
+
+    def _fallo(self, k):
+        """Registra un fallo; si k está en la lista fantasma cuenta como acierto fantasma."""
+        self.misses += 1
+        if self.fantasmas and self.fantasmas.pop(k, 0) is None:
+            self.aciertos_fantasma += 1
+
+    def _recortar_cola(self, cuantos: int, causa: str = "capacidad") -> int:
+        """
+        Desenlaza de una sola vez los 'cuantos' nodos del final (LRU) con un
+        único empalme de punteros y después limpia el mapa en lote.
+        """
+        victimas = []
+        corte = self.tail.prev
+        while len(victimas) < cuantos and corte is not self.head:
+            victimas.append(corte)
+            corte = corte.prev
+        if not victimas:
+            return 0
+        # Empalme: el nuevo LRU queda pegado al tail
+        corte.next = self.tail
+        self.tail.prev = corte
+
+        mapa = self.map
+        for n in victimas:
+            n.prev = n.next = None
+            del mapa[n.k]
+            self.peso_actual -= n.peso
+            if n.tags:
+                self._desindexar(n)
+            if self.tam_fantasmas:
+                self._recordar(n.k)
+        self.expulsados += len(victimas)
+
+        # Sin listeners registrados esto es solo una comprobación de lista vacía
+        if self._listeners:
+            if self.avisos_en_hilo:
+                self._encolar_avisos([(n.k, n.v, causa) for n in victimas])
+            else:
+                for n in victimas:
+                    self._notificar(n.k, n.v, causa)
+        return len(victimas)
+
+    def resize(self, new_cap: int) -> int:
+        """Cambia la capacidad. Al reducir, expulsa la cola en bloque. Retorna cuántas expulsó."""
+        if new_cap <= 0:
+            raise ValueError("La capacidad debe ser un número positivo.")
+        if self._buffer:
+            self._drenar()
+        if self.cap is None or new_cap > self.cap:
+            # Las llaves fantasma ya caben en la cache: volverlas a pedir no
+            # diría nada sobre crecer otra vez
+            self.fantasmas.clear()
+        self.cap = new_cap
+        self._piso = 1
+        if self.marca_baja is not None and self.marca_baja > new_cap:
+            self.marca_baja = new_cap
+        sobrantes = len(self.map) - new_cap
+        expulsadas = self._recortar_cola(sobrantes) if sobrantes > 0 else 0
+        if self._excedida():
+            self._evict_lru()  # Todavía excede el presupuesto de peso
+        return expulsadas
+
+    def ganancia_marginal(self) -> float:
+        """Fracción de consultas que serían hits con tam_fantasmas lugares más."""
+        consultas = self.hits + self.misses
+        return self.aciertos_fantasma / consultas if consultas else 0.0
+
+    def _bytes_por_entrada(self, muestra: int = 32) -> float:
+        """Estima la memoria por entrada (nodo + llave + valor) con una muestra desde el MRU."""
+        n, total, vistos = self.head.next, 0, 0
+        while n is not self.tail and vistos < muestra:
+            total += sys.getsizeof(n) + peso_por_defecto(n.k, n.v)
+            vistos += 1
+            n = n.next
+        return total / vistos if vistos else 0.0
+
+    def autoajustar(self, presupuesto_bytes: int, umbral: float = 0.01) -> int:
+        """
+        Ajusta la capacidad dentro de 'presupuesto_bytes' según lo observado
+        desde la llamada anterior: si los aciertos fantasma llegan a 'umbral'
+        crece en tam_fantasmas lugares; si no llegan ni a umbral / 4, la
+        capacidad extra no está sirviendo y reduce tam_fantasmas // 2 lugares,
+        sin bajar de una capacidad que ya resultó insuficiente. Si la memoria
+        estimada excede el presupuesto, reduce hasta caber. En modo por peso
+        sin 'cap' se toma como capacidad el número actual de entradas.
+        Retorna la nueva capacidad.
+        """
+        if not self.tam_fantasmas:
+            raise ValueError("autoajustar necesita tam_fantasmas > 0.")
+        consultas, fantasma = self.hits + self.misses, self.aciertos_fantasma
+        consultas_0, fantasma_0 = self._ventana
+        self._ventana = (consultas, fantasma)
+
+        actual = self.cap if self.cap is not None else max(1, len(self.map))
+        por_entrada = self._bytes_por_entrada()
+        limite = int(presupuesto_bytes // por_entrada) if por_entrada else actual
+        nueva = actual
+        piso = self._piso
+        if consultas > consultas_0:  # Sin consultas nuevas no hay con qué decidir
+            ganancia = (fantasma - fantasma_0) / (consultas - consultas_0)
+            if ganancia >= umbral:
+                piso = actual + 1
+                nueva = actual + self.tam_fantasmas
+            elif ganancia < umbral / 4:
+                nueva = max(piso, actual - max(1, self.tam_fantasmas // 2))
+        nueva = max(1, min(nueva, limite))
+        if nueva != self.cap:
+            self.resize(nueva)
+        self._piso = min(piso, nueva)
+        return self.cap
+
+    # --- LISTENERS Y ESTADÍSTICAS ---
+
+    def agregar_listener(self, fn):
+        """Registra fn(key, value, causa); causa es "capacidad", "expirado" o "invalidado"."""
+        self._listeners.append(fn)
+
+    def quitar_listener(self, fn):
+        self._listeners.remove(fn)
+
+    def _notificar(self, k, v, causa):
+        for fn in self._listeners:
+            fn(k, v, causa)
+
+    def _encolar_avisos(self, lote):
+        """Manda un lote al hilo de listeners, creándolo si todavía no existe."""
+        if self._hilo_avisos is None:
+            self._avisos = queue.Queue()
+            self._hilo_avisos = threading.Thread(target=_despachar_avisos,
+                                                 args=(self._avisos, self._listeners), daemon=True)
+            self._hilo_avisos.start()
+        self._avisos.put(lote)
+
+    def esperar_avisos(self):
+        """Bloquea hasta que el hilo de listeners procese todos los lotes pendientes."""
+        if self._avisos is not None:
+            self._avisos.join()
+
+    def cerrar(self):
+        """Termina el hilo de listeners (si existe) después de avisar los lotes pendientes."""
+        hilo = self._hilo_avisos
+        if hilo is not None:
+            self._hilo_avisos = None
+            self._avisos.put(None)
+            hilo.join()
+
+    def stats(self) -> dict:
+        """Contadores de uso de la cache y tasa de aciertos."""
+        consultas = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "inserts": self.inserciones,
+            "updates": self.actualizaciones,
+            "evictions": self.expulsados,
+            "expirations": self.expirados,
+            "invalidations": self.invalidados,
+            "hit_ratio": self.hits / consultas if consultas else 0.0,
+        }
+
+    # --- ÍNDICE DE ETIQUETAS ---
+
+    def _indexar(self, n: NodoKV, tags):
+        """Reemplaza las etiquetas del nodo y lo registra en el índice."""
+        if n.tags:
+            self._desindexar(n)
+        n.tags = tuple(tags) if tags else None
+        if n.tags:
+            for tag in n.tags:
+                self.etiquetas.setdefault(tag, set()).add(n)
+
+    def _desindexar(self, n: NodoKV):
+        """Quita el nodo del índice de cada una de sus etiquetas."""
+        for tag in n.tags:
+            nodos = self.etiquetas.get(tag)
+            if nodos is not None:
+                nodos.discard(n)
+                if not nodos:
+                    del self.etiquetas[tag]
+        n.tags = None
+
+    def invalidate_tag(self, tag) -> int:
+        """Elimina todas las entradas con la etiqueta 'tag'. Retorna cuántas fueron."""
+        nodos = self.etiquetas.pop(tag, None)
+        if not nodos:
+            return 0
+        for n in nodos:
+            self._remove(n)
+            del self.map[n.k]
+            self.peso_actual -= n.peso
+            # Sus otras etiquetas (la actual ya salió del índice)
+            n.tags = tuple(t for t in n.tags if t != tag)
+            if n.tags:
+                self._desindexar(n)
+            if self._listeners:
+                self._notificar(n.k, n.v, "invalidado")
+        self.invalidados += len(nodos)
+        return len(nodos)
+
+    # --- HELPERS DE EXPIRACIÓN (TTL) ---
+
+    def _expirar(self, n: NodoKV):
+        """Quita un nodo caducado de la lista y del mapa."""
+        self._remove(n)
+        del self.map[n.k]
+        self.peso_actual -= n.peso
+        if n.tags:
+            self._desindexar(n)
+        self.expirados += 1
+        if self._listeners:
+            self._notificar(n.k, n.v, "expirado")
+
+    def _programar(self, n: NodoKV, ttl: float):
+        """Fija la expiración del nodo y lo registra en su slot de la rueda."""
+        n.expira = time.monotonic() + ttl
+        # Techo de la división: todo nodo del slot s caduca a más tardar en s * resolucion
+        slot = -int(-n.expira // self.resolucion)
+        self.rueda.setdefault(slot, []).append(n)
+
+    def purgar_expirados(self) -> int:
+        """
+        Barre los slots de la rueda que ya vencieron y elimina en lote sus nodos.
+        Cada nodo se visita una sola vez, así que el costo es O(1) amortizado.
+        Retorna cuántas entradas se eliminaron.
+        """
+        ahora = time.monotonic()
+        actual = int(ahora // self.resolucion)
+        if actual <= self._ultimo_slot:
+            return 0
+
+        # Si pasó mucho tiempo, recorrer solo los slots ocupados
+        if actual - self._ultimo_slot > len(self.rueda):
+            vencidos = [s for s in self.rueda if s <= actual]
+        else:
+            vencidos = range(self._ultimo_slot + 1, actual + 1)
+        self._ultimo_slot = actual
+
+        purgados = 0
+        for slot in vencidos:
+            for n in self.rueda.pop(slot, ()):
+                # Ignorar entradas obsoletas (nodo ya expulsado o con TTL renovado)
+                if self.map.get(n.k) is n and n.expira is not None and n.expira <= ahora:
+                    self._expirar(n)
+                    purgados += 1
+        return purgados
 
     # --- API (Operaciones de la Cache en O(1)) ---
 
     def get(self, k: int) -> int:
         """Obtiene el valor de la clave. Si existe, lo mueve a MRU."""
-        if k not in self.map:
-            print(f"  [GET]: Key {k} no encontrada.")
+        n = self.map.get(k)
+        if n is None:
+            self._fallo(k)
             return -1
         
-        n = self.map[k]
-        # Actualizar uso: mover a la cabeza (MRU)
-        self._move_to_front(n)
-        print(f"  [GET]: Key {k} -> {n.v}. Movido a MRU.")
+        # Expiración perezosa: si ya caducó, se elimina y cuenta como fallo
+        if n.expira is not None and n.expira <= time.monotonic():
+            self._expirar(n)
+            self._fallo(k)
+            return -1
+
+        # Actualizar uso: mover a la cabeza (MRU), o anotarlo en el buffer
+        buffer = self._buffer
+        if buffer is None:
+            self._move_to_front(n)
+        elif not self.perdida or random.random() >= self.perdida:
+            buffer.append(n)
+            if len(buffer) >= self.tam_buffer:
+                self._drenar(self.PASO_DRENADO)  # Trabajo acotado por lectura
+        self.hits += 1
         return n.v
 
-    def put(self, k: int, v: int):
-        """Inserta o actualiza un valor. Si se inserta, verifica capacidad."""
+    def put(self, k: int, v: int, ttl: float = None, tags=None):
+        """
+        Inserta o actualiza un valor. Si se inserta, verifica capacidad.
+        'ttl' (segundos) es opcional; sin él la entrada no caduca.
+        'tags' (iterable) reemplaza las etiquetas de la entrada; sin 'tags' una
+        actualización conserva las que tenía, y tags=() las quita.
+        """
+        # Las escrituras toman el camino lento: primero aplicar las promociones pendientes
+        if self._buffer:
+            self._drenar()
+
+        # Aprovechar la escritura para barrer los slots vencidos (O(1) si no hay)
+        self.purgar_expirados()
+
+        # En modo por peso se calcula el peso de la nueva entrada
+        peso = self.weigher(k, v) if self.max_weight is not None else 0
+
         if k in self.map:
             # Caso 1: Actualizar (Hit)
             n = self.map[k]
             n.v = v
+            self.peso_actual += peso - n.peso
+            n.peso = peso
             self._move_to_front(n) # Mover a MRU
-            print(f"  [PUT]: Key {k} actualizada a {v}. Movido a MRU.")
+            self.actualizaciones += 1
         else:
             # Caso 2: Insertar nuevo (Miss)
             n = NodoKV(k, v)
+            n.peso = peso
             self.map[k] = n
+            self.peso_actual += peso
             self._add_front(n) # Añadir a MRU
-            print(f"  [PUT]: Key {k} insertada con valor {v}.")
+            self.inserciones += 1
+
+        if tags is not None:
+            self._indexar(n, tags)
             
-            # Verificar capacidad y expulsar si es necesario
-            if len(self.map) > self.cap:
-                self._evict_lru()
-                
+        # Verificar capacidad (o peso) y expulsar si es necesario
+        if self._excedida():
+            self._evict_lru()
+
+        # Programar (o quitar) la expiración de la entrada
+        if ttl is None:
+            n.expira = None
+        else:
+            self._programar(n, ttl)
+
+    # --- API EN LOTE ---
+
+    def get_many(self, keys):
+        """
+        Busca varias claves en una sola pasada (sin una llamada a get por clave).
+        Retorna (encontrados, faltantes): un dict key -> valor con los hits y
+        la lista de claves que faltan, lista para pasársela al loader.
+        """
+        if self._buffer:
+            self._drenar()
+        mapa, head = self.map, self.head
+        ahora = time.monotonic()
+        encontrados, faltantes = {}, []
+        hits = 0
+        for k in keys:
+            n = mapa.get(k)
+            if n is not None and n.expira is not None and n.expira <= ahora:
+                self._expirar(n)
+                n = None
+            if n is None:
+                faltantes.append(k)
+                continue
+            # _move_to_front en línea
+            if head.next is not n:
+                n.prev.next = n.next
+                n.next.prev = n.prev
+                n.prev = head
+                n.next = head.next
+                head.next.prev = n
+                head.next = n
+            encontrados[k] = n.v
+            hits += 1
+        self.hits += hits
+        if self.fantasmas:
+            for k in faltantes:
+                self._fallo(k)
+        else:
+            self.misses += len(faltantes)
+        return encontrados, faltantes
+
+    def put_many(self, items, ttl: float = None, tags=None):
+        """
+        Inserta o actualiza varios pares (key, value) (o un dict) en una sola
+        pasada. La expulsión se hace una sola vez al final del lote.
+        'ttl' y 'tags' se aplican a todas las entradas del lote (sin 'tags' cada
+        entrada conserva sus etiquetas, como en put).
+        """
+        if self._buffer:
+            self._drenar()
+        self.purgar_expirados()
+        if isinstance(items, dict):
+            items = items.items()
+        mapa, head = self.map, self.head
+        pesar = self.weigher if self.max_weight is not None else None
+        for k, v in items:
+            peso = pesar(k, v) if pesar else 0
+            n = mapa.get(k)
+            if n is not None:
+                n.v = v
+                self.peso_actual += peso - n.peso
+                n.peso = peso
+                if head.next is not n:
+                    n.prev.next = n.next
+                    n.next.prev = n.prev
+                    n.prev = head
+                    n.next = head.next
+                    head.next.prev = n
+                    head.next = n
+                self.actualizaciones += 1
+            else:
+                n = NodoKV(k, v)
+                n.peso = peso
+                mapa[k] = n
+                self.peso_actual += peso
+                n.prev = head
+                n.next = head.next
+                head.next.prev = n
+                head.next = n
+                self.inserciones += 1
+            if tags is not None:
+                self._indexar(n, tags)
+            if ttl is None:
+                n.expira = None
+            else:
+                self._programar(n, ttl)
+
+        # Una sola expulsión (en bloque) para todo el lote
+        if self._excedida():
+            self._evict_lru()
+
+
+    # --- SNAPSHOT (arranque en caliente) ---
+
+    FIRMA = b"LRUKV2\n"  # v2: la expiración es absoluta (time.time), no el TTL restante
+
+    def dump(self, path):
+        """
+        Guarda las entradas en orden MRU -> LRU en un archivo binario.
+        Cada entrada es un pickle (key, value, caduca, tags) escrito en flujo,
+        así no se arma todo el contenido en memoria. 'caduca' es el instante
+        de reloj de pared (time.time) en que expira, porque time.monotonic no
+        se puede comparar entre procesos. Se escribe a un archivo temporal y
+        se renombra, para no dejar un snapshot a medias.
+        """
+        if self._buffer:
+            self._drenar()
+        ahora = time.monotonic()
+        reloj = time.time()
+        temporal = f"{path}.tmp"
+        with open(temporal, "wb") as f:
+            f.write(self.FIRMA)
+            pickler = pickle.Pickler(f, protocol=pickle.HIGHEST_PROTOCOL)
+            n = self.head.next
+            while n is not self.tail:
+                if n.expira is None:
+                    pickler.dump((n.k, n.v, None, n.tags))
+                elif n.expira > ahora:
+                    pickler.dump((n.k, n.v, reloj + (n.expira - ahora), n.tags))
+                pickler.clear_memo()
+                n = n.next
+        os.replace(temporal, path)
+
+    def load(self, path) -> int:
+        """
+        Carga un snapshot leyendo entrada por entrada y armando la cadena de
+        NodoKV en una pasada (cada entrada va al final, detrás de las más
+        recientes). Deja de leer en cuanto se llena la capacidad (o el peso),
+        por lo que solo se conservan las entradas más recientes. Las claves
+        que ya están en la cache se respetan, y las que caducaron mientras el
+        snapshot estaba guardado se omiten. Retorna cuántas se cargaron.
+        """
+        if self._buffer:
+            self._drenar()
+        cargadas = 0
+        with open(path, "rb") as f:
+            if f.read(len(self.FIRMA)) != self.FIRMA:
+                raise ValueError(f"{path} no es un snapshot de LRU.")
+            unpickler = pickle.Unpickler(f)
+            while self.cap is None or len(self.map) < self.cap:
+                try:
+                    k, v, caduca, tags = unpickler.load()
+                except EOFError:
+                    break
+                if k in self.map:
+                    continue
+                # Solo se programa el tiempo que le queda
+                ttl = None if caduca is None else caduca - time.time()
+                if ttl is not None and ttl <= 0:
+                    continue
+                peso = self.weigher(k, v) if self.max_weight is not None else 0
+                if self.max_weight is not None and self.peso_actual + peso > self.max_weight:
+                    break
+                n = NodoKV(k, v)
+                n.peso = peso
+                self.map[k] = n
+                self.peso_actual += peso
+                self._add_back(n)
+                if tags:
+                    self._indexar(n, tags)
+                if ttl is not None:
+                    self._programar(n, ttl)
+                cargadas += 1
+        return cargadas
+
 # -------------------------
-# DEMOSTRACIÓN DE LA CACHE
+# DEMOSTRACIONES (solo al ejecutar este archivo)
 # -------------------------
 
-# Crear una caché con capacidad 2
-cache = LRU(2)
-print("--- Inicializando LRU Cache con capacidad 2 ---")
+if __name__ == "__main__":
+    # -------------------------
+    # DEMOSTRACIÓN DE LA CACHE
+    # -------------------------
+
+    def imprimir_expulsion(k, v, causa):
+        """Listener de ejemplo: reporta cada expulsión fuera del camino caliente."""
+        print(f"  [EVICT]: Expulsado (key: {k}, value: {v}, causa: {causa}).")
+
+    # Crear una caché con capacidad 2
+    cache = LRU(2)
+    cache.agregar_listener(imprimir_expulsion)
+    print("--- Inicializando LRU Cache con capacidad 2 ---")
+
+    # 1. put(1, 10) -> {1:10} (MRU: 1)
+    cache.put(1, 10)    
+
+    # 2. put(2, 20) -> {1:10, 2:20} (MRU: 2)
+    cache.put(2, 20)    
+
+    print("\n--- Estado Actual: {1:10, 2:20} --- (LRU: 1)")
+
+    # 3. get(1) -> 10. Actualiza el uso. (MRU: 1)
+    print(f"Resultado get(1): {cache.get(1)}") 
+    # Nueva secuencia de uso: 1 (MRU), 2 (LRU)
+
+    # 4. put(3, 30). Capacidad excedida. Expulsa LRU (2).
+    cache.put(3, 30)    
+    # Nuevo estado: {1:10, 3:30} (LRU: 2 fue expulsado, LRU actual: 1)
+
+    # 5. get(2) -> -1. (Fue expulsado)
+    print(f"Resultado get(2): {cache.get(2)}") 
+
+    # 6. put(4, 40). Capacidad excedida. Expulsa LRU (1).
+    cache.put(4, 40)    
+    # Nuevo estado: {3:30, 4:40} (1 fue expulsado, LRU actual: 3)
+
+    print("\n--- Pruebas Finales ---")
+    print(f"Resultado get(1): {cache.get(1)}") # -1 (Expulsado)
+    print(f"Resultado get(3): {cache.get(3)}") # 30. Mueve 3 a MRU.
+    print(f"Resultado get(4): {cache.get(4)}") # 40. Mueve 4 a MRU.
+    print(f"Estadísticas: {cache.stats()}")
+
+    # -------------------------
+    # DEMOSTRACIÓN DE TTL
+    # -------------------------
+
+    print("\n--- TTL: caché con capacidad 3 y resolución de 0.1 s ---")
+    cache_ttl = LRU(3, resolucion=0.1)
+    cache_ttl.agregar_listener(imprimir_expulsion)
+    cache_ttl.put(1, 10, ttl=0.2)   # Caduca pronto
+    cache_ttl.put(2, 20, ttl=0.2)   # Caduca pronto
+    cache_ttl.put(3, 30)            # Sin TTL
+    time.sleep(0.35)
+
+    # Expiración perezosa en get
+    print(f"Resultado get(1): {cache_ttl.get(1)}") # -1 (Expirada)
+
+    # El siguiente put barre la rueda y elimina la key 2 en lote
+    cache_ttl.put(4, 40)
+    print(f"Resultado get(3): {cache_ttl.get(3)}") # 30 (No caduca)
+    print(f"Expiradas: {cache_ttl.expirados} | Expulsadas por capacidad: {cache_ttl.expulsados}") # 2 | 0
+
+    # -------------------------
+    # DEMOSTRACIÓN DEL MODO POR PESO
+    # -------------------------
+
+    print("\n--- Peso: presupuesto de 10 unidades, peso = len(valor) ---")
+    cache_peso = LRU(None, max_weight=10, weigher=lambda k, v: len(v))
+    cache_peso.agregar_listener(imprimir_expulsion)
+    cache_peso.put("a", "xxxx")      # peso 4
+    cache_peso.put("b", "xxxx")      # peso 4 (total 8)
+    cache_peso.put("c", "xxxxxxx")   # peso 7 (total 15) -> expulsa "a" y "b"
+    print(f"Peso actual: {cache_peso.peso_actual} | Entradas: {len(cache_peso.map)}") # 7 | 1
+
+    # -------------------------
+    # DEMOSTRACIÓN DE LA API EN LOTE
+    # -------------------------
+
+    print("\n--- Lote: caché con capacidad 3 ---")
+    cache_lote = LRU(3)
+    cache_lote.put_many({1: 10, 2: 20, 3: 30, 4: 40})   # Una sola expulsión al final (key 1)
+    encontrados, faltantes = cache_lote.get_many([1, 2, 3, 5])
+    print(f"Encontrados: {encontrados} | Faltantes: {faltantes}") # {2: 20, 3: 30} | [1, 5]
+
+    # -------------------------
+    # DEMOSTRACIÓN DEL SNAPSHOT
+    # -------------------------
+
+    print("\n--- Snapshot: guardar una caché de 4 y cargarla en una de 2 ---")
+    ruta = os.path.join(tempfile.gettempdir(), "lru_snapshot.bin")
+    origen = LRU(4)
+    origen.put_many([(1, 10), (2, 20), (3, 30), (4, 40)])   # MRU -> LRU: 4, 3, 2, 1
+    origen.dump(ruta)
+    destino = LRU(2)
+    print(f"Entradas cargadas: {destino.load(ruta)}")           # 2 (las más recientes)
+    print(f"Resultado get(4): {destino.get(4)} | get(1): {destino.get(1)}") # 40 | -1
+
+    # La expiración se guarda en tiempo absoluto: lo que caduca entre dump y load no se carga
+    origen = LRU(4)
+    origen.put(1, 10, ttl=0.2)
+    origen.put(2, 20)
+    origen.dump(ruta)
+    time.sleep(0.3)
+    destino = LRU(4)
+    print(f"Cargadas tras 0.3 s: {destino.load(ruta)} | get(1): {destino.get(1)} | get(2): {destino.get(2)}") # 1 | -1 | 20
+    os.remove(ruta)
+
+    # -------------------------
+    # DEMOSTRACIÓN DE LA PROMOCIÓN EN LOTE
+    # -------------------------
+
+    print("\n--- Buffer de lecturas: caché con capacidad 2, buffer de 8 hits ---")
+    cache_buf = LRU(2, buffer_lecturas=8)
+    cache_buf.put(1, 10)
+    cache_buf.put(2, 20)
+    cache_buf.get(1)        # Solo se anota; 1 sigue siendo el LRU en la lista
+    cache_buf.put(3, 30)    # Antes de escribir se drena el buffer: expulsa 2, igual que sin buffer
+    print(f"Resultado get(1): {cache_buf.get(1)} | get(2): {cache_buf.get(2)}") # 10 | -1
+
+    # Latencia de cada get (ns) con llaves tipo Zipf. Con escrituras frecuentes
+    # las lecturas entre ellas solo anotan el nodo; con puras lecturas el buffer
+    # se llena y cada get paga a lo más PASO_DRENADO promociones.
+    print("\n--- Latencia de get: cap=10,000, 200,000 accesos (ns) ---")
+    rnd_buf = random.Random(16)
+    traza = [min(int(rnd_buf.paretovariate(1.1)), 20_000) for _ in range(200_000)]
+    for nombre_carga, p_escritura in (("solo lecturas", 0.0), ("95% lecturas", 0.05)):
+        for nombre, tam in (("inmediata", 0), ("buffer 64", 64)):
+            cache_lat = LRU(10_000, buffer_lecturas=tam)
+            for k in reversed(range(20_000)):    # Las llaves más usadas quedan en la cache
+                cache_lat.put(k, k)
+            escribir = random.Random(1).random
+            reloj = time.perf_counter_ns
+            latencias = []
+            for k in traza:
+                if escribir() < p_escritura:
+                    cache_lat.put(k, k)
+                    continue
+                inicio = reloj()
+                cache_lat.get(k)
+                latencias.append(reloj() - inicio)
+            latencias.sort()
+            media = sum(latencias) / len(latencias)
+            p50 = latencias[len(latencias) // 2]
+            p99 = latencias[int(len(latencias) * 0.99)]
+            print(f"  {nombre_carga:<13} {nombre:<9}: media {media:6.0f} | p50 {p50:6,} | p99 {p99:6,}")
+
+    # -------------------------
+    # DEMOSTRACIÓN DE ETIQUETAS
+    # -------------------------
+
+    print("\n--- Etiquetas: invalidar todo lo derivado del usuario 7 ---")
+    cache_tags = LRU(10)
+    cache_tags.put("perfil:7", "...", tags=["usuario:7"])
+    cache_tags.put("feed:7", "...", tags=["usuario:7", "feeds"])
+    cache_tags.put("feed:8", "...", tags=["usuario:8", "feeds"])
+    print(f"Invalidadas: {cache_tags.invalidate_tag('usuario:7')}")                 # 2
+    print(f"Quedan: {list(cache_tags.map)} | Etiqueta 'feeds': {len(cache_tags.etiquetas['feeds'])}") # ['feed:8'] | 1
+    cache_tags.put("feed:8", "nuevo")            # Actualizar sin tags conserva sus etiquetas
+    print(f"Invalidadas tras actualizar: {cache_tags.invalidate_tag('usuario:8')}")  # 1
+
+    # -------------------------
+    # DEMOSTRACIÓN DE CAPACIDAD ADAPTABLE
+    # -------------------------
 
-# 1. put(1, 10) -> {1:10} (MRU: 1)
-cache.put(1, 10)    
+    print("\n--- Fantasmas: caché de 4 con 4 fantasmas, ciclo sobre 6 llaves ---")
+    cache_ad = LRU(4, tam_fantasmas=4)
+    for _ in range(5):
+        for k in range(6):
+            if cache_ad.get(k) == -1:
+                cache_ad.put(k, k)
+    print(f"Ganancia marginal estimada de crecer 4 lugares: {cache_ad.ganancia_marginal():.0%}") # 80%
+    print(f"Nueva capacidad (autoajustar, presupuesto 1 MB): {cache_ad.autoajustar(1_000_000)}")  # 8
+    print(f"resize(2) expulsó: {cache_ad.resize(2)} | Entradas: {len(cache_ad.map)}")          # 2 | 2
 
-# 2. put(2, 20) -> {1:10, 2:20} (MRU: 2)
-cache.put(2, 20)    
+    # Capacidad de sobra: con 6 llaves activas y cap=16 los fantasmas no reciben
+    # aciertos, así que autoajustar reduce hasta el conjunto de trabajo
+    cache_ad = LRU(16, tam_fantasmas=4)
+    capacidades = []
+    for _ in range(14):
+        for _ in range(5):
+            for k in range(6):
+                if cache_ad.get(k) == -1:
+                    cache_ad.put(k, k)
+        capacidades.append(cache_ad.autoajustar(1_000_000))
+    print(f"Capacidades de autoajustar con 6 llaves activas: {capacidades}")  # ... termina en 6
 
-print("\n--- Estado Actual: {1:10, 2:20} --- (LRU: 1)")
+    # Modo por peso sin 'cap': se parte del número actual de entradas
+    cache_ad = LRU(None, max_weight=1_000, weigher=lambda k, v: 10, tam_fantasmas=4)
+    for k in range(50):
+        cache_ad.put(k, k)
+    for k in range(50):
+        cache_ad.get(k)             # Todo son hits: los fantasmas no reciben nada
+    print(f"Modo por peso, autoajustar: {cache_ad.autoajustar(1_000_000)} (entradas: {len(cache_ad.map)})")  # 48 (50)
 
-# 3. get(1) -> 10. Actualiza el uso. (MRU: 1)
-print(f"Resultado get(1): {cache.get(1)}") 
-# Nueva secuencia de uso: 1 (MRU), 2 (LRU)
+    # -------------------------
+    # DEMOSTRACIÓN DE MARCAS DE AGUA
+    # -------------------------
 
-# 4. put(3, 30). Capacidad excedida. Expulsa LRU (2).
-cache.put(3, 30)    
-# Nuevo estado: {1:10, 3:30} (LRU: 2 fue expulsado, LRU actual: 1)
+    print("\n--- Marcas de agua: cap=10 (alta), marca_baja=6 ---")
+    lotes = []
+    cache_ma = LRU(10, marca_baja=6, avisos_en_hilo=True)
+    cache_ma.agregar_listener(lambda k, v, causa: lotes.append(k))
+    for k in range(11):
+        cache_ma.put(k, k)
+    cache_ma.esperar_avisos()
+    print(f"Entradas: {len(cache_ma.map)} | Expulsadas en un lote: {lotes}") # 6 | [0, 1, 2, 3, 4]
 
-# 5. get(2) -> -1. (Fue expulsado)
-print(f"Resultado get(2): {cache.get(2)}") 
+    # Un listener que falla no detiene el hilo; cerrar() lo termina
+    def listener_con_error(k, v, causa):
+        if k == 7:
+            raise RuntimeError("falla a propósito")
+    cache_ma.agregar_listener(listener_con_error)
+    for k in range(11, 16):
+        cache_ma.put(k, k)
+    cache_ma.esperar_avisos()       # No se bloquea aunque un listener falló
+    cache_ma.cerrar()
+    print(f"Expulsadas: {lotes} | Hilo de avisos activo: {cache_ma._hilo_avisos is not None}") # [0, ..., 9] | False
 
-# 6. put(4, 40). Capacidad excedida. Expulsa LRU (1).
-cache.put(4, 40)    
-# Nuevo estado: {3:30, 4:40} (1 fue expulsado, LRU actual: 3)
+    hilos = threading.active_count()
+    caches = [LRU(10, avisos_en_hilo=True) for _ in range(200)]
+    print(f"Hilos nuevos al crear 200 caches sin expulsiones: {threading.active_count() - hilos}") # 0
 
-print("\n--- Pruebas Finales ---")
-print(f"Resultado get(1): {cache.get(1)}") # -1 (Expulsado)
-print(f"Resultado get(3): {cache.get(3)}") # 30. Mueve 3 a MRU.
-print(f"Resultado get(4): {cache.get(4)}") # 40. Mueve 4 a MRU.
\ No newline at end of file
+    print("\n--- Ráfaga de 300,000 inserciones (cap=10,000) ---")
+    for baja in (None, 9_000):
+        cache_rafaga = LRU(10_000, marca_baja=baja)
+        inicio = time.perf_counter()
+        for k in range(300_000):
+            cache_rafaga.put(k, k)
+        ms = (time.perf_counter() - inicio) * 1000
+        print(f"  marca_baja={str(baja):>5}: {ms:7.1f} ms | Expulsados: {cache_rafaga.expulsados:,}")
@@ -1,54 +1,289 @@
+import bisect
+import random
 import sys
+import time
+from operator import attrgetter
 
 # ==========================================================
 # ESTRUCTURAS DE DATOS BASE (Ejercicios 1-5)
 # ==========================================================
 
+SALTO = 1 << 20  # Separación entre etiquetas de posición (modo indexado)
+_orden = attrgetter("orden")
+
+def _orden_ultimo(bloque):
+    return bloque[-1].orden
+
+# Capa de saltos indexable (Ejercicio 4): algunos nodos son torres con enlaces
+# por nivel que guardan cuántas posiciones avanzan.
+P_NIVEL = 0.25   # Probabilidad de que una torre suba un nivel más
+MAX_NIVEL = 32
+_aleatorio = random.random
+
+def _altura_aleatoria():
+    h = 0
+    while h < MAX_NIVEL and _aleatorio() < P_NIVEL:
+        h += 1
+    return h
+
 class Nodo:
     """Representa un nodo en la lista doblemente ligada."""
+    __slots__ = ("dato", "prev", "next", "orden", "sig_nivel", "ancho_nivel", "ant_nivel")
     def __init__(self, dato):
         self.dato = dato
         self.prev = None
         self.next = None
+        self.orden = 0  # Etiqueta de posición (solo se usa en modo indexado)
+        # Torre en la capa de saltos (None si el nodo solo vive en la lista base)
+        self.sig_nivel = None    # sig_nivel[j]: siguiente torre en el nivel j
+        self.ancho_nivel = None  # ancho_nivel[j]: posiciones que avanza ese enlace
+        self.ant_nivel = None    # ant_nivel[j]: torre anterior en el nivel j (None = head)
+
+class Ocurrencias:
+    """
+    Nodos con un mismo valor en modo indexado, ordenados por su etiqueta
+    'orden'. Se guardan en bloques cortos (a lo más 2*CARGA nodos), así que
+    insertar o quitar cuesta O(log k) sin mover los k nodos, y la primera
+    ocurrencia es siempre bloques[0][0]. Reetiquetar conserva el orden, por
+    lo que los bloques nunca hay que reordenarlos.
+    """
+    CARGA = 64
+    __slots__ = ("bloques", "n")
+    def __init__(self):
+        self.bloques = []
+        self.n = 0
+
+    def __len__(self):
+        return self.n
+
+    def primero(self):
+        return self.bloques[0][0]
+
+    def _bloque_de(self, orden):
+        """Índice del primer bloque cuyo último nodo tiene etiqueta >= orden."""
+        return bisect.bisect_left(self.bloques, orden, key=_orden_ultimo)
+
+    def agregar(self, n):
+        bloques = self.bloques
+        self.n += 1
+        if not bloques:
+            bloques.append([n])
+            return
+        b = self._bloque_de(n.orden)
+        if b == len(bloques):
+            b -= 1
+            bloque = bloques[b]
+            bloque.append(n)                 # Caso común: push_back
+        else:
+            bloque = bloques[b]
+            bisect.insort(bloque, n, key=_orden)
+        if len(bloque) > 2 * self.CARGA:
+            bloques.insert(b + 1, bloque[self.CARGA:])
+            del bloque[self.CARGA:]
+
+    def anteponer(self, nuevos):
+        """Agrega nodos (ya ordenados) que quedan antes de todos los actuales."""
+        c = self.CARGA
+        self.bloques[:0] = [nuevos[i:i + c] for i in range(0, len(nuevos), c)]
+        self.n += len(nuevos)
+
+    def quitar(self, n):
+        b = self._bloque_de(n.orden)
+        bloque = self.bloques[b]
+        del bloque[bisect.bisect_left(bloque, n.orden, key=_orden)]
+        if not bloque:
+            del self.bloques[b]
+        self.n -= 1
 
 class ListaDoble:
     """
     Implementa una lista doblemente ligada con métodos de los Ejercicios 1 al 5.
+    Con indexada=True mantiene un índice valor -> nodos y etiquetas de posición,
+    así find, insert_after y remove_value no recorren la lista (aun con repetidos).
+    El tamaño se mantiene en un contador y una capa de saltos indexable da
+    acceso por posición (ld[i], k_from_end, insert_at, pop_at) en O(log n).
     """
-    def __init__(self):
+    def __init__(self, indexada=False):
         self.head = None
         self.tail = None
+        self.indice = {} if indexada else None  # Diccionario: valor -> Ocurrencias
+        self.n = 0
+        self.version = 0  # Cambia con cada inserción o eliminación; los iteradores la vigilan
+        # Enlaces del head por nivel; el ancho real del enlace j es _ancho_nivel[j] + _frente
+        self._sig_nivel = []
+        self._ancho_nivel = []
+        self._frente = 0
 
     # --- EJERCICIO 1: CONSTRUYE Y RECORRE ---
     def push_front(self, x):
         n = Nodo(x)
+        if self.indice is not None:
+            n.orden = self.head.orden - SALTO if self.head else 0
+            self._indexar(n)
         n.next = self.head
         if self.head: self.head.prev = n
         else: self.tail = n
         self.head = n
+        self.n += 1
+        self.version += 1
+        if _aleatorio() < P_NIVEL: self._enlazar_niveles(n, None, 1 + _altura_aleatoria())
+        else: self._frente += 1
         print(f"  [INFO]: Insertado {x} al inicio.")
 
     def push_back(self, x):
         n = Nodo(x)
+        if self.indice is not None:
+            n.orden = self.tail.orden + SALTO if self.tail else 0
+            self._indexar(n)
+        anterior = self.tail
         n.prev = self.tail
         if self.tail: self.tail.next = n
         else: self.head = n
         self.tail = n
+        self.n += 1
+        self.version += 1
+        if _aleatorio() < P_NIVEL: self._enlazar_niveles(n, anterior, 1 + _altura_aleatoria(), True)
         print(f"  [INFO]: Insertado {x} al final.")
 
+    # --- CONSTRUCCIÓN EN LOTE ---
+    @classmethod
+    def from_iterable(cls, iterable, indexada=False):
+        """Construye una lista con todos los datos del iterable (sin imprimir por elemento)."""
+        ld = cls(indexada)
+        ld.extend(iterable)
+        return ld
+
+    @staticmethod
+    def _cadena(iterable, reverso=False):
+        """Arma aparte una cadena de nodos; con reverso=True cada dato queda antes del anterior."""
+        primero = ultimo = None
+        k = 0
+        for x in iterable:
+            n = Nodo(x)
+            if primero is None:
+                primero = ultimo = n
+            elif reverso:
+                n.next = primero; primero.prev = n; primero = n
+            else:
+                ultimo.next = n; n.prev = ultimo; ultimo = n
+            k += 1
+        return primero, ultimo, k
+
+    def extend(self, iterable):
+        """Agrega los datos al final: la cadena se arma aparte y se pega con un solo empalme."""
+        primero, ultimo, k = self._cadena(iterable)
+        if k == 0: return
+        anterior = self.tail
+        if anterior: anterior.next = primero; primero.prev = anterior
+        else: self.head = primero
+        self.tail = ultimo
+        self._registrar_cadena(primero, anterior, k)
+        print(f"  [INFO]: Insertados {k} datos al final.")
+
+    def extendleft(self, iterable):
+        """Como deque.extendleft: cada dato queda al inicio, así que el orden se invierte."""
+        primero, ultimo, k = self._cadena(iterable, reverso=True)
+        if k == 0: return
+        siguiente = self.head
+        if siguiente: siguiente.prev = ultimo; ultimo.next = siguiente
+        else: self.tail = ultimo
+        self.head = primero
+        self._registrar_cadena(primero, None, k, siguiente)
+        print(f"  [INFO]: Insertados {k} datos al inicio.")
+
+    def _registrar_cadena(self, primero, anterior, k, siguiente=None):
+        """
+        Después de empalmar k nodos justo después de 'anterior' (None = al
+        inicio; si no, es el tail anterior) y antes de 'siguiente', actualiza
+        en una sola pasada el índice de valores y la capa de saltos.
+        """
+        L = len(self._sig_nivel)
+        # Para cada nivel: [última torre, su posición], contando 'anterior' como posición 0
+        if anterior is None:
+            viejos = [(self._sig_nivel[j], self._ancho(None, j)) for j in range(L)]
+            ultimos = [[None, 0] for _ in range(L)]
+            pos_head = 0
+        else:
+            ultimos = [[torre, -d] for torre, d in self._predecesores(anterior, L)]
+            pos_head = -self.n
+        if self.indice is not None:
+            # Etiquetas con separación SALTO, crecientes y antes de 'siguiente'
+            if anterior is not None: orden = anterior.orden
+            elif siguiente is not None: orden = siguiente.orden - (k + 1) * SALTO
+            else: orden = -SALTO
+            # Al inicio, los nodos nuevos de cada valor van antes de los que ya
+            # estaban: se juntan y se anteponen de una vez al final
+            nuevos = {} if anterior is None else None
+        nodo, p = primero, 0
+        for _ in range(k):
+            p += 1
+            if self.indice is not None:
+                orden += SALTO
+                nodo.orden = orden
+                if nuevos is None: self._indexar(nodo)
+                else: nuevos.setdefault(nodo.dato, []).append(nodo)
+            if _aleatorio() < P_NIVEL:
+                h = 1 + _altura_aleatoria()
+                nodo.sig_nivel, nodo.ancho_nivel, nodo.ant_nivel = [None] * h, [0] * h, [None] * h
+                for j in range(h):
+                    if j == len(ultimos):
+                        ultimos.append([None, pos_head])
+                        self._sig_nivel.append(None)
+                        self._ancho_nivel.append(0)
+                    torre, pos = ultimos[j]
+                    self._fijar(torre, j, nodo, p - pos)
+                    ultimos[j] = [nodo, p]
+            nodo = nodo.next
+        if anterior is None:
+            # Al inicio: las últimas torres nuevas (o el head) apuntan a los destinos viejos del head
+            for j, (sig, ancho) in enumerate(viejos):
+                torre, pos = ultimos[j]
+                if sig is not None: self._fijar(torre, j, sig, ancho + k - pos)
+            if self.indice is not None:
+                for v, nodos in nuevos.items():
+                    if v not in self.indice: self.indice[v] = Ocurrencias()
+                    self.indice[v].anteponer(nodos)
+        self.n += k
+        self.version += 1
+
+    def iter_desde(self, nodo, reverso=False, hasta=None):
+        """
+        Generador de datos desde 'nodo' hacia el final (o hacia el inicio con
+        reverso=True), hasta el nodo 'hasta' incluido. Lanza RuntimeError si
+        la lista cambia durante el recorrido.
+        """
+        # La versión se toma al crear el iterador, no en el primer next()
+        return self._recorrer(nodo, reverso, hasta, self.version)
+
+    def _recorrer(self, nodo, reverso, hasta, version):
+        if self.version != version:
+            raise RuntimeError("La lista cambió durante el recorrido.")
+        while nodo:
+            yield nodo.dato
+            if self.version != version:
+                raise RuntimeError("La lista cambió durante el recorrido.")
+            if nodo is hasta: return
+            nodo = nodo.prev if reverso else nodo.next
+
+    def __iter__(self):
+        return self.iter_desde(self.head)
+
+    def __reversed__(self):
+        return self.iter_desde(self.tail, reverso=True)
+
     def forward(self):
-        cur, out = self.head, []
-        while cur: out.append(cur.dato); cur = cur.next
-        return out
+        return list(self)
 
     def backward(self):
-        cur, out = self.tail, []
-        while cur: out.append(cur.dato); cur = cur.prev
-        return out
+        return list(reversed(self))
 
     # --- EJERCICIO 2 Y 3: HELPER ---
     def find(self, v):
         """Busca y retorna el primer nodo con valor v."""
+        if self.indice is not None:
+            # Modo indexado: la primera ocurrencia es la de menor etiqueta 'orden'
+            nodos = self.indice.get(v)
+            return nodos.primero() if nodos else None
         cur = self.head
         while cur:
             if cur.dato == v: return cur
@@ -58,6 +293,9 @@ class ListaDoble:
     def remove_node(self, nodo):
         """Desenlace un nodo dado de la lista."""
         if not nodo: return
+        if self.indice is not None: self._desindexar(nodo)
+        self._quitar_niveles(nodo)
+        self.version += 1
         if nodo.prev: nodo.prev.next = nodo.next
         else: self.head = nodo.next
         if nodo.next: nodo.next.prev = nodo.prev
@@ -72,6 +310,9 @@ class ListaDoble:
             return
         
         n = Nodo(x)
+        if self.indice is not None:
+            n.orden = self._orden_despues(nodo_objetivo)
+            self._indexar(n)
         n.prev = nodo_objetivo
         n.next = nodo_objetivo.next
         
@@ -79,8 +320,55 @@ class ListaDoble:
         else: self.tail = n
             
         nodo_objetivo.next = n
+        self.n += 1
+        self.version += 1
+        self._enlazar_niveles(n, nodo_objetivo, _altura_aleatoria(), n is self.tail)
         print(f"  [INFO]: Insertado {x} después de {objetivo}.")
 
+    # --- MODO INDEXADO: ÍNDICE VALOR -> NODOS ---
+    def _indexar(self, n):
+        nodos = self.indice.get(n.dato)
+        if nodos is None: nodos = self.indice[n.dato] = Ocurrencias()
+        nodos.agregar(n)
+
+    def _desindexar(self, n):
+        nodos = self.indice[n.dato]
+        nodos.quitar(n)
+        if not nodos: del self.indice[n.dato]
+
+    def _orden_despues(self, nodo):
+        """Etiqueta para un nodo nuevo entre 'nodo' y su sucesor."""
+        if nodo.next is None: return nodo.orden + SALTO
+        if nodo.next.orden - nodo.orden < 2: self._reetiquetar(nodo)  # Sin espacio entre vecinos
+        return (nodo.orden + nodo.next.orden) // 2
+
+    def _reetiquetar(self, nodo):
+        """
+        Reparte de nuevo las etiquetas solo alrededor de 'nodo': busca el menor
+        rango alineado de 2**i etiquetas que lo contiene y tiene a lo más
+        (4/3)**i nodos (contando el que se va a insertar), y los reparte
+        parejo dentro del rango. Costo amortizado O(log n) por inserción.
+        """
+        primero = ultimo = nodo
+        cuenta, i = 1, 0
+        while True:
+            i += 1
+            base = nodo.orden >> i << i
+            tope = base + (1 << i)
+            while primero.prev and primero.prev.orden >= base:
+                primero = primero.prev
+                cuenta += 1
+            while ultimo.next and ultimo.next.orden < tope:
+                ultimo = ultimo.next
+                cuenta += 1
+            if (cuenta + 1) * 3 ** i <= 4 ** i:
+                break
+        paso = (1 << i) // (cuenta + 1)
+        cur = primero
+        for j in range(cuenta):
+            cur.orden = base + j * paso
+            cur = cur.next
+
     # --- EJERCICIO 3: ELIMINAR PRIMERA OCURRENCIA ---
     def remove_value(self, v):
         nodo_a_eliminar = self.find(v)
@@ -90,25 +378,169 @@ class ListaDoble:
         else:
             print(f"  [AVISO]: El valor {v} no se encontró en la lista.")
 
+    # --- EJERCICIO 4: CAPA DE SALTOS INDEXABLE ---
+    def _ancho(self, torre, j):
+        """Ancho del enlace j que sale de 'torre' (None = head)."""
+        return self._ancho_nivel[j] + self._frente if torre is None else torre.ancho_nivel[j]
+
+    def _siguiente(self, torre, j):
+        return self._sig_nivel[j] if torre is None else torre.sig_nivel[j]
+
+    def _fijar(self, torre, j, sig, ancho):
+        """Hace que el enlace j de 'torre' apunte a sig (que puede ser None) con ese ancho."""
+        if torre is None:
+            self._sig_nivel[j] = sig
+            self._ancho_nivel[j] = ancho - self._frente
+        else:
+            torre.sig_nivel[j] = sig
+            torre.ancho_nivel[j] = ancho
+        if sig is not None: sig.ant_nivel[j] = torre
+
+    def _sumar_ancho(self, torre, j, delta):
+        if torre is None: self._ancho_nivel[j] += delta
+        else: torre.ancho_nivel[j] += delta
+
+    def _predecesores(self, nodo, niveles):
+        """
+        Para cada nivel j < niveles retorna (torre, d): la última torre de ese
+        nivel en o antes de 'nodo' (None = head) y a cuántas posiciones está de
+        'nodo'. Sube por los enlaces ant_nivel: O(log n) esperado.
+        """
+        res = []
+        if not niveles: return res
+        cur, d = nodo, 0
+        while cur is not None and cur.sig_nivel is None:
+            cur = cur.prev
+            d += 1
+        for j in range(niveles):
+            while cur is not None and len(cur.sig_nivel) <= j:
+                p = cur.ant_nivel[j - 1]
+                d += self._ancho(p, j - 1)
+                cur = p
+            res.append((cur, d))
+        return res
+
+    def _enlazar_niveles(self, nodo, anterior, h, al_final=False):
+        """
+        Registra en la capa de saltos, con altura h, un nodo ya enlazado justo
+        después de 'anterior' (None = al inicio).
+        """
+        if h:
+            nodo.sig_nivel, nodo.ancho_nivel, nodo.ant_nivel = [None] * h, [0] * h, [None] * h
+        L = len(self._sig_nivel)
+        if anterior is None:
+            # Al inicio: todas las posiciones se recorren 1 con un solo incremento de
+            # _frente; solo se tocan los h enlaces del head que ahora llegan al nodo
+            anchos = [self._ancho(None, j) for j in range(min(h, L))]
+            self._frente += 1
+            for j in range(h):
+                if j >= L:
+                    self._sig_nivel.append(None)
+                    self._ancho_nivel.append(0)
+                elif self._sig_nivel[j] is not None:
+                    self._fijar(nodo, j, self._sig_nivel[j], anchos[j])
+                self._fijar(None, j, nodo, 1)
+            return
+        # Al final ningún enlace arriba de h cruza al nodo nuevo: basta subir h niveles
+        preds = self._predecesores(anterior, h if al_final else max(L, h))
+        for j, (pred, d) in enumerate(preds):
+            if j >= len(self._sig_nivel):
+                self._sig_nivel.append(None)
+                self._ancho_nivel.append(0)
+            if j < h:
+                sig = self._siguiente(pred, j)
+                if sig is not None:
+                    self._fijar(nodo, j, sig, self._ancho(pred, j) - d)
+                self._fijar(pred, j, nodo, d + 1)
+            elif self._siguiente(pred, j) is not None:
+                self._sumar_ancho(pred, j, 1)
+
+    def _quitar_niveles(self, nodo):
+        """Quita de la capa de saltos un nodo que todavía está enlazado en la lista base."""
+        self.n -= 1
+        h = len(nodo.sig_nivel) if nodo.sig_nivel else 0
+        for j, (pred, d) in enumerate(self._predecesores(nodo.prev, len(self._sig_nivel))):
+            if j < h:
+                sig = nodo.sig_nivel[j]
+                ancho = self._ancho(pred, j) + nodo.ancho_nivel[j] - 1 if sig is not None else 0
+                self._fijar(pred, j, sig, ancho)
+            elif self._siguiente(pred, j) is not None:
+                self._sumar_ancho(pred, j, -1)
+        # Los niveles que quedaron vacíos se eliminan
+        while self._sig_nivel and self._sig_nivel[-1] is None:
+            self._sig_nivel.pop()
+            self._ancho_nivel.pop()
+        nodo.sig_nivel = nodo.ancho_nivel = nodo.ant_nivel = None
+
+    def _nodo_en(self, i):
+        """Nodo en la posición i (0 = head), bajando por la capa de saltos."""
+        objetivo = i + 1  # Posiciones desde 1; el head está en la posición 0
+        cur, pos = None, 0
+        for j in range(len(self._sig_nivel) - 1, -1, -1):
+            if cur is None:
+                # Todavía en el head: a lo más un salto por nivel desde aquí
+                sig = self._sig_nivel[j]
+                w = self._ancho_nivel[j] + self._frente
+                if sig is None or w > objetivo: continue
+                cur, pos = sig, w
+            while True:
+                sig = cur.sig_nivel[j]
+                if sig is None: break
+                w = cur.ancho_nivel[j]
+                if pos + w > objetivo: break
+                cur, pos = sig, pos + w
+        if cur is None:
+            cur, pos = self.head, 1
+        while pos < objetivo:
+            cur = cur.next
+            pos += 1
+        return cur
+
+    def _indice(self, i):
+        if i < 0: i += self.n
+        if not 0 <= i < self.n:
+            raise IndexError("Índice fuera del rango de la lista.")
+        return i
+    
     # --- EJERCICIO 4: CONTAR Y K-ÉSIMO ---
     def __len__(self):
-        cur, count = self.head, 0
-        while cur: count += 1; cur = cur.next
-        return count
+        return self.n
+
+    def __getitem__(self, i):
+        """ld[i] en O(log n) esperado; acepta índices negativos."""
+        return self._nodo_en(self._indice(i)).dato
+
+    def insert_at(self, i, x):
+        """Inserta x para que quede en la posición i (como list.insert)."""
+        if i < 0: i = max(0, i + self.n)
+        if i == 0: return self.push_front(x)
+        if i >= self.n: return self.push_back(x)
+        anterior = self._nodo_en(i - 1)
+        n = Nodo(x)
+        if self.indice is not None:
+            n.orden = self._orden_despues(anterior)
+            self._indexar(n)
+        n.prev, n.next = anterior, anterior.next
+        anterior.next.prev = n
+        anterior.next = n
+        self.n += 1
+        self.version += 1
+        self._enlazar_niveles(n, anterior, _altura_aleatoria())
+        print(f"  [INFO]: Insertado {x} en la posición {i}.")
+
+    def pop_at(self, i=-1):
+        """Quita y retorna el dato de la posición i (como list.pop)."""
+        nodo = self._nodo_en(self._indice(i))
+        self.remove_node(nodo)
+        return nodo.dato
     
     def k_from_end(self, k):
         if k <= 0:
             print(f"  [ERROR]: k debe ser positivo.")
             return None
-            
-        cur = self.tail
-        i = 1 
-        while cur and i < k:
-            cur = cur.prev
-            i += 1
-            
-        if cur and i == k:
-            return cur.dato
+        # O(log n): el k-ésimo desde el final es la posición n - k
+        if k <= self.n:
+            return self._nodo_en(self.n - k).dato
         else:
             return None
 
@@ -132,16 +564,26 @@ class ListaDoble:
 
 class NodoKV:
     """Nodo especializado para la LRU Cache."""
+    __slots__ = ("k", "v", "prev", "next", "expira")
     def __init__(self, k, v):
         self.k, self.v = k, v
         self.prev = None
         self.next = None
+        self.expira = None
 
 class LRU:
-    """Implementación de LRU Cache (O(1) amortizado)."""
-    def __init__(self, cap: int):
+    """Implementación de LRU Cache (O(1) amortizado) con TTL opcional por entrada."""
+    def __init__(self, cap: int, resolucion: float = 1.0):
         self.cap = cap
         self.map = {}
+        self.resolucion = resolucion
+        self.rueda = {}  # Rueda de tiempo: slot -> nodos que caducan en ese slot
+        self._ultimo_slot = int(time.monotonic() // resolucion)
+        self.expirados = 0
+        self.expulsados = 0
+        self.hits = self.misses = 0
+        self.inserciones = self.actualizaciones = 0
+        self._listeners = []  # Funciones (key, value, causa) a llamar en cada expulsión
         self.head = NodoKV(0, 0)
         self.tail = NodoKV(0, 0)
         self.head.next = self.tail
@@ -167,25 +609,83 @@ class LRU:
         if lru_node is self.head: return
         self._remove(lru_node)
         del self.map[lru_node.k]
-        print(f"  [EVICT]: Expulsado el LRU (key: {lru_node.k}).")
+        self.expulsados += 1
+        if self._listeners: self._notificar(lru_node.k, lru_node.v, "capacidad")
+
+    def _expirar(self, n: NodoKV):
+        self._remove(n)
+        del self.map[n.k]
+        self.expirados += 1
+        if self._listeners: self._notificar(n.k, n.v, "expirado")
+
+    def agregar_listener(self, fn):
+        """Registra fn(key, value, causa); causa es "capacidad" o "expirado"."""
+        self._listeners.append(fn)
+
+    def _notificar(self, k, v, causa):
+        for fn in self._listeners: fn(k, v, causa)
+
+    def stats(self) -> dict:
+        consultas = self.hits + self.misses
+        return {
+            "hits": self.hits, "misses": self.misses,
+            "inserts": self.inserciones, "updates": self.actualizaciones,
+            "evictions": self.expulsados, "expirations": self.expirados,
+            "hit_ratio": self.hits / consultas if consultas else 0.0,
+        }
+
+    def _programar(self, n: NodoKV, ttl: float):
+        n.expira = time.monotonic() + ttl
+        slot = -int(-n.expira // self.resolucion)
+        self.rueda.setdefault(slot, []).append(n)
+
+    def purgar_expirados(self) -> int:
+        """Elimina en lote los nodos de los slots vencidos (O(1) amortizado)."""
+        ahora = time.monotonic()
+        actual = int(ahora // self.resolucion)
+        if actual <= self._ultimo_slot: return 0
+        if actual - self._ultimo_slot > len(self.rueda):
+            vencidos = [s for s in self.rueda if s <= actual]
+        else:
+            vencidos = range(self._ultimo_slot + 1, actual + 1)
+        self._ultimo_slot = actual
+        purgados = 0
+        for slot in vencidos:
+            for n in self.rueda.pop(slot, ()):
+                if self.map.get(n.k) is n and n.expira is not None and n.expira <= ahora:
+                    self._expirar(n)
+                    purgados += 1
+        return purgados
 
     def get(self, k: int) -> int:
-        if k not in self.map: return -1
-        n = self.map[k]
+        n = self.map.get(k)
+        if n is None:
+            self.misses += 1
+            return -1
+        if n.expira is not None and n.expira <= time.monotonic():
+            self._expirar(n)
+            self.misses += 1
+            return -1
         self._move_to_front(n)
+        self.hits += 1
         return n.v
 
-    def put(self, k: int, v: int):
+    def put(self, k: int, v: int, ttl: float = None):
+        self.purgar_expirados()
         if k in self.map:
             n = self.map[k]
             n.v = v
             self._move_to_front(n)
+            self.actualizaciones += 1
         else:
             n = NodoKV(k, v)
             self.map[k] = n
             self._add_front(n)
+            self.inserciones += 1
             if len(self.map) > self.cap:
                 self._evict_lru()
+        if ttl is None: n.expira = None
+        else: self._programar(n, ttl)
 
 # ==========================================================
 # FUNCIONES DE MENÚ
@@ -222,6 +722,10 @@ def menu_lista_doble(ld):
         print("5. Eliminar por valor (remove_value) [E3]")
         print("6. Obtener k-ésimo desde el final (k_from_end) [E4]")
         print("7. Remover duplicados (remove_dups) [E5]")
+        print("8. Obtener por posición (ld[i]) [E4]")
+        print("9. Insertar en posición (insert_at) [E4]")
+        print("10. Extraer de posición (pop_at) [E4]")
+        print("11. Insertar varios al final (extend)")
         print("0. Volver al Menú Principal")
         
         choice = input("Seleccione una opción: ")
@@ -250,6 +754,25 @@ def menu_lista_doble(ld):
                  print(f"  [RESULTADO]: No se encontró el {k}-ésimo (k={k} es demasiado grande o inválido).")
         elif choice == '7':
             ld.remove_dups()
+        elif choice in ('8', '10'):
+            i = get_int_input("  Ingrese la posición (0 es la primera, -1 la última): ")
+            try:
+                if choice == '8':
+                    print(f"  [RESULTADO]: ld[{i}] = {ld[i]}")
+                else:
+                    print(f"  [RESULTADO]: Extraído {ld.pop_at(i)} de la posición {i}.")
+            except IndexError as e:
+                print(f"  [ERROR]: {e}")
+        elif choice == '9':
+            i = get_int_input("  Ingrese la posición: ")
+            dato = get_int_input("  Ingrese el dato a insertar: ")
+            ld.insert_at(i, dato)
+        elif choice == '11':
+            texto = input("  Ingrese los datos separados por comas: ")
+            try:
+                ld.extend(int(t) for t in texto.split(",") if t.strip())
+            except ValueError:
+                print("  [ERROR]: Todos los datos deben ser números enteros.")
         elif choice == '0':
             break
         else:
@@ -272,7 +795,11 @@ def menu_lru_cache():
 
     while True:
         print("\n\n--- MENÚ LRU CACHE (EJERCICIO 6) ---")
+        st = cache.stats()
         print(f"Capacidad: {cache.cap} | Elementos: {len(cache.map)}")
+        print(f"Hits: {st['hits']} | Misses: {st['misses']} | Tasa de aciertos: {st['hit_ratio']:.0%}")
+        print(f"Inserciones: {st['inserts']} | Actualizaciones: {st['updates']} | "
+              f"Expulsadas: {st['evictions']} | Expiradas: {st['expirations']}")
         print("1. get(key)")
         print("2. put(key, value)")
         print("3. Mostrar contenido (mapa interno)")
@@ -290,8 +817,9 @@ def menu_lru_cache():
         elif choice == '2':
             key = get_int_input("  Ingrese la clave (key): ")
             value = get_int_input("  Ingrese el valor (value): ")
-            cache.put(key, value)
-            print(f"  [INFO]: put({key}, {value}) ejecutado. Verifique expulsiones.")
+            ttl = get_int_input("  Ingrese el TTL en segundos (0 = sin expiración): ")
+            cache.put(key, value, ttl if ttl > 0 else None)
+            print(f"  [INFO]: put({key}, {value}) ejecutado. Revise las estadísticas.")
         elif choice == '3':
             # Muestra el mapa interno (desordenado, el orden LRU/MRU está en la lista doble)
             print(f"  Mapa interno: {cache.map}") 
@@ -314,7 +842,7 @@ def menu_lru_cache():
 
 def main_menu():
     """Menú principal para seleccionar el ejercicio."""
-    lista_doble_instancia = ListaDoble()
+    lista_doble_instancia = ListaDoble(indexada=True)
     
     while True:
         print("\n===========================================")
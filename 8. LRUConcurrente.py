@@ -0,0 +1,173 @@
+import threading
+import time
+import random
+
+# Reutilizamos las clases NodoKV y LRU del Ejercicio 6.
+# En esta versión se quitan los print del camino caliente: con varios hilos
+# compartiendo la cache, imprimir en cada operación domina la latencia.
+
+# -------------------------
+# CLASE DE NODO (Key-Value)
+# -------------------------
+
+class NodoKV:
+    """Nodo especializado para la LRU, guarda llave (k) y valor (v)."""
+    __slots__ = ("k", "v", "prev", "next")
+    def __init__(self, k, v):
+        self.k, self.v = k, v
+        self.prev = None
+        self.next = None
+
+# -------------------------
+# CLASE LRU CACHE (asumida del Ejercicio 6)
+# -------------------------
+
+class LRU:
+    """Implementación de LRU Cache usando un diccionario y una lista doble."""
+    def __init__(self, cap: int):
+        self.cap = cap
+        self.map = {}
+        self.head = NodoKV(0, 0)
+        self.tail = NodoKV(0, 0)
+        self.head.next = self.tail
+        self.tail.prev = self.head
+
+    def _add_front(self, n: NodoKV):
+        n.prev = self.head
+        n.next = self.head.next
+        self.head.next.prev = n
+        self.head.next = n
+
+    def _remove(self, n: NodoKV):
+        n.prev.next = n.next
+        n.next.prev = n.prev
+        n.prev = n.next = None
+
+    def _move_to_front(self, n: NodoKV):
+        self._remove(n)
+        self._add_front(n)
+
+    def _evict_lru(self):
+        lru_node = self.tail.prev
+        if lru_node is self.head: return
+        self._remove(lru_node)
+        del self.map[lru_node.k]
+
+    def get(self, k: int) -> int:
+        if k not in self.map: return -1
+        n = self.map[k]
+        self._move_to_front(n)
+        return n.v
+
+    def put(self, k: int, v: int):
+        if k in self.map:
+            n = self.map[k]
+            n.v = v
+            self._move_to_front(n)
+        else:
+            n = NodoKV(k, v)
+            self.map[k] = n
+            self._add_front(n)
+            if len(self.map) > self.cap:
+                self._evict_lru()
+
+# -------------------------
+# CLASE LRU CONCURRENTE (por fragmentos / shards)
+# -------------------------
+
+class LRUConcurrente:
+    """
+    LRU Cache segura para hilos. Reparte las llaves entre N instancias
+    independientes de LRU (shards), cada una protegida por su propio candado,
+    para que hilos que tocan llaves distintas no se bloqueen entre sí.
+
+    La capacidad global se reparte entre los shards (cap // N y el residuo
+    en los primeros), así la suma de elementos nunca excede 'cap'.
+    """
+    def __init__(self, cap: int, n_shards: int = 8):
+        if cap <= 0 or n_shards <= 0:
+            raise ValueError("La capacidad y el número de shards deben ser positivos.")
+        # No tiene sentido tener más shards que lugares en la cache
+        n_shards = min(n_shards, cap)
+        self.cap = cap
+        base, residuo = divmod(cap, n_shards)
+        self.shards = [LRU(base + (1 if i < residuo else 0)) for i in range(n_shards)]
+        self.locks = [threading.Lock() for _ in range(n_shards)]
+
+    def _indice(self, k) -> int:
+        """Shard al que pertenece la llave k."""
+        return hash(k) % len(self.shards)
+
+    # --- API (misma que LRU) ---
+
+    def get(self, k: int) -> int:
+        """Obtiene el valor de la clave (-1 si no existe). Solo bloquea su shard."""
+        i = self._indice(k)
+        with self.locks[i]:
+            return self.shards[i].get(k)
+
+    def put(self, k: int, v: int):
+        """Inserta o actualiza un valor. Solo bloquea su shard."""
+        i = self._indice(k)
+        with self.locks[i]:
+            self.shards[i].put(k, v)
+
+    def __len__(self):
+        total = 0
+        for lock, shard in zip(self.locks, self.shards):
+            with lock:
+                total += len(shard.map)
+        return total
+
+# -------------------------
+# BENCHMARK MULTI-HILO
+# -------------------------
+
+def _trabajador(cache, llaves, ops, barrera):
+    """Mezcla 90% lecturas / 10% escrituras sobre llaves aleatorias."""
+    rnd = random.Random()
+    barrera.wait()
+    for _ in range(ops):
+        k = rnd.choice(llaves)
+        if rnd.random() < 0.9:
+            if cache.get(k) == -1:
+                cache.put(k, k)
+        else:
+            cache.put(k, k)
+
+def benchmark(n_shards, n_hilos, ops_por_hilo=20_000, cap=1_000, n_llaves=2_000):
+    """Devuelve las operaciones por segundo con n_hilos y n_shards."""
+    cache = LRUConcurrente(cap, n_shards)
+    llaves = list(range(n_llaves))
+    barrera = threading.Barrier(n_hilos + 1)
+    hilos = [threading.Thread(target=_trabajador, args=(cache, llaves, ops_por_hilo, barrera))
+             for _ in range(n_hilos)]
+    for h in hilos: h.start()
+    inicio = time.perf_counter()
+    barrera.wait()
+    for h in hilos: h.join()
+    transcurrido = time.perf_counter() - inicio
+    assert len(cache) <= cap
+    return (n_hilos * ops_por_hilo) / transcurrido
+
+# -------------------------
+# DEMOSTRACIÓN
+# -------------------------
+
+if __name__ == "__main__":
+    print("--- LRU Concurrente con capacidad 4 y 2 shards ---")
+    cache = LRUConcurrente(4, n_shards=2)
+    for i in range(1, 7):
+        cache.put(i, i * 10)
+    print(f"Elementos (máximo 4): {len(cache)}")
+    print(f"Resultado get(6): {cache.get(6)}")  # 60, el más reciente
+    print(f"Resultado get(1): {cache.get(1)}")  # -1, expulsado
+
+    # Nota: con el GIL de CPython los hilos no corren Python en paralelo,
+    # así que lo que se mide es sobre todo la reducción de contención por candado.
+    print("\n--- Benchmark (ops/seg) por número de shards ---")
+    for hilos in (1, 4, 8):
+        fila = []
+        for shards in (1, 4, 16):
+            fila.append(f"shards={shards:>2}: {benchmark(shards, hilos):>10,.0f}")
+        print(f"  hilos={hilos}: " + " | ".join(fila))
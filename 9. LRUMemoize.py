@@ -0,0 +1,184 @@
+import functools
+import itertools
+import timeit
+from collections import namedtuple
+
+# Reutilizamos las clases NodoKV y LRU del Ejercicio 6 (sin los print del
+# camino caliente), para que las funciones memoizadas compartan la misma
+# política de expulsión que el resto del proyecto.
+
+# -------------------------
+# CLASE DE NODO (Key-Value)
+# -------------------------
+
+class NodoKV:
+    """Nodo especializado para la LRU, guarda llave (k) y valor (v)."""
+    __slots__ = ("k", "v", "prev", "next")
+    def __init__(self, k, v):
+        self.k, self.v = k, v
+        self.prev = None
+        self.next = None
+
+# -------------------------
+# CLASE LRU CACHE (asumida del Ejercicio 6)
+# -------------------------
+
+class LRU:
+    """Implementación de LRU Cache usando un diccionario y una lista doble."""
+    def __init__(self, cap: int):
+        self.cap = cap
+        self.map = {}
+        self.head = NodoKV(0, 0)
+        self.tail = NodoKV(0, 0)
+        self.head.next = self.tail
+        self.tail.prev = self.head
+
+    def _add_front(self, n: NodoKV):
+        n.prev = self.head
+        n.next = self.head.next
+        self.head.next.prev = n
+        self.head.next = n
+
+    def _remove(self, n: NodoKV):
+        n.prev.next = n.next
+        n.next.prev = n.prev
+        n.prev = n.next = None
+
+    def _move_to_front(self, n: NodoKV):
+        self._remove(n)
+        self._add_front(n)
+
+    def _evict_lru(self):
+        lru_node = self.tail.prev
+        if lru_node is self.head: return
+        self._remove(lru_node)
+        del self.map[lru_node.k]
+
+    def get(self, k, default=-1):
+        """Obtiene el valor de la clave; 'default' permite distinguir un fallo de un valor -1."""
+        n = self.map.get(k)
+        if n is None: return default
+        self._move_to_front(n)
+        return n.v
+
+    def put(self, k, v):
+        if k in self.map:
+            n = self.map[k]
+            n.v = v
+            self._move_to_front(n)
+        else:
+            n = NodoKV(k, v)
+            self.map[k] = n
+            self._add_front(n)
+            if len(self.map) > self.cap:
+                self._evict_lru()
+
+# -------------------------
+# DECORADOR DE MEMOIZACIÓN
+# -------------------------
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+_FALLO = object()       # Centinela: distingue "no está en cache" de cualquier valor
+_MARCA_KW = (object(),)  # Separa args de kwargs dentro de la llave
+
+def _hacer_llave(args, kwargs, typed):
+    """
+    Construye una llave hashable a partir de args/kwargs.
+    Con typed=True, f(3) y f(3.0) se guardan por separado.
+    """
+    llave = args
+    if kwargs:
+        llave += _MARCA_KW
+        for item in kwargs.items():
+            llave += item
+    if typed:
+        llave += tuple(type(a) for a in args)
+        if kwargs:
+            llave += tuple(type(v) for v in kwargs.values())
+    elif len(llave) == 1 and type(llave[0]) in (int, str):
+        # Caso rápido: un solo argumento simple se usa directamente como llave
+        return llave[0]
+    return llave
+
+def lru_memoize(cap: int = 128, typed: bool = False):
+    """
+    Decorador que memoiza una función pura usando la LRU del proyecto.
+    Expone cache_info() y cache_clear(), igual que functools.lru_cache.
+    """
+    if cap <= 0:
+        raise ValueError("La capacidad debe ser un número positivo.")
+
+    def decorador(func):
+        cache = LRU(cap)
+        stats = [0, 0]  # [hits, misses]
+
+        @functools.wraps(func)
+        def envoltura(*args, **kwargs):
+            llave = _hacer_llave(args, kwargs, typed)
+            resultado = cache.get(llave, _FALLO)
+            if resultado is not _FALLO:
+                stats[0] += 1
+                return resultado
+            stats[1] += 1
+            resultado = func(*args, **kwargs)
+            cache.put(llave, resultado)
+            return resultado
+
+        def cache_info():
+            return CacheInfo(stats[0], stats[1], cap, len(cache.map))
+
+        def cache_clear():
+            nonlocal cache
+            cache = LRU(cap)
+            stats[0] = stats[1] = 0
+
+        envoltura.cache_info = cache_info
+        envoltura.cache_clear = cache_clear
+        return envoltura
+
+    return decorador
+
+# -------------------------
+# DEMOSTRACIÓN
+# -------------------------
+
+if __name__ == "__main__":
+    @lru_memoize(cap=64)
+    def fib(n):
+        return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+    print("--- Memoización con la LRU del proyecto ---")
+    print(f"fib(60) = {fib(60)}")
+    print(f"cache_info(): {fib.cache_info()}")
+    fib.cache_clear()
+    print(f"Después de cache_clear(): {fib.cache_info()}")
+
+    @lru_memoize(cap=8, typed=True)
+    def doble(x):
+        return x * 2
+
+    doble(3); doble(3.0)
+    print(f"typed=True guarda 3 y 3.0 por separado: {doble.cache_info()}")
+
+    # -------------------------
+    # BENCHMARK: costo por llamada contra functools.lru_cache
+    # -------------------------
+    print("\n--- Benchmark (ns por llamada) ---")
+
+    def identidad(x, y=0):
+        return x
+
+    propia = lru_memoize(cap=1_000)(identidad)
+    estandar = functools.lru_cache(maxsize=1_000)(identidad)
+    N = 200_000
+    for nombre, llamada in (("hit, 1 arg", "f(7)"),
+                            ("hit, kwargs", "f(7, y=1)"),
+                            ("miss (ciclo de 2000 llaves)", "f(next(it))")):
+        fila = []
+        for etiqueta, f in (("lru_memoize", propia), ("functools", estandar)):
+            # Ciclar 2000 llaves con capacidad 1000 hace que cada llamada sea un fallo
+            entorno = {"f": f, "it": itertools.cycle(range(2_000))}
+            t = timeit.timeit(llamada, globals=entorno, number=N)
+            fila.append(f"{etiqueta}: {t / N * 1e9:7.0f}")
+        print(f"  {nombre:<28} " + " | ".join(fila))
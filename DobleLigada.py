@@ -1,4 +1,5 @@
 class Nodo:
+    __slots__ = ("elemento", "siguiente", "anterior")
     def __init__(self, elemento):
         self.elemento = elemento
         self.siguiente = None
@@ -1,4 +1,5 @@
 class Nodo: 
+    __slots__ = ("dato", "prev", "next") 
     def __init__(self, dato): 
         self.dato = dato 
         self.prev = None 
@@ -8,6 +9,7 @@ class ListaDoble:
     def __init__(self): 
         self.head = None 
         self.tail = None 
+        self.version = 0  # cambia con cada inserción o eliminación 
  
     def push_front(self, dato): 
         nuevo = Nodo(dato) 
@@ -17,6 +19,7 @@ class ListaDoble:
         else: 
             self.tail = nuevo  # estaba vacía 
         self.head = nuevo 
+        self.version += 1 
  
     def push_back(self, dato): 
         nuevo = Nodo(dato) 
@@ -26,6 +29,7 @@ class ListaDoble:
         else: 
             self.head = nuevo  # estaba vacía 
         self.tail = nuevo 
+        self.version += 1 
  
     def remove_node(self, nodo): 
         if nodo is None: 
@@ -39,6 +43,7 @@ class ListaDoble:
         else: 
             self.tail = nodo.prev  # borraste tail 
         nodo.prev = nodo.next = None  # desconectar (opcional) 
+        self.version += 1 
  
     def find(self, dato): 
         cur = self.head 
@@ -48,16 +53,31 @@ class ListaDoble:
             cur = cur.next 
         return None 
  
+    def iter_desde(self, nodo, reverso=False, hasta=None): 
+        # generador: datos desde 'nodo' hacia el final (o hacia el inicio con 
+        # reverso=True), hasta el nodo 'hasta' incluido; falla si la lista cambia. 
+        # La versión se toma al crear el iterador, no en el primer next() 
+        return self._recorrer(nodo, reverso, hasta, self.version) 
+ 
+    def _recorrer(self, nodo, reverso, hasta, version): 
+        if self.version != version: 
+            raise RuntimeError("La lista cambió durante el recorrido.") 
+        while nodo: 
+            yield nodo.dato 
+            if self.version != version: 
+                raise RuntimeError("La lista cambió durante el recorrido.") 
+            if nodo is hasta: 
+                return 
+            nodo = nodo.prev if reverso else nodo.next 
+ 
+    def __iter__(self): 
+        return self.iter_desde(self.head) 
+ 
+    def __reversed__(self): 
+        return self.iter_desde(self.tail, reverso=True) 
+ 
     def to_list_forward(self): 
-        cur, out = self.head, [] 
-        while cur: 
-            out.append(cur.dato) 
-            cur = cur.next 
-        return out 
+        return list(self) 
  
     def to_list_backward(self): 
-        cur, out = self.tail, [] 
-        while cur: 
-            out.append(cur.dato) 
-            cur = cur.prev 
-        return out
\ No newline at end of file
+        return list(reversed(self))
\ No newline at end of file
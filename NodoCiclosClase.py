@@ -1,6 +1,5 @@
 class Nodo():
-    dato = None
-    siguiente = None
+    __slots__ = ("dato", "siguiente")
 
     def __init__(self, dato):
         self.dato = dato
@@ -60,6 +59,7 @@ def eliminar(nodo, busqueda):
     return nodo
     
 class Mascota():
+    __slots__ = ("nombre",)
     def __init__(self, nombre) -> None:
         self.nombre = nombre
     
@@ -1,6 +1,5 @@
 class Nodo():
-    dato = None
-    siguiente = None
+    __slots__ = ("dato", "siguiente")
 
     def __init__(self, dato):
         self.dato = dato
@@ -14,8 +14,7 @@ class Nodo:
         dato (Alumno): El objeto Alumno almacenado en este nodo.
         siguiente (Nodo): Referencia al siguiente nodo en la lista, o None si es el último.
     """
-    dato = None
-    siguiente = None
+    __slots__ = ("dato", "siguiente")
 
     def __init__(self, dato):
         """
@@ -224,6 +223,7 @@ class Alumno:
         nombre (str): Nombre del alumno.
         calificacion (float or int): Calificación numérica del alumno.
     """
+    __slots__ = ("nombre", "calificacion")
     def __init__(self, nombre, calificacion):
         """
         Inicializa un nuevo alumno.